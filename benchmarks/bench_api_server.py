@@ -0,0 +1,75 @@
+"""
+Benchmark - Débit de l'API HTTP/JSON (src/interface/api_server.py)
+Clients concurrents, connexions persistantes (keep-alive) ou une connexion par requête
+"""
+
+import http.client
+import os
+import statistics
+import sys
+import threading
+import time
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.interface.api_server import create_server
+from src.utils.serialization import dumps
+from src.workflows.multi_agent_workflow import MultiAgentWorkflow
+
+REQUESTS_PER_CLIENT = 200
+CLIENT_LEVELS = (1, 4, 8, 16)
+PROMPTS = ["Liste tous les clients", "Statut des projets", "Liste des employés", "Cherche l'employé Dupont"]
+
+
+def client(port: int, keep_alive: bool, latencies: list):
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    for i in range(REQUESTS_PER_CLIENT):
+        body = dumps({"prompt": PROMPTS[i % len(PROMPTS)]}).encode("utf-8")
+        start = time.perf_counter()
+        connection.request("POST", "/v1/requests", body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+        if not keep_alive:
+            connection.close()
+            connection = http.client.HTTPConnection("127.0.0.1", port)
+    connection.close()
+
+
+def run(port: int, clients: int, keep_alive: bool):
+    latencies = []
+    threads = [threading.Thread(target=client, args=(port, keep_alive, latencies)) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    mode = "keep-alive" if keep_alive else "nouvelle connexion"
+    print(f"  {clients:>2} clients, {mode:<20} {len(latencies) / elapsed:>8,.0f} req/s"
+          f"  p50 {statistics.median(latencies):.2f}ms  p95 {latencies[int(len(latencies) * 0.95) - 1]:.2f}ms")
+
+
+def run_benchmark():
+    """Débit de POST /v1/requests selon le nombre de clients et la réutilisation des connexions"""
+    workflow = MultiAgentWorkflow(use_odoo=False)
+    workflow.process_user_request("Liste des employés")  # construction du graphe hors mesure
+    server = create_server("127.0.0.1", 0, workflow)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    print(f"\n=== Benchmark API HTTP ({REQUESTS_PER_CLIENT} requêtes par client, données JSON) ===\n")
+    try:
+        for clients in CLIENT_LEVELS:
+            for keep_alive in (True, False):
+                run(port, clients, keep_alive)
+    finally:
+        server.request_shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    run_benchmark()
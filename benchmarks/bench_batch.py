@@ -0,0 +1,85 @@
+"""
+Benchmark - Analyse par lots (InterfaceAgent.process_batch)
+Classe un corpus synthétique de 100 000 prompts, façon historique de conversations
+"""
+
+import os
+import random
+import sys
+import time
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.agents.interface_agent import InterfaceAgent
+
+NB_PROMPTS = 100_000
+
+# Actions rapides (répétées telles quelles) et gabarits à compléter
+QUICK_ACTIONS = [
+    "Liste tous les clients",
+    "Statut des projets",
+    "Liste des employés",
+    "Liste des opportunités"
+]
+TEMPLATES = [
+    "Cherche les informations sur l'employé {nom}",
+    "Ajoute un nouveau client nommé {societe}",
+    "Quel est le statut du projet P{num:03d}?",
+    "Ajoute une opportunité {societe} avec un montant de {montant} euros",
+    "Modifier le montant de l'opportunité ID {num} à {montant}",
+    "Supprime le client {num}",
+    "Sur quoi travaille {nom} ?",
+    "Donne-moi un rapport sur les congés de {nom}",
+    "Change l'email du client {num} en contact{num}@{societe}.fr"
+]
+NOMS = ["Dupont", "Martin", "Durand", "Dubois", "Moreau", "Laurent", "Simon", "Michel"]
+SOCIETES = ["TechCorp", "DataSoft", "InnoLab", "CloudNet", "WebPlus", "SmartOps"]
+
+
+def generate_corpus(n: int, seed: int = 42):
+    """Corpus synthétique : ~30 % d'actions rapides, le reste issu des gabarits"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        if rng.random() < 0.3:
+            corpus.append(rng.choice(QUICK_ACTIONS))
+        else:
+            corpus.append(rng.choice(TEMPLATES).format(
+                nom=rng.choice(NOMS), societe=rng.choice(SOCIETES),
+                num=rng.randint(1, 200), montant=rng.randint(1, 500) * 1000
+            ))
+    return corpus
+
+
+def timed(label: str, func, corpus):
+    start = time.perf_counter()
+    results = func(corpus)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<36} {elapsed:>7.2f}s  {len(corpus) / elapsed:>10,.0f} prompts/s")
+    return results
+
+
+def run_benchmark():
+    """Compare le traitement message par message et process_batch"""
+    corpus = generate_corpus(NB_PROMPTS)
+    workers = os.cpu_count() or 1
+    print(f"=== Benchmark analyse par lots ({NB_PROMPTS} prompts, {workers} CPU) ===\n")
+
+    uncached = InterfaceAgent(cache_size=0)
+    reference = timed("process_message (sans cache)", lambda c: [uncached.process_message(m) for m in c], corpus)
+
+    agent = InterfaceAgent()
+    sequential = timed("process_batch (séquentiel)", agent.process_batch, corpus)
+    assert sequential == reference
+    print(f"  cache: {agent.cache_stats()['hit_rate']:.1%} de succès\n")
+
+    if workers > 1:
+        pooled = timed(f"process_batch (workers={workers})",
+                       lambda c: InterfaceAgent().process_batch(c, workers=workers), corpus)
+        assert pooled == reference
+    else:
+        print("  (un seul CPU : pool de processus non mesuré)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,129 @@
+"""
+Benchmark - Débit de l'Agent Interface (prompts/s)
+Compare la classification par boucle de re.search et le classifieur compilé,
+et mesure l'extraction de paramètres sur des textes collés longs (pire cas)
+"""
+
+import os
+import re
+import sys
+import time
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.agents.interface_agent import InterfaceAgent, PRIORITY_INTENTS, OPPORTUNITE_PATTERN
+
+PROMPTS = [
+    "Montre-moi la liste de tous les clients",
+    "Cherche les informations sur l'employé Jean Dupont",
+    "Quel est le statut du projet P001?",
+    "Ajoute un nouveau client nommé TechCorp",
+    "Donne-moi un rapport sur les congés des employés",
+    "Liste des opportunités",
+    "Affiche les deals en cours",
+    "Supprime le client 17",
+    "changer le nom de l'opportunité ID 5 en Nouveau Projet Alpha",
+    "sur quoi travaille Dubois",
+    "où en est le sprint 3",
+    "bonjour"
+]
+
+ITERATIONS = 2_000
+
+# Contrôle d'équivalence seulement : séquences « A.*B » réparties sur plusieurs lignes
+MULTILINE_PROMPTS = [
+    "liste les employés\nstatut client",
+    "statut\ndu projet P001",
+    "changer le nom\nde l'opportunité ID 5 en Alpha",
+    "liste les employés\nstatut du client\nsupprime le projet"
+]
+
+# Entrées pathologiques pour les anciens patterns à retour arrière (n répétitions)
+WORST_CASES = {
+    "chaîne nom ... en": lambda n: "changer le nom en " * n + "!",
+    "opportunité nom ... en": lambda n: "modifier opportunité nom en " * n + "!",
+    "espaces avant devise": lambda n: "montant" + " " * (n * 18) + "x",
+    "chiffres sans devise": lambda n: "1 " * (n * 9) + "x",
+    "nom sans fin": lambda n: "client " + "abc " * (n * 4) + "!",
+    "email sans domaine": lambda n: "mail " + "a" * (n * 20) + "@" + "b." * (n * 10),
+    "id puis espaces": lambda n: "id" + " " * (n * 18) + "x",
+    "pourcentage": lambda n: "9" * (n * 18) + "x%"
+}
+WORST_SIZES = (1_000, 4_000)
+
+
+def legacy_classify(agent: InterfaceAgent, prompt: str):
+    """Classification d'origine : un re.search par pattern"""
+    intent = "lister"
+    for candidate in PRIORITY_INTENTS:
+        if any(re.search(p, prompt) for p in agent.intent_patterns.get(candidate, [])):
+            intent = candidate
+            break
+    system = "CRM"
+    for candidate, patterns in agent.system_patterns.items():
+        if any(re.search(p, prompt) for p in patterns):
+            system = candidate
+            break
+    return intent, system, bool(re.search(OPPORTUNITE_PATTERN, prompt))
+
+
+def throughput(label: str, func, prompts):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for prompt in prompts:
+            func(prompt)
+    elapsed = time.perf_counter() - start
+    rate = ITERATIONS * len(prompts) / elapsed
+    print(f"  {label:<28} {rate:>12,.0f} prompts/s")
+    return rate
+
+
+def worst_case(agent: InterfaceAgent):
+    """Temps d'extraction sur des textes longs : doit croître linéairement avec la taille"""
+    print(f"{'Entrée':<26}" + "".join(f"{f'x{size}':>14}" for size in WORST_SIZES))
+    for label, build in WORST_CASES.items():
+        timings = []
+        for size in WORST_SIZES:
+            prompt = build(size)
+            start = time.perf_counter()
+            agent._extract_parameters(prompt, "lister", "CRM")
+            timings.append(f"{(time.perf_counter() - start) * 1000:.1f}ms/{len(prompt) // 1000}Ko")
+        print(f"  {label:<24}" + "".join(f"{t:>14}" for t in timings))
+
+
+def run_benchmark():
+    """Mesure le débit de classification et d'analyse complète"""
+    agent = InterfaceAgent()
+    prompts = [p.lower() for p in PROMPTS]
+
+    for prompt in prompts + MULTILINE_PROMPTS:
+        assert legacy_classify(agent, prompt) == agent.classifier.classify(prompt), prompt
+
+    print(f"=== Benchmark Agent Interface ({len(PROMPTS)} prompts x {ITERATIONS}) ===\n")
+    print("Classification (intention + système + opportunité)")
+    legacy = throughput("boucle re.search", lambda p: legacy_classify(agent, p), prompts)
+    compiled = throughput("classifieur compilé", agent.classifier.classify, prompts)
+    print(f"  accélération: x{compiled / legacy:.1f}\n")
+
+    print("Analyse complète (analyze_prompt)")
+    throughput("sans cache", agent._analyze, PROMPTS)
+    throughput("cache LRU (prompts répétés)", agent.analyze_prompt, PROMPTS)
+    print(f"  taux de succès du cache: {agent.cache_stats()['hit_rate']:.1%}")
+    print()
+
+    if agent.fallback_classifier is not None:
+        print("Repli TF-IDF (prompts non reconnus par les règles)")
+        classifier = agent.fallback_classifier
+        single = throughput("predict (un prompt)", classifier.predict, PROMPTS)
+        start = time.perf_counter()
+        classifier.predict_batch(PROMPTS * 500)
+        batch = len(PROMPTS) * 500 / (time.perf_counter() - start)
+        print(f"  {'predict_batch (lot)':<28} {batch:>12,.0f} prompts/s")
+        print(f"  coût par prompt: {1000 / single:.3f}ms (unitaire), {1000 / batch:.3f}ms (lot)\n")
+
+    print("Extraction de paramètres - pire cas (texte collé long)")
+    worst_case(agent)
+
+
+if __name__ == "__main__":
+    run_benchmark()
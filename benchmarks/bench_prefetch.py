@@ -0,0 +1,64 @@
+"""
+Benchmark - Premier clic sur une action rapide avec et sans préchargement (ResponsePrefetcher)
+Latence vue par l'interface : traitement complet par le workflow ou réponse préchargée (mode JSON)
+"""
+
+import os
+import statistics
+import sys
+import time
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.interface.ui_core import QUICK_ACTIONS
+from src.workflows.multi_agent_workflow import MultiAgentWorkflow
+from src.workflows.prefetch import ResponsePrefetcher
+
+# Latence simulée sur chaque exécution (appel Odoo distant)
+SIMULATED_RPC_MS = 200
+# Délai entre l'ouverture de la session et le premier clic
+THINK_TIME_S = 1.0
+
+
+def with_latency(execute, delay: float):
+    def run(instruction):
+        time.sleep(delay)
+        return execute(instruction)
+    return run
+
+
+def _ms(latencies):
+    return f"moyenne {statistics.mean(latencies) * 1000:>7.1f}ms  max {max(latencies) * 1000:>7.1f}ms"
+
+
+def run_benchmark():
+    """Latence du premier clic sur chaque action rapide, sans puis avec préchargement"""
+    workflow = MultiAgentWorkflow(use_odoo=False)
+    workflow.process_user_request("Liste des employés")  # construction du graphe hors mesure
+    agent = workflow.systems_agent
+    agent.execute_instruction = with_latency(agent.execute_instruction, SIMULATED_RPC_MS / 1000)
+
+    print(f"\n=== Premier clic sur les actions rapides (latence système simulée : {SIMULATED_RPC_MS}ms) ===\n")
+    direct = []
+    for prompt in QUICK_ACTIONS:
+        start = time.perf_counter()
+        workflow.process_user_request(prompt)
+        direct.append(time.perf_counter() - start)
+    print(f"  sans préchargement   {_ms(direct)}")
+
+    prefetcher = ResponsePrefetcher(workflow)
+    prefetcher.prefetch(QUICK_ACTIONS)  # ouverture de la session
+    time.sleep(THINK_TIME_S)
+    served = []
+    for prompt in QUICK_ACTIONS:
+        start = time.perf_counter()
+        response = prefetcher.take(prompt)
+        served.append(time.perf_counter() - start)
+        if response is None:
+            raise RuntimeError(f"Réponse non préchargée : {prompt}")
+    print(f"  avec préchargement   {_ms(served)}")
+    prefetcher.shutdown()
+
+
+if __name__ == "__main__":
+    run_benchmark()
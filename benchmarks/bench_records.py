@@ -0,0 +1,76 @@
+"""
+Benchmark - Mémoire des enregistrements : dicts JSON vs enregistrements compacts (__slots__)
+Mesure l'empreinte pour 100 000 employés, projets et tâches
+"""
+
+import json
+import os
+import sys
+import tracemalloc
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.storage.records import Employe, Projet, Tache
+
+NB_RECORDS = 100_000
+
+
+def generate_json(kind: str, n: int) -> str:
+    """Génère un tableau JSON synthétique au format des fichiers de data/"""
+    departements = ["IT", "RH", "Finance", "Commercial", "Support"]
+    statuts = ["En cours", "Planifié", "Terminé"]
+    priorites = ["Haute", "Moyenne", "Basse", "Critique"]
+
+    if kind == "employes":
+        records = [{
+            "id": f"E{i:06d}", "nom": f"Nom{i}", "prenom": f"Prénom{i}",
+            "email": f"employe{i}@entreprise.fr", "poste": "Développeur",
+            "departement": departements[i % 5], "manager": f"E{i // 10:06d}",
+            "date_embauche": "2020-03-15", "salaire": 40000 + i % 30000,
+            "statut": "Actif", "competences": ["Python", "SQL", "Docker"]
+        } for i in range(n)]
+    elif kind == "projets":
+        records = [{
+            "id": f"P{i:06d}", "nom": f"Projet {i}", "description": f"Description du projet {i}",
+            "chef_projet": f"E{i % 500:06d}", "client_id": f"C{i % 200:03d}",
+            "statut": statuts[i % 3], "priorite": priorites[i % 4], "budget": 100000,
+            "budget_consomme": i % 100000, "date_debut": "2025-06-01",
+            "date_fin_prevue": "2025-10-31", "progression": i % 101,
+            "equipe": [f"E{(i + k) % 500:06d}" for k in range(3)]
+        } for i in range(n)]
+    else:
+        records = [{
+            "id": f"T{i:06d}", "projet_id": f"P{i // 10:06d}", "titre": f"Tâche {i}",
+            "description": f"Description de la tâche {i}", "assignee": f"E{i % 500:06d}",
+            "statut": statuts[i % 3], "priorite": priorites[i % 4], "estimation": 40,
+            "temps_passe": i % 40, "date_creation": "2025-06-01",
+            "date_echeance": "2025-06-15", "date_completion": None
+        } for i in range(n)]
+    return json.dumps(records, ensure_ascii=False)
+
+
+def measure(build) -> int:
+    """Octets alloués par la structure construite (conservée jusqu'à la mesure)"""
+    tracemalloc.start()
+    data = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current
+
+
+def run_benchmark():
+    """Compare la mémoire par 100k enregistrements avant/après compaction"""
+    print(f"=== Benchmark mémoire des enregistrements ({NB_RECORDS} par type) ===\n")
+    print(f"{'Type':<10} {'dicts':>10} {'compacts':>10} {'gain':>8}")
+
+    for kind, record_type in (("employes", Employe), ("projets", Projet), ("taches", Tache)):
+        raw = generate_json(kind, NB_RECORDS)
+        as_dicts = measure(lambda: json.loads(raw))
+        as_records = measure(lambda: [record_type(r) for r in json.loads(raw)])
+        print(f"{kind:<10} {as_dicts / 1024 / 1024:>8.1f}Mo {as_records / 1024 / 1024:>8.1f}Mo "
+              f"{(1 - as_records / as_dicts) * 100:>7.1f}%")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,107 @@
+"""
+Benchmark - Parsing JSON des fichiers de données selon leur taille
+Compare json (stdlib), le backend rapide et le parsing en flux (temps + pic mémoire)
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.utils.serialization import JSON_BACKEND, loads, dumps, load_file_streaming
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def generate_hr_file(path: str, nb_employes: int):
+    """Génère un fichier RH synthétique au format de data/hr_data.json"""
+    departements = ["IT", "RH", "Finance", "Commercial", "Support"]
+    data = {
+        "employes": [
+            {
+                "id": f"E{i:06d}",
+                "nom": f"Nom{i}",
+                "prenom": f"Prénom{i}",
+                "email": f"employe{i}@entreprise.fr",
+                "poste": "Développeur",
+                "departement": departements[i % len(departements)],
+                "manager": f"E{i // 10:06d}",
+                "date_embauche": "2020-03-15",
+                "salaire": 40000 + i % 30000,
+                "statut": "Actif",
+                "competences": ["Python", "SQL"]
+            }
+            for i in range(nb_employes)
+        ],
+        "conges": [],
+        "evaluations": []
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def measure(label: str, func, path: str):
+    """Mesure le temps et le pic mémoire d'un chargement"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = func(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<22} {elapsed * 1000:>9.1f} ms   pic {peak / 1024 / 1024:>8.1f} Mo")
+    return data
+
+
+def load_stdlib(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_fast(path: str):
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def check_chunk_boundaries(tmp: str):
+    """Parsing en flux avec une coupure de bloc à chaque position (nombres coupés dans "12.5", "1.5e3"...)"""
+    document = '{"valeurs": [12.5, 1.5e3, -7, 0.25E-2, 100, 3e+2], "total": 12.5, "ok": true}'
+    path = os.path.join(tmp, "nombres.json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(document)
+    reference = json.loads(document)
+    for chunk_size in range(1, len(document) + 1):
+        assert load_file_streaming(path, chunk_size) == reference, chunk_size
+    print("Coupures de blocs : parsing en flux identique pour toutes les tailles de bloc")
+
+
+def run_benchmark():
+    """Exécute le benchmark sur plusieurs tailles de fichiers"""
+    print(f"=== Benchmark sérialisation JSON (backend: {JSON_BACKEND}) ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        check_chunk_boundaries(tmp)
+        for size in SIZES:
+            path = os.path.join(tmp, f"hr_{size}.json")
+            generate_hr_file(path, size)
+            print(f"\n{size} employés ({os.path.getsize(path) / 1024 / 1024:.1f} Mo)")
+
+            reference = measure("json.load (stdlib)", load_stdlib, path)
+            assert measure(f"loads ({JSON_BACKEND})", load_fast, path) == reference
+            assert measure("streaming", load_file_streaming, path) == reference
+
+            start = time.perf_counter()
+            json.dumps(reference, indent=2, ensure_ascii=False)
+            stdlib_dump = time.perf_counter() - start
+            start = time.perf_counter()
+            dumps(reference, indent=True)
+            fast_dump = time.perf_counter() - start
+            print(f"  dumps indent stdlib   {stdlib_dump * 1000:>9.1f} ms")
+            print(f"  dumps indent {JSON_BACKEND:<8} {fast_dump * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,85 @@
+"""
+Benchmark - Temps de démarrage à froid (imports, construction, première requête)
+Chaque mesure est faite dans un nouveau processus Python (python -X importtime)
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+RUNS = 5
+TOP_IMPORTS = 8
+
+MODULES = [
+    "src.agents.interface_agent",
+    "src.agents.systems_agent",
+    "src.workflows.multi_agent_workflow"
+]
+
+# Construction du workflow puis première requête, chronométrées dans le processus enfant
+FIRST_REQUEST = """
+import time
+start = time.perf_counter()
+from src.workflows.multi_agent_workflow import MultiAgentWorkflow
+imported = time.perf_counter()
+workflow = MultiAgentWorkflow(use_odoo=False)
+built = time.perf_counter()
+workflow.process_user_request("Liste tous les clients")
+done = time.perf_counter()
+print(f"@@ {imported - start} {built - imported} {done - built}")
+"""
+
+
+def import_times(module: str):
+    """Lance un processus qui importe le module ; renvoie {module: cumul en µs}"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def first_request():
+    """Temps (s) d'import, de construction et de première requête du workflow"""
+    completed = subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    line = next(l for l in completed.stdout.splitlines() if l.startswith("@@ "))
+    return [float(value) for value in line.split()[1:]]
+
+
+def run_benchmark():
+    """Mesure le coût d'import des modules principaux et la première requête"""
+    print(f"=== Benchmark démarrage à froid (médiane sur {RUNS} processus) ===\n")
+
+    print("Import (cumulé)")
+    heaviest = {}
+    for module in MODULES:
+        runs = [import_times(module) for _ in range(RUNS)]
+        median = statistics.median(run[module] for run in runs)
+        print(f"  {module:<40} {median / 1000:>8.1f}ms")
+        if module == MODULES[-1]:
+            heaviest = {name: statistics.median(run.get(name, 0) for run in runs) for name in runs[0]}
+
+    print(f"\nImports les plus lourds ({MODULES[-1]})")
+    top_level = {name: value for name, value in heaviest.items() if name != MODULES[-1]}
+    for name, value in sorted(top_level.items(), key=lambda item: -item[1])[:TOP_IMPORTS]:
+        print(f"  {name:<40} {value / 1000:>8.1f}ms")
+
+    print("\nWorkflow (import, construction, première requête)")
+    timings = [first_request() for _ in range(RUNS)]
+    for label, values in zip(("import", "construction", "première requête"), zip(*timings)):
+        print(f"  {label:<40} {statistics.median(values) * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,56 @@
+"""
+Benchmark - Latence de bout en bout d'un message dans les interfaces de chat Streamlit
+Interactions scriptées avec streamlit.testing (AppTest) : saisie, traitement, réaffichage
+"""
+
+import os
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+APPS = ["app_connectis", "app_modern"]
+MESSAGES = [
+    "Liste tous les clients",
+    "Statut des projets",
+    "Liste des employés",
+    "Cherche l'employé Dupont",
+    "Liste les clients et le statut des projets"
+]
+ROUNDS = 4
+TIMEOUT_S = 60
+
+
+def run_app(app: str):
+    """Premier rendu, puis chaque message saisi ; renvoie (premier rendu, latences par message) en secondes"""
+    at = AppTest.from_file(os.path.join(ROOT, "src", "interface", f"{app}.py"), default_timeout=TIMEOUT_S)
+    start = time.perf_counter()
+    at.run()
+    first_render = time.perf_counter() - start
+
+    latencies = []
+    for message in MESSAGES * ROUNDS:
+        at.text_input(key="user_input").input(message)
+        start = time.perf_counter()
+        at.run()  # callback de saisie, traitement en flux, réexécution du script
+        latencies.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(f"{app}: {at.exception[0].message}")
+    return first_render, latencies
+
+
+def run_benchmark():
+    """Latence par message (p50, p95, max) de chaque interface de chat"""
+    print(f"\n=== Latence de bout en bout par message ({len(MESSAGES) * ROUNDS} messages par interface) ===\n")
+    for app in APPS:
+        first_render, latencies = run_app(app)
+        latencies.sort()
+        p95 = latencies[max(0, round(0.95 * len(latencies)) - 1)]
+        print(f"  {app:<16} premier rendu {first_render * 1000:>8.1f}ms   "
+              f"message p50 {statistics.median(latencies) * 1000:>7.1f}ms  "
+              f"p95 {p95 * 1000:>7.1f}ms  max {latencies[-1] * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    run_benchmark()
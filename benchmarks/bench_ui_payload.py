@@ -0,0 +1,43 @@
+"""
+Benchmark - Volume envoyé au navigateur à chaque réexécution des interfaces Streamlit
+Somme des messages (éléments, feuilles de style) produits par une réexécution sans interaction
+"""
+
+import os
+
+from streamlit.runtime.scriptrunner_utils import script_run_context
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+APPS = ["app", "app_fixed", "app_backup", "app_connectis", "app_modern"]
+TIMEOUT_S = 60
+
+_sent = {"bytes": 0, "messages": 0}
+_enqueue = script_run_context.ScriptRunContext.enqueue
+
+
+def _counting_enqueue(self, msg):
+    _sent["bytes"] += msg.ByteSize()
+    _sent["messages"] += 1
+    return _enqueue(self, msg)
+
+
+def run_benchmark():
+    """Octets et messages par réexécution de chaque interface (après le premier rendu)"""
+    script_run_context.ScriptRunContext.enqueue = _counting_enqueue
+    print("\n=== Volume par réexécution ===\n")
+    try:
+        for app in APPS:
+            at = AppTest.from_file(os.path.join(ROOT, "src", "interface", f"{app}.py"), default_timeout=TIMEOUT_S)
+            at.run()
+            _sent.update(bytes=0, messages=0)
+            at.run()
+            if at.exception:
+                raise RuntimeError(f"{app}: {at.exception[0].message}")
+            print(f"  {app:<16} {_sent['bytes']:>8} octets   {_sent['messages']:>4} messages")
+    finally:
+        script_run_context.ScriptRunContext.enqueue = _enqueue
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,85 @@
+"""
+Benchmark - Traitement par lots du workflow complet (MultiAgentWorkflow.process_batch)
+Débit et latence par étape d'un rejeu de demandes en lecture seule (mode JSON)
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.workflows.multi_agent_workflow import MultiAgentWorkflow
+
+NB_PROMPTS = 2_000
+CONCURRENCY_LEVELS = (1, 4, 8, 16)
+
+# Second passage : latence réseau simulée sur chaque exécution (appel Odoo distant)
+SIMULATED_RPC_MS = 20
+NB_PROMPTS_RPC = 200
+
+# Demandes en lecture seule : le rejeu ne modifie pas les données
+READ_PROMPTS = [
+    "Liste tous les clients",
+    "Statut des projets",
+    "Liste des employés",
+    "Liste des opportunités",
+    "Cherche l'employé {nom}",
+    "Quel est le statut du projet P00{num}?",
+    "Sur quoi travaille {nom} ?",
+    "Donne-moi un rapport sur les congés",
+    "Liste les clients et le statut des projets"
+]
+NOMS = ["Dupont", "Martin", "Durand", "Dubois", "Moreau", "Laurent"]
+
+
+def generate_corpus(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    return [rng.choice(READ_PROMPTS).format(nom=rng.choice(NOMS), num=rng.randint(1, 3)) for _ in range(n)]
+
+
+def report(label: str, stats):
+    stages = "  ".join(f"{stage} p50 {s['p50_ms']:.2f} / p95 {s['p95_ms']:.2f}ms"
+                       for stage, s in stats["stages"].items())
+    print(f"  {label:<28} {stats['throughput_rps']:>8,.0f} req/s  ({stats['succeeded']}/{stats['count']})")
+    print(f"    {stages}")
+
+
+def compare(workflow: MultiAgentWorkflow, corpus):
+    start = time.perf_counter()
+    for prompt in corpus:
+        workflow.process_user_request(prompt)
+    print(f"  {'process_user_request (boucle)':<28} {len(corpus) / (time.perf_counter() - start):>8,.0f} req/s")
+
+    for concurrency in CONCURRENCY_LEVELS:
+        report(f"process_batch (x{concurrency})", workflow.process_batch(corpus, concurrency)["stats"])
+    for concurrency in CONCURRENCY_LEVELS[1:]:
+        report(f"aprocess_batch (x{concurrency})",
+               asyncio.run(workflow.aprocess_batch(corpus, concurrency))["stats"])
+
+
+def with_latency(execute, delay: float):
+    def run(instruction):
+        time.sleep(delay)
+        return execute(instruction)
+    return run
+
+
+def run_benchmark():
+    """Compare les appels un par un et process_batch / aprocess_batch"""
+    workflow = MultiAgentWorkflow(use_odoo=False)
+    workflow.process_user_request("Liste des employés")  # construction du graphe hors mesure
+
+    print(f"\n=== Benchmark workflow par lots ({NB_PROMPTS} demandes, données JSON) ===\n")
+    compare(workflow, generate_corpus(NB_PROMPTS))
+
+    print(f"\n=== Latence système simulée : {SIMULATED_RPC_MS}ms ({NB_PROMPTS_RPC} demandes) ===\n")
+    agent = workflow.systems_agent
+    agent.execute_instruction = with_latency(agent.execute_instruction, SIMULATED_RPC_MS / 1000)
+    compare(workflow, generate_corpus(NB_PROMPTS_RPC))
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -32,10 +32,122 @@ SYSTEMS_CONFIG = {
     },
     "RH": {
         "data_file": DATA_DIR / "hr_data.json", 
-        "operations": ["lister_employes", "rechercher_employe", "gerer_conges", "evaluations"]
+        "journal_file": DATA_DIR / "journal" / "hr.journal",
+        "snapshot_file": DATA_DIR / "journal" / "hr_snapshot.json",
+        "operations": ["lister_employes", "rechercher_employe", "gerer_conges", "evaluations",
+                       "ajouter_employe", "modifier_employe", "supprimer_employe"]
     },
     "PROJETS": {
         "data_file": DATA_DIR / "projects_data.json",
-        "operations": ["lister_projets", "statut_projet", "gerer_taches", "rapports"]
+        "journal_file": DATA_DIR / "journal" / "projects.journal",
+        "snapshot_file": DATA_DIR / "journal" / "projects_snapshot.json",
+        "operations": ["lister_projets", "statut_projet", "gerer_taches", "rapports",
+                       "creer_projet", "modifier_projet", "supprimer_projet"]
     }
 }
+
+# Rechargement à chaud des fichiers de données JSON
+DATA_RELOAD_CONFIG = {
+    "enabled": True,
+    "poll_interval": 2.0  # Secondes entre deux vérifications des fichiers
+}
+
+# Cache des analyses de prompts (InterfaceAgent)
+PROMPT_CACHE_CONFIG = {
+    "enabled": True,
+    "max_entries": 512,  # Prompts normalisés conservés (LRU)
+    "max_variants": 4    # Variantes exactes (casse, accents, espaces) par prompt normalisé
+}
+
+# Classifieur TF-IDF de repli quand aucune règle ne reconnaît l'intention ou le système
+FALLBACK_CLASSIFIER_CONFIG = {
+    "enabled": True,
+    "examples_file": DATA_DIR / "intent_examples.json",  # Prompts étiquetés (intention, système)
+    "ngram_range": (3, 5),                               # N-grammes de caractères
+    "min_confidence": {"intent": 0.4, "system": 0.5}     # En dessous, valeur par défaut conservée
+}
+
+# Analyse de prompts par lots (InterfaceAgent.process_batch)
+BATCH_CONFIG = {
+    "process_pool_min_batch": 5000,  # En dessous, traitement séquentiel dans le processus courant
+    "chunk_size": 2000,              # Prompts envoyés à un worker par tâche
+    "workflow_max_concurrency": 8    # Demandes simultanées dans MultiAgentWorkflow.process_batch
+}
+
+# Prompts composés (« liste les clients et le statut des projets ») : une instruction par demande
+MULTI_INTENT_CONFIG = {
+    "enabled": True,
+    "max_instructions": 4,  # Au-delà, les segments suivants sont rattachés à la dernière demande
+    "max_workers": 4        # Threads d'exécution des instructions indépendantes
+}
+
+# Exécution asynchrone du workflow (aprocess_user_request)
+ASYNC_CONFIG = {
+    "systems_workers": 16  # Threads exécutant les appels bloquants de l'Agent Systèmes (Odoo, disque)
+}
+
+# Réponses en flux (stream_user_request) : les données sont envoyées à l'interface par pages
+STREAM_CONFIG = {
+    "page_size": 25  # Lignes par événement "page"
+}
+
+# Tableaux de résultats : pagination côté Agent Systèmes, seule la page visible est lue et rendue
+DATA_TABLE_CONFIG = {
+    "page_size": 25  # Lignes par page
+}
+
+# Historique des conversations : borné en mémoire, archivé sur disque, affiché par fenêtre
+CHAT_HISTORY_CONFIG = {
+    "max_messages": 100,                     # Messages gardés en mémoire par session
+    "window": 20,                            # Messages affichés à chaque rendu
+    "load_more_step": 20,                    # Messages ajoutés par « afficher plus »
+    "history_dir": DATA_DIR / "chat_history",  # Archives <session>.jsonl
+    "archive_ttl": 24 * 3600                  # Secondes sans écriture après lesquelles une archive est supprimée
+}
+
+# Préchargement des actions rapides : réponses calculées en arrière-plan à l'ouverture d'une session
+PREFETCH_CONFIG = {
+    "enabled": True,
+    "workers": 2,          # Threads de fond traitant les demandes préchargées
+    "ttl": 60.0,           # Secondes pendant lesquelles une réponse préchargée peut être servie
+    "wait_timeout": 10.0   # Attente maximale d'un préchargement en cours avant traitement normal
+}
+
+# Tableau de bord : indicateurs calculés en arrière-plan par l'Agent Systèmes (jamais à l'affichage)
+DASHBOARD_CONFIG = {
+    "enabled": True,
+    "refresh_interval": 60.0,  # Secondes entre deux calculs du snapshot
+    "max_rows": 10             # Lignes détaillées gardées par liste (projets, tâches en retard)
+}
+
+# Télémétrie : spans de latence (nœuds, opérations, appels Odoo) et percentiles glissants
+TELEMETRY_CONFIG = {
+    "enabled": True,
+    "window": 1024  # Dernières durées conservées par opération (p50/p95/p99)
+}
+
+# Métriques au format Prometheus (GET /metrics), serveur démarré par les interfaces
+METRICS_CONFIG = {
+    "enabled": True,
+    "host": "127.0.0.1",
+    "port": 9464
+}
+
+# Serveur HTTP/JSON sans interface (src/interface/api_server.py)
+API_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 8080,
+    "workers": 8,               # Threads exécutant les demandes (workflow, instructions)
+    "max_pending": 64,          # Demandes en attente d'un worker au-delà desquelles on répond 503
+    "request_timeout": 30.0,    # Secondes avant de répondre 504 à une demande trop longue
+    "keepalive_timeout": 5.0,   # Secondes d'inactivité avant fermeture d'une connexion persistante
+    "max_body_bytes": 64 * 1024,
+    "backlog": 128              # File d'attente des connexions TCP non encore acceptées
+}
+
+# Journal des écritures RH/Projets
+JOURNAL_CONFIG = {
+    "fsync_batch": 16,           # Entrées entre deux fsync
+    "fsync_interval": 1.0,       # Secondes maximum entre deux fsync
+    "compaction_threshold": 500  # Entrées avant réécriture du snapshot JSON
+}
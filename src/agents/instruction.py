@@ -0,0 +1,16 @@
+"""
+Instruction structurée - Modèle Pydantic produit par l'Agent Interface
+Module séparé pour que Pydantic ne soit importé qu'à la première analyse
+"""
+
+from typing import Dict, Any
+from pydantic import BaseModel, Field
+
+
+class UserInstruction(BaseModel):
+    """Modèle Pydantic pour les instructions utilisateur structurées"""
+    action: str = Field(description="Action à effectuer")
+    system: str = Field(description="Système cible (CRM, RH, PROJETS)")
+    operation: str = Field(description="Opération spécifique à effectuer")
+    parameters: Dict[str, Any] = Field(default_factory=dict, description="Paramètres de l'opération")
+    intent: str = Field(description="Intention détectée de l'utilisateur")
@@ -2,20 +2,524 @@
 Agent Interface - Convertit les prompts utilisateurs en instructions JSON structurées
 """
 
-import json
+import os
 import re
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
-from langchain.schema import BaseMessage, HumanMessage, AIMessage
+import sys
+import threading
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 
+# Ajouter le répertoire parent au path pour les imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config import PROMPT_CACHE_CONFIG, BATCH_CONFIG, FALLBACK_CLASSIFIER_CONFIG, MULTI_INTENT_CONFIG
+from src.utils.serialization import dumps
+from src.utils.prompt_cache import PromptCache
+from src.utils.telemetry import increment
+from src.utils.metrics import PROMPT_CACHE
+from src.utils.text_classifier import TfidfClassifier, NUMPY_AVAILABLE
 
-class UserInstruction(BaseModel):
-    """Modèle Pydantic pour les instructions utilisateur structurées"""
-    action: str = Field(description="Action à effectuer")
-    system: str = Field(description="Système cible (CRM, RH, PROJETS)")
-    operation: str = Field(description="Opération spécifique à effectuer")
-    parameters: Dict[str, Any] = Field(default_factory=dict, description="Paramètres de l'opération")
-    intent: str = Field(description="Intention détectée de l'utilisateur")
+# Pydantic (UserInstruction) n'est importé qu'à la première analyse
+if TYPE_CHECKING:
+    from src.agents.instruction import UserInstruction
+
+
+def __getattr__(name: str):
+    # Compatibilité : « from src.agents.interface_agent import UserInstruction »
+    if name == "UserInstruction":
+        from src.agents.instruction import UserInstruction
+        return UserInstruction
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Ordre prioritaire des intentions : modifier et supprimer d'abord car plus spécifiques
+PRIORITY_INTENTS = ["modifier", "supprimer", "activite", "rechercher", "ajouter", "lister", "statut", "rapport"]
+
+# Mots-clés déclenchant les opérations sur les opportunités (CRM)
+OPPORTUNITE_PATTERN = r"opportunités?|deals?|affaires?"
+
+# Séparateurs entre les demandes d'un prompt composé (« et », « puis », « ainsi que », « ; », « , »)
+COMPOUND_SEPARATOR = re.compile(r"(?:\s*[;,])?\s+(?:et|puis|ainsi que)\s+|\s*[;,]\s+", re.IGNORECASE)
+
+
+def keyword_trie_regex(keywords) -> str:
+    """Compile des mots-clés littéraux en expression de trie (correspondance la plus longue)"""
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+    
+    return build(trie)
+
+
+class PromptClassifier:
+    """
+    Classifieur compilé : intention, système et cas « opportunité » en un seul parcours
+
+    Les patterns sont des alternatives de mots-clés littéraux : ils sont développés
+    en un ensemble fini de mots-clés, rangés dans un trie compilé en une seule
+    expression. Le parcours du prompt (un finditer en lookahead) donne, à chaque
+    position, le plus long mot-clé qui y commence ; tous les mots-clés plus courts
+    au même endroit en sont des préfixes, précalculés. Les correspondances qui se
+    chevauchent (ex: « rh » dans « cherche ») sont donc toutes vues, exactement
+    comme avec un re.search par pattern. Un pattern « A.*B » est découpé en parties
+    dont l'ordre n'est vérifié (second parcours) que si toutes ont été vues ; une
+    partie non développable est recherchée avec sa propre expression compilée.
+    """
+
+    MAX_KEYWORDS = 1000
+
+    def __init__(self, intent_patterns: Dict[str, List[str]], system_patterns: Dict[str, List[str]],
+                 priority_intents: List[str], opportunite_pattern: str = OPPORTUNITE_PATTERN):
+        self.intent_order = [i for i in priority_intents if i in intent_patterns]
+        self.system_order = list(system_patterns)
+        
+        # (catégorie, clé) -> liste de patterns, chaque pattern = liste de groupes (parties)
+        self.rules: Dict[Tuple[str, str], List[List[str]]] = {}
+        keyword_groups: Dict[str, List[str]] = {}
+        self.fallbacks: List[Tuple[str, Any]] = []
+        
+        categories = [("intent", k, v) for k, v in intent_patterns.items()] + \
+                     [("system", k, v) for k, v in system_patterns.items()] + \
+                     [("opportunite", "opportunite", [opportunite_pattern])]
+        
+        group_count = 0
+        for category, key, patterns in categories:
+            rule = []
+            simple_group = None
+            for pattern in patterns:
+                parts = pattern.split(".*")
+                if len(parts) == 1 and simple_group is not None:
+                    # Les patterns simples d'une même clé partagent un groupe
+                    names = [simple_group]
+                else:
+                    names = [f"g{group_count + i}" for i in range(len(parts))]
+                    group_count += len(parts)
+                    rule.append(names)
+                    if len(parts) == 1:
+                        simple_group = names[0]
+                for name, part in zip(names, parts):
+                    keywords = self._expand(part)
+                    if keywords is None:
+                        self.fallbacks.append((name, re.compile(f"(?=({part}))")))
+                        continue
+                    for keyword in keywords:
+                        keyword_groups.setdefault(keyword, []).append(name)
+            self.rules[(category, key)] = rule
+        
+        # Seuls les groupes des patterns « A.*B » ont besoin des positions
+        ordered = {name for rule in self.rules.values() for parts in rule if len(parts) > 1 for name in parts}
+        # Mot-clé le plus long -> groupes de tous ses préfixes qui sont des mots-clés
+        self.hits: Dict[str, Tuple[str, ...]] = {}
+        self.ordered_hits: Dict[str, List[Tuple[str, int]]] = {}
+        for keyword in keyword_groups:
+            prefixes = [(name, size) for size in range(1, len(keyword) + 1)
+                        for name in keyword_groups.get(keyword[:size], [])]
+            self.hits[keyword] = tuple(dict.fromkeys(name for name, _ in prefixes))
+            self.ordered_hits[keyword] = [(name, size) for name, size in prefixes if name in ordered]
+        self.regex = re.compile(f"(?=({keyword_trie_regex(keyword_groups)}))") if keyword_groups else None
+        
+        # Règles par clé : groupes simples (un seul suffit) et séquences ordonnées
+        self.compiled_rules: Dict[Tuple[str, str], Tuple[frozenset, List[List[str]]]] = {
+            rule_key: (frozenset(parts[0] for parts in rule if len(parts) == 1),
+                       [parts for parts in rule if len(parts) > 1])
+            for rule_key, rule in self.rules.items()
+        }
+        self.intent_rules = [(i, self.compiled_rules[("intent", i)]) for i in self.intent_order]
+        self.system_rules = [(s, self.compiled_rules[("system", s)]) for s in self.system_order]
+
+    @classmethod
+    def _expand(cls, pattern: str) -> Optional[List[str]]:
+        """
+        Développe un pattern en liste de mots-clés littéraux
+        
+        Syntaxe prise en charge : caractères littéraux, groupes (?:a|b) imbriqués et
+        quantificateur « ? ». Renvoie None pour toute autre construction, pour un
+        pattern pouvant correspondre à la chaîne vide ou trop de mots-clés.
+        """
+        special = set("\\.[]{}*+^$()|?")
+        position = 0
+        
+        def alternation() -> set:
+            nonlocal position
+            result = sequence()
+            while position < len(pattern) and pattern[position] == "|":
+                position += 1
+                result |= sequence()
+            return result
+        
+        def sequence() -> set:
+            nonlocal position
+            result = {""}
+            while position < len(pattern) and pattern[position] not in "|)":
+                if pattern.startswith("(?:", position):
+                    position += 3
+                    item = alternation()
+                    if position >= len(pattern) or pattern[position] != ")":
+                        raise ValueError(pattern)
+                    position += 1
+                elif pattern[position] in special:
+                    raise ValueError(pattern)
+                else:
+                    item = {pattern[position]}
+                    position += 1
+                if position < len(pattern) and pattern[position] == "?":
+                    position += 1
+                    item = item | {""}
+                result = {prefix + suffix for prefix in result for suffix in item}
+                if len(result) > cls.MAX_KEYWORDS:
+                    raise ValueError(pattern)
+            return result
+        
+        try:
+            keywords = alternation()
+        except ValueError:
+            return None
+        if position != len(pattern) or "" in keywords:
+            return None
+        return sorted(keywords)
+
+    def classify(self, prompt: str, default_intent: Optional[str] = "lister",
+                 default_system: Optional[str] = "CRM") -> Tuple[str, str, bool]:
+        """
+        Classe un prompt (déjà en minuscules)
+        
+        Args:
+            default_intent: Intention renvoyée si aucune règle ne correspond
+            default_system: Système renvoyé si aucune règle ne correspond
+        
+        Returns:
+            (intention, système, opportunité détectée)
+        """
+        seen = set()
+        if self.regex is not None:
+            for keyword in self.regex.findall(prompt):
+                seen.update(self.hits[keyword])
+        for name, regex in self.fallbacks:
+            if regex.search(prompt):
+                seen.add(name)
+        
+        intent = next((i for i, rule in self.intent_rules if self._matches(prompt, rule, seen)), default_intent)
+        system = next((s for s, rule in self.system_rules if self._matches(prompt, rule, seen)), default_system)
+        return intent, system, self._matches(prompt, self.compiled_rules[("opportunite", "opportunite")], seen)
+
+    def _matches(self, prompt: str, rule: Tuple[frozenset, List[List[str]]], seen: set) -> bool:
+        """Une règle correspond si un groupe simple a été vu ou si une séquence apparaît dans l'ordre"""
+        simple, sequences = rule
+        if not simple.isdisjoint(seen):
+            return True
+        for parts in sequences:
+            if all(name in seen for name in parts) and self._sequence_found(prompt, parts):
+                return True
+        return False
+
+    def _sequence_found(self, prompt: str, parts: List[str]) -> bool:
+        """Relève les positions des parties d'une séquence (chemin rare) puis vérifie leur ordre"""
+        spans: Dict[str, List[Tuple[int, int]]] = {name: [] for name in parts}
+        
+        def record(name: str, start: int, end: int):
+            if name in spans:
+                spans[name].append((start, end))
+        
+        if self.regex is not None:
+            for match in self.regex.finditer(prompt):
+                for name, size in self.ordered_hits[match.group(1)]:
+                    record(name, match.start(), match.start() + size)
+        for name, regex in self.fallbacks:
+            for match in regex.finditer(prompt):
+                record(name, match.start(), match.start() + len(match.group(1)))
+        return self._in_order(prompt, parts, spans)
+
+    @staticmethod
+    def _in_order(prompt: str, parts: List[str], spans: Dict[str, List[Tuple[int, int]]]) -> bool:
+        """
+        Vérifie qu'une séquence A.*B.*C apparaît dans l'ordre, sur une même ligne
+        
+        Pour chaque occurrence de la première partie, chaque partie suivante est
+        cherchée à partir de la fin de la précédente sans dépasser la fin de la
+        ligne (occurrence qui se termine le plus tôt : elle laisse le plus de
+        place à la suite).
+        """
+        for first_start, position in spans[parts[0]]:
+            line_end = prompt.find("\n", first_start)
+            if line_end == -1:
+                line_end = len(prompt)
+            for name in parts[1:]:
+                ends = [end for start, end in spans[name] if position <= start and end <= line_end]
+                if not ends:
+                    break
+                position = min(ends)
+            else:
+                return True
+        return False
+
+
+class ChainPattern:
+    """
+    Pattern « A.*?B.*?FIN » évalué sans retour arrière en cascade
+
+    Équivalent à re.search sur l'expression complète : sur une ligne, la première
+    occurrence de chaque étape est la seule à essayer (si la suite échoue après
+    elle, elle échoue aussi après toute occurrence plus lointaine de la même
+    ligne). Chaque étape n'est donc recherchée qu'une fois par ligne, et la
+    dernière correspondance trouvée est réutilisée tant qu'elle reste devant.
+    """
+
+    def __init__(self, stages: List[str], final: str, flags: int = 0,
+                 final_linear: Optional[str] = None, tail_class: Optional[str] = None):
+        """
+        Args:
+            stages: Mots-clés successifs (A, B...) séparés par « .*? »
+            final: Expression finale, dont le groupe 1 est la valeur extraite
+            flags: Options re communes
+            final_linear: Variante de final ancrée au début des séquences (lookbehind),
+                utilisée après un essai de final à la position de départ
+            tail_class: Classe de caractères d'une valeur capturée jusqu'à la fin du
+                prompt : final n'est alors cherchée que dans le suffixe fait de ces caractères
+        """
+        self.stages = [re.compile(stage, flags) for stage in stages]
+        self.final = re.compile(final, flags)
+        self.final_linear = re.compile(final_linear, flags) if final_linear else None
+        self.tail = re.compile(f"(?<!{tail_class}){tail_class}*\\Z", flags) if tail_class else None
+
+    def _search_final(self, prompt: str, pos: int, tail_start: int) -> Optional[re.Match]:
+        if self.final_linear is not None:
+            return self.final.match(prompt, pos) or self.final_linear.search(prompt, pos + 1)
+        return self.final.search(prompt, max(pos, tail_start))
+
+    def search(self, prompt: str) -> Optional[re.Match]:
+        tail_start = self.tail.search(prompt).start() if self.tail is not None else 0
+        searchers = [stage.search for stage in self.stages[1:]]
+        searchers.append(lambda text, pos: self._search_final(text, pos, tail_start))
+        found: Dict[int, Optional[re.Match]] = {}
+        
+        def find(index: int, pos: int) -> Optional[re.Match]:
+            if index in found and (found[index] is None or found[index].start() >= pos):
+                return found[index]
+            found[index] = searchers[index](prompt, pos)
+            return found[index]
+        
+        pos = 0
+        while True:
+            match = self.stages[0].search(prompt, pos)
+            if match is None:
+                return None
+            line_end = prompt.find("\n", match.end())
+            if line_end == -1:
+                line_end = len(prompt)
+            for index in range(len(searchers)):
+                following = find(index, match.end())
+                if following is None:
+                    return None
+                if following.start() > line_end:
+                    break
+                match = following
+            else:
+                return match
+            pos = line_end + 1
+
+
+class ParameterExtractor:
+    """
+    Extracteur de paramètres précompilé (noms, emails, téléphones, villes, montants,
+    probabilités, IDs, statuts et dates), avec préfiltre par mots-clés
+
+    Ce n'est pas un extracteur en un seul parcours : un premier parcours du prompt
+    (trie des mots-clés déclencheurs) relève les mots-clés et symboles présents,
+    puis les règles dont un déclencheur apparaît sont évaluées une à une (re.search),
+    dans l'ordre de priorité d'origine, les autres étant écartées sans recherche.
+    Les formes sujettes au retour arrière sont réécrites de façon équivalente et
+    linéaire :
+    - « A.*?B.*?FIN » via ChainPattern ;
+    - séquences suivies d'un délimiteur (montant + devise, email, pourcentage)
+      ancrées au début de la séquence ;
+    - noms capturés paresseusement bornés à MAX_NAME_LENGTH caractères.
+    """
+
+    MAX_NAME_LENGTH = 100
+
+    EMAIL = r"[a-zA-Z0-9._%+-]++@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+    # Fin des noms d'opportunité et noms capturés jusqu'à la fin du prompt
+    OPPORTUNITE_END = r"(?:\s+avec\s+(?:un\s+)?montant|\s+avec\s+(?:l')?ID|\s+d'|\s+pour|$)"
+    TRAILING_NAME = r"([A-Za-zÀ-ÿ0-9]+(?:\s+[A-Za-zÀ-ÿ0-9]+)*)(?:\s*$)"
+
+    def __init__(self):
+        name = f"{{1,{self.MAX_NAME_LENGTH}}}?"
+        modification = r"(?:changer|modifier|mettre à jour)"
+        
+        # Règles : (mots-clés déclencheurs, pattern) ; aucun déclencheur = toujours évaluée
+        self.opportunite_name_rules = [
+            # Patterns pour la création
+            (None, re.compile(rf"(?:opportunité|opp)\s+(?:nommée?\s+)?([A-Za-zÀ-ÿ0-9\s]{name}){self.OPPORTUNITE_END}", re.IGNORECASE)),
+            (None, re.compile(rf"(?:ajoute|crée|créer)\s+(?:une\s+)?(?:opportunité\s+)?(?:nommée?\s+)?([A-Za-zÀ-ÿ0-9\s]{name}){self.OPPORTUNITE_END}", re.IGNORECASE)),
+            (None, re.compile(rf"(?:nouvelle\s+opportunité\s+)([A-Za-zÀ-ÿ0-9\s]{name}){self.OPPORTUNITE_END}", re.IGNORECASE)),
+            # Patterns pour la modification de nom/titre
+            (None, self._trailing_chain([modification, r"(?:nom|titre)"], r"(?:en\s+|à\s+)")),
+            (None, self._trailing_chain([r"(?:nom|titre)"], r"(?:en\s+|à\s+)")),
+            (None, self._trailing_chain([r"(?:renommer|rebaptiser)"], r"(?:en\s+|à\s+)")),
+            (None, self._trailing_chain([r"(?:change|modifie)", r"(?:titre|nom)"], r"(?:en\s+)"))
+        ]
+        self.excluded_name = re.compile(r'\b(?:ID|id|montant|avec|pour)\b')
+        
+        self.name_rules = [
+            ({"nom", "nommé", "appelé"}, re.compile(rf"(?:nom|nommé|appelé)\s+([A-Za-zÀ-ÿ\s]{name})(?:\s+avec|$)")),
+            ({"client", "employé", "projet"}, re.compile(rf"(?:client|employé|projet)\s+([A-Za-zÀ-ÿ\s]{name})(?:\s+avec|$)")),
+            ({"travaill", "affecté", "assigné"}, re.compile(
+                rf"(?:travaill(?:e|ent)|affectée?s? à|assignée?s? à)\s+([A-Za-zÀ-ÿ\s]{name})(?:\s+avec|\s*\?|$)")),
+            # Patterns pour modifications de nom
+            ({"changer", "modifier", "mettre à jour"},
+             ChainPattern([modification, r"(?:nom)"], r"(?:en\s+|à\s+)([A-Za-zÀ-ÿ\s]+?)(?:\s+|$)")),
+            ({"nom"}, re.compile(r"(?:nom)\s+(?:en\s+|à\s+)([A-Za-zÀ-ÿ\s]+?)(?:\s+|$)"))
+        ]
+        
+        self.email_rules = [
+            ({"@"}, re.compile(rf"(?:email|e-mail|mail)\s+(?:en\s+)?({self.EMAIL})")),
+            ({"@"}, ChainPattern([modification, r"(?:email|e-mail|mail)"], rf"(?:en\s+)?({self.EMAIL})",
+                                 final_linear=rf"(?:en\s+)?(?<![a-zA-Z0-9._%+-])({self.EMAIL})")),
+            ({"@"}, re.compile(rf"(?<![a-zA-Z0-9._%+-])({self.EMAIL})"))
+        ]
+        
+        self.phone_rules = [
+            ({"tel", "tél", "phone"}, re.compile(r"(?:telephone|téléphone|tel|phone)\s+([0-9\s\-\+\(\)]+)"))
+        ]
+        self.city_rules = [
+            ({"ville", "city"}, re.compile(r"(?:ville|city)\s+([A-Za-zÀ-ÿ\s]+)"))
+        ]
+        
+        self.amount_rules = [
+            ({"montant", "prix", "valeur"}, re.compile(r"(?:montant|prix|valeur)\s+(?:de\s+|à\s+)?([0-9\s,\.]+)")),
+            ({"montant"}, re.compile(r"avec\s+un\s+montant\s+(?:de\s+)?([0-9\s,\.]+)")),
+            ({"changer", "modifier", "mettre à jour"},
+             ChainPattern([modification, r"(?:montant|prix|valeur)"], r"(?:à\s+|en\s+)?([0-9\s,\.]+)")),
+            ({"euro", "€", "$"}, re.compile(r"(?<![0-9\s,\.])([0-9\s,\.]++)(?:euros?|€|\$)")),
+            (None, re.compile(r"(?:d'une\s+valeur\s+de\s+)?([0-9\s,\.]+)"))
+        ]
+        
+        self.probability_rules = [
+            ({"prob", "chance"}, re.compile(r"(?:probabilité|chance|prob)\s+(?:de\s+)?([0-9]+)%?")),
+            ({"%"}, re.compile(r"(?<![0-9])([0-9]++)%\s+(?:de\s+)?(?:probabilité|chance)")),
+            ({"%"}, re.compile(r"(?:avec\s+)?(?<![0-9])([0-9]++)%\s+(?:de\s+)?(?:succès|réussite)"))
+        ]
+        
+        self.id_rules = [
+            ({"id", "ID"}, re.compile(r"(?:avec\s+l')?(?:id|identifiant|ID)\s*+:?+\s*+([0-9]+)")),
+            ({"client", "ID"}, re.compile(r"(?:client|ID)\s+([0-9]+)")),
+            ({"ID"}, re.compile(r"l'ID\s+([0-9]+)"))
+        ]
+        
+        self.status_rules = [
+            ({"statut", "état"}, re.compile(r"(?:statut|état)\s+([a-zA-ZÀ-ÿ\s]+)"))
+        ]
+        self.date_rules = [
+            ({"/", "-"}, re.compile(r"(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{4})"))
+        ]
+        
+        all_rules = [self.opportunite_name_rules, self.name_rules, self.email_rules, self.phone_rules,
+                     self.city_rules, self.amount_rules, self.probability_rules, self.id_rules,
+                     self.status_rules, self.date_rules]
+        for rules in all_rules:
+            rules[:] = [(frozenset(triggers) if triggers else None, pattern) for triggers, pattern in rules]
+        
+        # Préfiltre : déclencheur le plus long -> déclencheurs qui en sont des préfixes
+        triggers = {t for rules in all_rules for keywords, _ in rules if keywords for t in keywords}
+        self.prefixes = {t: tuple(p for p in triggers if t.startswith(p)) for t in triggers}
+        self.scanner = re.compile(f"(?=({keyword_trie_regex(triggers)}))")
+
+    @classmethod
+    def _trailing_chain(cls, stages: List[str], marker: str) -> ChainPattern:
+        """Modification de nom d'opportunité : la valeur court jusqu'à la fin du prompt"""
+        return ChainPattern(stages, marker + cls.TRAILING_NAME, re.IGNORECASE,
+                            tail_class=r"[A-Za-zÀ-ÿ0-9\s]")
+
+    def scan(self, prompt: str) -> set:
+        """Relève en un parcours les mots-clés déclencheurs présents dans le prompt"""
+        present = set()
+        for keyword in self.scanner.findall(prompt):
+            present.update(self.prefixes[keyword])
+        return present
+
+    @staticmethod
+    def _matches(prompt: str, present: set, rules: List[Tuple[Optional[frozenset], Any]]):
+        """Correspondances des règles applicables, dans l'ordre de priorité"""
+        for triggers, pattern in rules:
+            if triggers is not None and triggers.isdisjoint(present):
+                continue
+            match = pattern.search(prompt)
+            if match:
+                yield match
+
+    def _first(self, prompt: str, present: set, rules) -> Optional[re.Match]:
+        return next(self._matches(prompt, present, rules), None)
+
+    def extract(self, prompt: str) -> Dict[str, Any]:
+        """Extrait les paramètres du prompt"""
+        parameters = {}
+        present = self.scan(prompt)
+        is_opportunite = "opportunit" in prompt.lower()
+        
+        # Extraction de noms/titres (patterns spécifiques selon le contexte)
+        if is_opportunite:
+            for match in self._matches(prompt, present, self.opportunite_name_rules):
+                name = match.group(1).strip()
+                # Éviter les noms contenant des références d'ID ou de montant
+                if name and len(name) > 1 and not self.excluded_name.search(name):
+                    parameters["titre"] = name
+                    parameters["nom"] = name  # Alias pour compatibilité
+                    break
+        else:
+            match = self._first(prompt, present, self.name_rules)
+            if match:
+                parameters["nom"] = match.group(1).strip()
+        
+        match = self._first(prompt, present, self.email_rules)
+        if match:
+            parameters["email"] = match.group(1)
+        
+        match = self._first(prompt, present, self.phone_rules)
+        if match:
+            parameters["telephone"] = match.group(1).strip()
+        
+        match = self._first(prompt, present, self.city_rules)
+        if match:
+            parameters["ville"] = match.group(1).strip()
+        
+        # Montants : mappage des champs selon le contexte
+        match = self._first(prompt, present, self.amount_rules)
+        if match:
+            amount_str = match.group(1).replace(" ", "").replace(",", "")
+            try:
+                if is_opportunite:
+                    parameters["valeur_prevue"] = float(amount_str)
+                    parameters["valeur"] = float(amount_str)  # Alias pour compatibilité
+                else:
+                    parameters["montant"] = float(amount_str)
+            except ValueError:
+                pass
+        
+        match = self._first(prompt, present, self.probability_rules)
+        if match:
+            parameters["probabilite"] = int(match.group(1))
+        
+        match = self._first(prompt, present, self.id_rules)
+        if match:
+            parameters["id"] = match.group(1)
+        
+        match = self._first(prompt, present, self.status_rules)
+        if match:
+            parameters["statut"] = match.group(1).strip()
+        
+        match = self._first(prompt, present, self.date_rules)
+        if match:
+            parameters["date"] = match.group(1)
+        
+        return parameters
 
 
 class InterfaceAgent:
@@ -23,7 +527,11 @@ class InterfaceAgent:
     Agent Interface - Analyse les prompts utilisateurs et les convertit en JSON structuré
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: Optional[int] = None):
+        """
+        Args:
+            cache_size: Nombre de prompts normalisés gardés en cache (None = config, 0 = désactivé)
+        """
         self.name = "Agent Interface"
         self.supported_systems = ["CRM", "RH", "PROJETS"]
         
@@ -63,6 +571,9 @@ class InterfaceAgent:
             "rapport": [
                 r"(?:rapport|résumé|bilan|synthèse)",
                 r"(?:performance|statistiques)"
+            ],
+            "activite": [
+                r"(?:travaill(?:e|ent)|affectée?s? à|assignée?s? à)"
             ]
         }
         
@@ -76,7 +587,8 @@ class InterfaceAgent:
             "RH": [
                 r"(?:employe?s?|salariés?|personnel|rh|ressources? humaines?)",
                 r"(?:congés?|vacations?|évaluations?|formations?)",
-                r"(?:équipe|staff|collaborateurs?)"
+                r"(?:équipe|staff|collaborateurs?)",
+                r"(?:travaill(?:e|ent))"
             ],
             "PROJETS": [
                 r"(?:projets?|tâches?|planning|développement)",
@@ -84,8 +596,23 @@ class InterfaceAgent:
                 r"(?:sprints?|itérations?)"
             ]
         }
+        
+        # Compilation unique de tous les patterns de classification
+        self.classifier = PromptClassifier(self.intent_patterns, self.system_patterns, PRIORITY_INTENTS)
+        self.extractor = ParameterExtractor()
+        
+        # Repli TF-IDF quand aucune règle ne reconnaît l'intention ou le système
+        # (NumPy importé et modèle entraîné au premier besoin)
+        self._fallback_classifier = None
+        self._fallback_loaded = False
+        self._fallback_lock = threading.Lock()
+        
+        # Cache LRU des analyses (boutons d'actions rapides, prompts répétés)
+        if cache_size is None:
+            cache_size = PROMPT_CACHE_CONFIG["max_entries"] if PROMPT_CACHE_CONFIG["enabled"] else 0
+        self.cache = PromptCache(cache_size, PROMPT_CACHE_CONFIG["max_variants"]) if cache_size > 0 else None
 
-    def analyze_prompt(self, user_prompt: str) -> UserInstruction:
+    def analyze_prompt(self, user_prompt: str) -> "UserInstruction":
         """
         Analyse un prompt utilisateur et retourne une instruction structurée
         
@@ -95,16 +622,127 @@ class InterfaceAgent:
         Returns:
             UserInstruction: Instruction structurée
         """
+        if self.cache is None:
+            return self._analyze(user_prompt)
+        
+        computed = False
+        
+        def analyze(prompt: str) -> "UserInstruction":
+            nonlocal computed
+            computed = True
+            return self._analyze(prompt)
+        
+        cached = self.cache.get_or_compute(user_prompt, analyze)
+        increment("cache_misses" if computed else "cache_hits")
+        PROMPT_CACHE.inc(result="miss" if computed else "hit")
+        # Copie : l'appelant peut modifier les paramètres sans altérer le cache
+        return cached.model_copy(update={"parameters": dict(cached.parameters)})
+
+    def split_prompt(self, user_prompt: str) -> List[str]:
+        """
+        Découpe un prompt composé en demandes indépendantes
+        
+        Un segment n'ouvre une nouvelle demande que s'il vise lui-même un système
+        (« ... et le statut des projets ») ; sinon il complète la demande en cours
+        (« Cherche Dupont et Martin », « change le nom en A et B »).
+        
+        Args:
+            user_prompt: Le prompt de l'utilisateur
+            
+        Returns:
+            Les demandes, dans l'ordre du prompt (le prompt entier s'il est simple)
+        """
+        separators = list(COMPOUND_SEPARATOR.finditer(user_prompt))
+        if not separators:
+            return [user_prompt]
+        
+        bounds = [0] + [bound for match in separators for bound in match.span()] + [len(user_prompt)]
+        max_parts = MULTI_INTENT_CONFIG["max_instructions"]
+        parts: List[List[int]] = []  # [début, fin] de chaque demande
+        previous_has_system = False
+        for start, end in zip(bounds[::2], bounds[1::2]):
+            has_system = self.classifier.classify(
+                user_prompt[start:end].lower(), default_system=None)[1] is not None
+            if parts and not (previous_has_system and has_system and len(parts) < max_parts):
+                parts[-1][1] = end
+            else:
+                parts.append([start, end])
+                previous_has_system = False
+            previous_has_system = previous_has_system or has_system
+        return [user_prompt[start:end] for start, end in parts]
+
+    def analyze_compound(self, user_prompt: str) -> List["UserInstruction"]:
+        """
+        Analyse un prompt pouvant contenir plusieurs demandes
+        
+        Une demande sans verbe reconnu (« ... et les projets ») reprend l'intention
+        de la précédente ; les demandes identiques ne sont gardées qu'une fois.
+        
+        Args:
+            user_prompt: Le prompt de l'utilisateur en langage naturel
+            
+        Returns:
+            Liste d'instructions structurées (une seule pour un prompt simple)
+        """
+        parts = self.split_prompt(user_prompt)
+        if len(parts) == 1:
+            return [self.analyze_prompt(user_prompt)]
+        
+        instructions = []
+        seen = set()
+        for part in parts:
+            instruction = self.analyze_prompt(part)
+            if instructions and self.classifier.classify(part.lower(), default_intent=None)[0] is None:
+                action = instructions[-1].action
+                instruction = instruction.model_copy(update={
+                    "action": action,
+                    "operation": self._generate_operation(action, instruction.system, part.lower())
+                })
+            key = (instruction.system, instruction.operation, dumps(instruction.parameters))
+            if key not in seen:
+                seen.add(key)
+                instructions.append(instruction)
+        return instructions
+
+    @property
+    def fallback_classifier(self) -> Optional[TfidfClassifier]:
+        """Classifieur de repli, entraîné sur les exemples étiquetés au premier accès (None si indisponible)"""
+        if not self._fallback_loaded:
+            with self._fallback_lock:  # un seul entraînement si plusieurs sessions arrivent ensemble
+                if not self._fallback_loaded:
+                    if FALLBACK_CLASSIFIER_CONFIG["enabled"] and NUMPY_AVAILABLE:
+                        try:
+                            self._fallback_classifier = TfidfClassifier.from_file(
+                                FALLBACK_CLASSIFIER_CONFIG["examples_file"],
+                                ngram_range=FALLBACK_CLASSIFIER_CONFIG["ngram_range"])
+                        except (OSError, ValueError, KeyError) as e:
+                            print(f"⚠️ Classifieur de repli indisponible: {e}")
+                    self._fallback_loaded = True
+        return self._fallback_classifier
+
+    def _analyze(self, user_prompt: str) -> "UserInstruction":
+        """Analyse complète d'un prompt (sans cache)"""
+        from src.agents.instruction import UserInstruction
+        
         user_prompt_lower = user_prompt.lower()
         
-        # Détection de l'intention
-        detected_intent = self._detect_intent(user_prompt_lower)
+        # Détection de l'intention, du système cible et des opportunités en un seul parcours
+        detected_intent, detected_system, is_opportunite = self.classifier.classify(
+            user_prompt_lower, default_intent=None, default_system=None)
         
-        # Détection du système cible
-        detected_system = self._detect_system(user_prompt_lower)
+        # Aucune règle reconnue : repli sur le classifieur TF-IDF s'il est assez confiant
+        if (detected_intent is None or detected_system is None) and self.fallback_classifier is not None:
+            prediction = self.fallback_classifier.predict(user_prompt)
+            thresholds = FALLBACK_CLASSIFIER_CONFIG["min_confidence"]
+            if detected_intent is None and prediction["intent"][1] >= thresholds["intent"]:
+                detected_intent = prediction["intent"][0]
+            if detected_system is None and prediction["system"][1] >= thresholds["system"]:
+                detected_system = prediction["system"][0]
+        detected_intent = detected_intent or "lister"
+        detected_system = detected_system or "CRM"
         
         # Génération de l'opération spécifique
-        operation = self._generate_operation(detected_intent, detected_system, user_prompt_lower)
+        operation = self._generate_operation(detected_intent, detected_system, user_prompt_lower, is_opportunite)
         
         # Extraction des paramètres
         parameters = self._extract_parameters(user_prompt, detected_intent, detected_system)
@@ -118,31 +756,21 @@ class InterfaceAgent:
         )
 
     def _detect_intent(self, prompt: str) -> str:
-        """Détecte l'intention à partir du prompt - ordre prioritaire"""
-        # Ordre prioritaire : modifier et supprimer d'abord car plus spécifiques
-        priority_intents = ["modifier", "supprimer", "rechercher", "ajouter", "lister", "statut", "rapport"]
-        
-        for intent in priority_intents:
-            if intent in self.intent_patterns:
-                patterns = self.intent_patterns[intent]
-                for pattern in patterns:
-                    if re.search(pattern, prompt):
-                        return intent
-        return "lister"  # Intention par défaut
+        """Détecte l'intention à partir du prompt - ordre prioritaire (PRIORITY_INTENTS)"""
+        return self.classifier.classify(prompt)[0]  # "lister" par défaut
 
     def _detect_system(self, prompt: str) -> str:
         """Détecte le système cible à partir du prompt"""
-        for system, patterns in self.system_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, prompt):
-                    return system
-        return "CRM"  # Système par défaut
+        return self.classifier.classify(prompt)[1]  # "CRM" par défaut
 
-    def _generate_operation(self, intent: str, system: str, prompt: str = "") -> str:
+    def _generate_operation(self, intent: str, system: str, prompt: str = "",
+                            is_opportunite: Optional[bool] = None) -> str:
         """Génère l'opération spécifique basée sur l'intention, le système et le prompt"""
+        if is_opportunite is None:
+            is_opportunite = bool(re.search(OPPORTUNITE_PATTERN, prompt.lower()))
         
         # Détection spéciale pour les opportunités
-        if system == "CRM" and re.search(r"opportunités?|deals?|affaires?", prompt.lower()):
+        if system == "CRM" and is_opportunite:
             if intent == "lister":
                 return "lister_opportunites"
             elif intent == "ajouter":
@@ -171,7 +799,8 @@ class InterfaceAgent:
                 "modifier": "modifier_employe",
                 "supprimer": "supprimer_employe",
                 "statut": "statut_conges",
-                "rapport": "rapport_rh"
+                "rapport": "rapport_rh",
+                "activite": "activite_employe"
             },
             "PROJETS": {
                 "lister": "lister_projets",
@@ -187,136 +816,45 @@ class InterfaceAgent:
         return operation_map.get(system, {}).get(intent, f"{intent}_{system.lower()}")
 
     def _extract_parameters(self, prompt: str, intent: str, system: str) -> Dict[str, Any]:
-        """Extrait les paramètres du prompt"""
-        parameters = {}
+        """Extrait les paramètres du prompt (règles précompilées, préfiltrées par mots-clés)"""
+        return self.extractor.extract(prompt)
+
+    def process_batch(self, messages: List[str], workers: int = 1,
+                      chunk_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Traite un lot de messages (rejeu d'historiques, classification en masse)
         
-        # Extraction de noms/titres (patterns spécifiques selon le contexte)
-        if "opportunit" in prompt.lower():
-            # Patterns spécifiques pour les opportunités
-            opp_name_patterns = [
-                # Patterns pour la création
-                r"(?:opportunité|opp)\s+(?:nommée?\s+)?([A-Za-zÀ-ÿ0-9\s]+?)(?:\s+avec\s+(?:un\s+)?montant|\s+avec\s+(?:l')?ID|\s+d'|\s+pour|$)",
-                r"(?:ajoute|crée|créer)\s+(?:une\s+)?(?:opportunité\s+)?(?:nommée?\s+)?([A-Za-zÀ-ÿ0-9\s]+?)(?:\s+avec\s+(?:un\s+)?montant|\s+avec\s+(?:l')?ID|\s+d'|\s+pour|$)",
-                r"(?:nouvelle\s+opportunité\s+)([A-Za-zÀ-ÿ0-9\s]+?)(?:\s+avec\s+(?:un\s+)?montant|\s+avec\s+(?:l')?ID|\s+d'|\s+pour|$)",
-                # Patterns pour la modification de nom/titre
-                r"(?:changer|modifier|mettre à jour).*?(?:nom|titre).*?(?:en\s+|à\s+)([A-Za-zÀ-ÿ0-9]+(?:\s+[A-Za-zÀ-ÿ0-9]+)*)(?:\s*$)",
-                r"(?:nom|titre).*?(?:en\s+|à\s+)([A-Za-zÀ-ÿ0-9]+(?:\s+[A-Za-zÀ-ÿ0-9]+)*)(?:\s*$)",
-                r"(?:renommer|rebaptiser).*?(?:en\s+|à\s+)([A-Za-zÀ-ÿ0-9]+(?:\s+[A-Za-zÀ-ÿ0-9]+)*)(?:\s*$)",
-                r"(?:change|modifie).*?(?:titre|nom).*?(?:en\s+)([A-Za-zÀ-ÿ0-9]+(?:\s+[A-Za-zÀ-ÿ0-9]+)*)(?:\s*$)"
-            ]
-            
-            for pattern in opp_name_patterns:
-                name_match = re.search(pattern, prompt, re.IGNORECASE)
-                if name_match:
-                    name = name_match.group(1).strip()
-                    # Éviter les noms contenant des références d'ID ou de montant
-                    if name and len(name) > 1 and not re.search(r'\b(?:ID|id|montant|avec|pour)\b', name):
-                        parameters["titre"] = name
-                        parameters["nom"] = name  # Alias pour compatibilité
-                        break
-        else:
-            # Patterns généraux pour les autres entités
-            name_patterns = [
-                r"(?:nom|nommé|appelé)\s+([A-Za-zÀ-ÿ\s]+?)(?:\s+avec|$)",
-                r"(?:client|employé|projet)\s+([A-Za-zÀ-ÿ\s]+?)(?:\s+avec|$)",
-                # Patterns pour modifications de nom
-                r"(?:changer|modifier|mettre à jour).*?(?:nom).*?(?:en\s+|à\s+)([A-Za-zÀ-ÿ\s]+?)(?:\s+|$)",
-                r"(?:nom)\s+(?:en\s+|à\s+)([A-Za-zÀ-ÿ\s]+?)(?:\s+|$)"
-            ]
-            
-            for pattern in name_patterns:
-                name_match = re.search(pattern, prompt)
-                if name_match:
-                    parameters["nom"] = name_match.group(1).strip()
-                    break
-            
-        # Extraction d'emails - patterns améliorés
-        email_patterns = [
-            r"(?:email|e-mail|mail)\s+(?:en\s+)?([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-            r"(?:changer|modifier|mettre à jour).*?(?:email|e-mail|mail).*?(?:en\s+)?([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-            r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"  # Pattern général pour email
-        ]
+        Les patterns sont compilés une seule fois par processus et les prompts
+        répétés sont servis par le cache. Avec workers > 1 et un lot assez grand
+        (BATCH_CONFIG["process_pool_min_batch"]), le lot est découpé en tranches
+        réparties sur un pool de processus.
         
-        for pattern in email_patterns:
-            email_match = re.search(pattern, prompt)
-            if email_match:
-                parameters["email"] = email_match.group(1)
-                break
-            
-        # Extraction de téléphones
-        phone_match = re.search(r"(?:telephone|téléphone|tel|phone)\s+([0-9\s\-\+\(\)]+)", prompt)
-        if phone_match:
-            parameters["telephone"] = phone_match.group(1).strip()
-            
-        # Extraction de villes
-        city_match = re.search(r"(?:ville|city)\s+([A-Za-zÀ-ÿ\s]+)", prompt)
-        if city_match:
-            parameters["ville"] = city_match.group(1).strip()
+        Args:
+            messages: Messages utilisateur
+            workers: Nombre de processus (1 = séquentiel dans le processus courant)
+            chunk_size: Taille des tranches envoyées aux workers
             
-        # Extraction de montants (pour opportunités) - patterns améliorés
-        amount_patterns = [
-            r"(?:montant|prix|valeur)\s+(?:de\s+|à\s+)?([0-9\s,\.]+)",
-            r"avec\s+un\s+montant\s+(?:de\s+)?([0-9\s,\.]+)",
-            r"(?:changer|modifier|mettre à jour).*?(?:montant|prix|valeur).*?(?:à\s+|en\s+)?([0-9\s,\.]+)",
-            r"([0-9\s,\.]+)\s*(?:euros?|€|\$)",
-            r"(?:d'une\s+valeur\s+de\s+)?([0-9\s,\.]+)"
-        ]
-        
-        for pattern in amount_patterns:
-            amount_match = re.search(pattern, prompt)
-            if amount_match:
-                amount_str = amount_match.group(1).replace(" ", "").replace(",", "")
-                try:
-                    # Mappage des champs selon le contexte
-                    if "opportunit" in prompt.lower():
-                        parameters["valeur_prevue"] = float(amount_str)
-                        parameters["valeur"] = float(amount_str)  # Alias pour compatibilité
-                    else:
-                        parameters["montant"] = float(amount_str)
-                except ValueError:
-                    pass
-                break
-                
-        # Extraction de probabilité (pour opportunités)
-        prob_patterns = [
-            r"(?:probabilité|chance|prob)\s+(?:de\s+)?([0-9]+)%?",
-            r"([0-9]+)%\s+(?:de\s+)?(?:probabilité|chance)",
-            r"(?:avec\s+)?([0-9]+)%\s+(?:de\s+)?(?:succès|réussite)"
-        ]
+        Returns:
+            Résultats de process_message, dans l'ordre des messages
+        """
+        if workers <= 1 or len(messages) < BATCH_CONFIG["process_pool_min_batch"]:
+            return [self.process_message(message) for message in messages]
         
-        for pattern in prob_patterns:
-            prob_match = re.search(pattern, prompt)
-            if prob_match:
-                try:
-                    parameters["probabilite"] = int(prob_match.group(1))
-                except ValueError:
-                    pass
-                break
-                    
-        # Extraction d'IDs - patterns améliorés
-        id_patterns = [
-            r"(?:avec\s+l')?(?:id|identifiant|ID)\s*:?\s*([0-9]+)",
-            r"(?:client|ID)\s+([0-9]+)",
-            r"l'ID\s+([0-9]+)"
-        ]
+        from concurrent.futures import ProcessPoolExecutor
         
-        for pattern in id_patterns:
-            id_match = re.search(pattern, prompt)
-            if id_match:
-                parameters["id"] = id_match.group(1)
-                break
-            
-        # Extraction de statuts
-        status_match = re.search(r"(?:statut|état)\s+([a-zA-ZÀ-ÿ\s]+)", prompt)
-        if status_match:
-            parameters["statut"] = status_match.group(1).strip()
-            
-        # Extraction de dates
-        date_match = re.search(r"(\d{1,2}[\/\-]\d{1,2}[\/\-]\d{4})", prompt)
-        if date_match:
-            parameters["date"] = date_match.group(1)
-            
-        return parameters
+        chunk_size = chunk_size or BATCH_CONFIG["chunk_size"]
+        chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as pool:
+            for chunk_results in pool.map(_process_batch_chunk, chunks):
+                results.extend(chunk_results)
+        return results
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Statistiques du cache d'analyses (taux de succès, taille...)"""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.stats()}
 
     def process_message(self, message: str) -> Dict[str, Any]:
         """
@@ -326,13 +864,18 @@ class InterfaceAgent:
             message: Message de l'utilisateur
             
         Returns:
-            Dict contenant l'instruction structurée
+            Dict contenant l'instruction structurée (la première) et la liste
+            des instructions lorsque le message contient plusieurs demandes
         """
         try:
-            instruction = self.analyze_prompt(message)
+            if MULTI_INTENT_CONFIG["enabled"]:
+                instructions = self.analyze_compound(message)
+            else:
+                instructions = [self.analyze_prompt(message)]
             return {
                 "success": True,
-                "instruction": instruction.model_dump(),
+                "instruction": instructions[0].model_dump(),
+                "instructions": [instruction.model_dump() for instruction in instructions],
                 "agent": self.name
             }
         except Exception as e:
@@ -344,6 +887,19 @@ class InterfaceAgent:
             }
 
 
+# Agent propre à chaque processus du pool de process_batch (créé une fois par worker)
+_batch_agent: Optional[InterfaceAgent] = None
+
+
+def _init_batch_worker():
+    global _batch_agent
+    _batch_agent = InterfaceAgent()
+
+
+def _process_batch_chunk(messages: List[str]) -> List[Dict[str, Any]]:
+    return [_batch_agent.process_message(message) for message in messages]
+
+
 # Fonction utilitaire pour tester l'agent
 def test_interface_agent():
     """Test rapide de l'Agent Interface"""
@@ -357,14 +913,24 @@ def test_interface_agent():
         "Donne-moi un rapport sur les congés des employés",
         "Liste des opportunités",
         "Montre-moi toutes les opportunités commerciales",
-        "Affiche les deals en cours"
+        "Affiche les deals en cours",
+        "Liste les clients et le statut des projets"
     ]
     
     print("=== Test de l'Agent Interface ===")
+    # Séquences « A.*B » évaluées ligne par ligne, comme re.search : "statut" seul ne suffit pas ici
+    intent = agent._detect_intent("liste les employés\nstatut client")
+    print(f"\nPrompt multi-lignes: {intent} ({'OK' if intent == 'lister' else 'ERREUR, attendu lister'})")
     for prompt in test_prompts:
         result = agent.process_message(prompt)
         print(f"\nPrompt: {prompt}")
-        print(f"Résultat: {json.dumps(result, indent=2, ensure_ascii=False)}")
+        print(f"Résultat: {dumps(result, indent=True)}")
+    
+    # Prompts répétés (actions rapides) : servis par le cache
+    for prompt in test_prompts[:3]:
+        agent.process_message(prompt.upper())
+        agent.process_message(prompt)
+    print(f"\nCache: {agent.cache_stats()}")
 
 
 if __name__ == "__main__":
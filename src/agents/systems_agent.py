@@ -3,25 +3,121 @@ Agent Systèmes - Exécute les instructions sur les systèmes (Odoo + JSON)
 Mode Hybride : CRM via Odoo, RH/Projets via JSON
 """
 
-import json
+import atexit
+import importlib.util
 import os
 import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from datetime import datetime, date
 
 # Ajouter le répertoire parent au path pour les imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-from config import SYSTEMS_CONFIG, DATA_DIR
+from config import SYSTEMS_CONFIG, DATA_DIR, DATA_RELOAD_CONFIG, JOURNAL_CONFIG, ASYNC_CONFIG, DASHBOARD_CONFIG
+from src.utils.serialization import load_file, dumps
+from src.storage.journal import DataJournal, apply_entry
+from src.storage.relation_index import RelationIndex
+from src.storage.records import RECORD_TYPES, compact_collections, to_plain
+from src.utils.telemetry import span, annotate
+from src.utils.metrics import OPERATIONS, OPERATION_DURATION
 
-# Import du connecteur Odoo
-try:
-    from src.connectors.odoo_connector import OdooConnector
-    ODOO_AVAILABLE = True
-    print("✅ Connecteur Odoo disponible")
-except ImportError as e:
-    ODOO_AVAILABLE = False
-    print(f"⚠️ Connecteur Odoo indisponible: {e}")
+# Connecteur Odoo : importé au premier agent qui l'utilise (xmlrpc, configuration Odoo)
+_odoo_connector_class = None
+_odoo_import_failed = False
+
+
+def load_odoo_connector():
+    """Importe le connecteur Odoo au premier besoin ; None s'il est indisponible"""
+    global _odoo_connector_class, _odoo_import_failed
+    if _odoo_connector_class is None and not _odoo_import_failed:
+        try:
+            from src.connectors.odoo_connector import OdooConnector
+            _odoo_connector_class = OdooConnector
+            print("✅ Connecteur Odoo disponible")
+        except ImportError as e:
+            _odoo_import_failed = True
+            print(f"⚠️ Connecteur Odoo indisponible: {e}")
+    return _odoo_connector_class
+
+
+# Agents vivants : journaux synchronisés et fermés à l'arrêt du processus
+_open_agents: "weakref.WeakSet[SystemsAgent]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_agents():
+    for agent in list(_open_agents):
+        agent.close()
+
+
+def odoo_available() -> bool:
+    """Disponibilité du connecteur Odoo, sans l'importer s'il n'a pas encore servi"""
+    if _odoo_connector_class is not None or _odoo_import_failed:
+        return _odoo_connector_class is not None
+    return importlib.util.find_spec("src.connectors.odoo_connector") is not None
+
+
+def _sort_key(value: Any) -> tuple:
+    """Clé de tri tolérante aux types mélangés : nombres, puis textes (sans casse), valeurs vides en dernier"""
+    if value is None or value == "":
+        return (2, "")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    return (1, str(value).lower())
+
+
+def _matches(record: Any, needle: str) -> bool:
+    """Le texte recherché apparaît dans l'une des valeurs simples de l'enregistrement (sans casse)"""
+    if not hasattr(record, "items"):
+        return needle in str(record).lower()
+    return any(needle in str(value).lower() for _, value in record.items()
+               if isinstance(value, (str, int, float)) and not isinstance(value, bool))
+
+
+def paginate_result(result: Dict[str, Any], pagination: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Filtre, trie et découpe la liste "data" d'un résultat d'opération
+
+    Args:
+        result: Résultat d'une opération ({"data": [...], "count": ...})
+        pagination: {"offset", "limit", "sort_by", "descending", "filter"} (tous optionnels)
+
+    Returns:
+        Nouveau résultat : "data" réduit à la page, "count" = nombre d'éléments
+        correspondant au filtre, "pagination" décrivant la page renvoyée
+    """
+    data = result.get("data")
+    if not isinstance(data, list):
+        return result
+    needle = str(pagination.get("filter") or "").strip().lower()
+    rows = [record for record in data if _matches(record, needle)] if needle else list(data)
+    sort_by = pagination.get("sort_by")
+    descending = bool(pagination.get("descending", False))
+    if sort_by:
+        rows.sort(key=lambda record: _sort_key(record.get(sort_by) if hasattr(record, "get") else None),
+                  reverse=descending)
+    offset = max(0, int(pagination.get("offset", 0)))
+    limit = pagination.get("limit")
+    page = rows[offset:offset + int(limit)] if limit is not None else rows[offset:]
+    return {
+        **result,
+        "count": len(rows),
+        "data": page,
+        "pagination": {"offset": offset, "limit": limit, "total": len(rows), "sort_by": sort_by,
+                       "descending": descending, "filter": needle}
+    }
+
+
+# Champs modifiables des enregistrements JSON
+EMPLOYE_FIELDS = ["nom", "prenom", "email", "poste", "departement", "manager",
+                  "date_embauche", "salaire", "statut", "competences"]
+PROJET_FIELDS = ["nom", "description", "chef_projet", "client_id", "statut", "priorite",
+                 "budget", "budget_consomme", "date_debut", "date_fin_prevue", "progression", "equipe"]
 
 
 class SystemsAgent:
@@ -31,16 +127,45 @@ class SystemsAgent:
     - RH/Projets : JSON (données mockées)
     """
     
-    def __init__(self, use_odoo: bool = True):
+    def __init__(self, use_odoo: bool = True, watch_data: Optional[bool] = None):
         self.name = "Agent Systèmes (Hybride)"
         self.systems_config = SYSTEMS_CONFIG
-        self.use_odoo = use_odoo and ODOO_AVAILABLE
+        self.use_odoo = use_odoo and load_odoo_connector() is not None
+        
+        # Version des données : incrémentée à chaque rechargement pour invalider les caches
+        self.data_version = 0
+        # Verrou des écritures (réentrant : allocation d'ID + écriture sous le même verrou)
+        self._data_lock = threading.RLock()
+        self._file_signatures = {}
+        self._watcher_thread = None
+        self._watcher_stop = threading.Event()
+        
+        # Indicateurs du tableau de bord : snapshot recalculé en arrière-plan (start_kpi_refresher)
+        self.kpi_snapshot: Optional[Dict[str, Any]] = None
+        self._kpi_thread = None
+        self._kpi_stop = threading.Event()
+        
+        # Threads de aexecute_instruction (démarrés à la demande par l'exécuteur)
+        self._async_executor = ThreadPoolExecutor(
+            max_workers=ASYNC_CONFIG["systems_workers"], thread_name_prefix="systems-agent")
+        
+        # Journaux append-only des systèmes JSON modifiables (RH, PROJETS)
+        self.journals = {
+            system_name: DataJournal(
+                config["journal_file"],
+                fsync_batch=JOURNAL_CONFIG["fsync_batch"],
+                fsync_interval=JOURNAL_CONFIG["fsync_interval"]
+            )
+            for system_name, config in self.systems_config.items()
+            if config.get("journal_file")
+        }
         
         # Initialiser le connecteur Odoo si disponible
         self.odoo_connector = None
         if self.use_odoo:
             try:
-                self.odoo_connector = OdooConnector()
+                connector_class = load_odoo_connector()
+                self.odoo_connector = connector_class()
                 if self.odoo_connector.connect():
                     print("✅ Connecteur Odoo initialisé")
                 else:
@@ -52,29 +177,412 @@ class SystemsAgent:
         
         # Charger les données JSON (toujours nécessaires pour RH/Projets)
         self._load_system_data()
+        
+        # Surveillance des fichiers pour le rechargement à chaud
+        if watch_data is None:
+            watch_data = DATA_RELOAD_CONFIG.get("enabled", False)
+        if watch_data:
+            self.start_data_watcher()
+        _open_agents.add(self)
+
+    def close(self):
+        """Arrête les threads de fond, puis synchronise et ferme les journaux"""
+        self.stop_data_watcher()
+        self.stop_kpi_refresher()
+        with self._data_lock:
+            for journal in self.journals.values():
+                journal.close()
 
     def _load_system_data(self):
         """Charge les données de tous les systèmes JSON"""
-        self.system_data = {}
+        system_data = {}
         
         for system_name, config in self.systems_config.items():
+            data_file = self._source_file(system_name)
+            self._file_signatures[system_name] = self._file_signature(data_file)
+            system_data[system_name] = self._read_data_file(system_name, data_file)
+            self._replay_journal(system_name, system_data[system_name])
+            compact_collections(system_data[system_name])
+        
+        self.system_data = system_data
+        self.relations = RelationIndex(system_data, self.data_version)
+        self._record_positions = {}  # (système, collection) -> position par ID, calculée à la première écriture
+        self._next_numbers = {}  # (système, collection) -> numéro du prochain ID
+
+    def _source_file(self, system_name: str) -> Path:
+        """Fichier de données d'un système : son dernier snapshot s'il existe, sinon le fichier d'origine"""
+        config = self.systems_config[system_name]
+        snapshot_file = config.get("snapshot_file")
+        if snapshot_file is not None and os.path.exists(snapshot_file):
+            return Path(snapshot_file)
+        return Path(config["data_file"])
+
+    def _read_data_file(self, system_name: str, data_file: Path) -> Dict[str, Any]:
+        """Lit et parse le fichier JSON d'un système"""
+        try:
+            data = load_file(data_file)
+            print(f"✅ Données {system_name} chargées")
+            return data
+        except FileNotFoundError:
+            print(f"⚠️ Fichier {data_file} non trouvé pour {system_name}")
+            return {}
+        except ValueError as e:
+            print(f"❌ Erreur JSON dans {data_file}: {e}")
+            return {}
+
+    def _replay_journal(self, system_name: str, data: Dict[str, Any]):
+        """Rejoue sur les données les écritures journalisées depuis le dernier snapshot"""
+        journal = self.journals.get(system_name)
+        if not journal:
+            return
+        
+        entries = journal.replay()
+        for entry in entries:
+            apply_entry(data, entry)
+        if entries:
+            print(f"📝 {len(entries)} écriture(s) rejouée(s) depuis le journal {system_name}")
+
+    @staticmethod
+    def _file_signature(data_file: Path) -> Optional[tuple]:
+        """Signature (mtime, taille) d'un fichier, None s'il n'existe pas"""
+        try:
+            stat = os.stat(data_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    # === RECHARGEMENT À CHAUD DES DONNÉES ===
+
+    def reload_changed_data(self) -> List[str]:
+        """
+        Recharge uniquement les fichiers JSON modifiés depuis le dernier chargement
+        
+        Un système compacté est lu depuis son snapshot (snapshot_file, dans
+        data/journal/) : le fichier d'origine n'est plus surveillé tant que le
+        snapshot existe.
+        
+        Le nouveau jeu de données est construit à part puis substitué en une seule
+        affectation : les requêtes en cours conservent l'ancienne version. Les
+        écritures attendent la fin du rechargement.
+        
+        Returns:
+            Liste des systèmes rechargés
+        """
+        # Sous le verrou : une compaction ne peut pas réécrire un fichier entre la
+        # comparaison de sa signature et sa lecture
+        with self._data_lock:
+            changed = {}
+            for system_name in self.systems_config:
+                data_file = self._source_file(system_name)
+                signature = self._file_signature(data_file)
+                if signature is None or signature == self._file_signatures.get(system_name):
+                    continue
+                
+                try:
+                    changed[system_name] = load_file(data_file)
+                except (OSError, ValueError) as e:
+                    # Fichier en cours d'écriture : on garde les données actuelles, nouvel essai au prochain passage
+                    print(f"⚠️ Rechargement de {system_name} ignoré: {e}")
+                    continue
+                # Signature enregistrée après une lecture réussie seulement
+                self._file_signatures[system_name] = signature
+            
+            if not changed:
+                return []
+            
+            for system_name, data in changed.items():
+                self._replay_journal(system_name, data)
+                compact_collections(data)
+            system_data = dict(self.system_data)
+            system_data.update(changed)
+            relations = RelationIndex(system_data, self.data_version + 1)
+            self.system_data = system_data
+            self.relations = relations
+            self._record_positions = {}
+            self._next_numbers = {}
+            self.data_version += 1
+        
+        print(f"🔄 Données rechargées: {', '.join(changed)} (version {self.data_version})")
+        return list(changed)
+
+    def start_data_watcher(self, poll_interval: Optional[float] = None):
+        """Démarre la surveillance des fichiers de données en arrière-plan"""
+        if self._watcher_thread and self._watcher_thread.is_alive():
+            return
+        
+        interval = poll_interval or DATA_RELOAD_CONFIG.get("poll_interval", 2.0)
+        self._watcher_stop.clear()
+        self._watcher_thread = threading.Thread(
+            target=self._watch_data_files,
+            args=(interval,),
+            name="systems-data-watcher",
+            daemon=True
+        )
+        self._watcher_thread.start()
+
+    def stop_data_watcher(self):
+        """Arrête la surveillance des fichiers de données"""
+        self._watcher_stop.set()
+        if self._watcher_thread:
+            self._watcher_thread.join(timeout=5)
+            self._watcher_thread = None
+
+    def _watch_data_files(self, interval: float):
+        """Boucle de surveillance : compare les mtimes à intervalle régulier"""
+        while not self._watcher_stop.wait(interval):
             try:
-                with open(config["data_file"], 'r', encoding='utf-8') as f:
-                    self.system_data[system_name] = json.load(f)
-                print(f"✅ Données {system_name} chargées")
-            except FileNotFoundError:
-                print(f"⚠️ Fichier {config['data_file']} non trouvé pour {system_name}")
-                self.system_data[system_name] = {}
-            except json.JSONDecodeError as e:
-                print(f"❌ Erreur JSON dans {config['data_file']}: {e}")
-                self.system_data[system_name] = {}
+                self.reload_changed_data()
+            except Exception as e:
+                print(f"⚠️ Erreur de surveillance des données: {e}")
+
+    # === PERSISTANCE DES ÉCRITURES (JOURNAL + SNAPSHOT) ===
+
+    def _write_record(self, system_name: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Journalise puis applique une écriture sur les données en mémoire
+        
+        Seule l'entrée est écrite sur disque ; le fichier JSON complet n'est
+        réécrit qu'à la compaction, au-delà de compaction_threshold entrées.
+        En mémoire, seul l'enregistrement écrit est remplacé (position retrouvée
+        par ID) et l'index de relations est mis à jour pour lui seul : le coût
+        d'une écriture ne dépend pas du volume des données.
+        """
+        journal = self.journals.get(system_name)
+        collection = entry["collection"]
+        
+        with self._data_lock:
+            if journal:
+                journal.append(entry)
+            data = self.system_data[system_name]
+            records = data.setdefault(collection, [])
+            positions = self._positions(system_name, collection)
+            position = positions.get(entry["id"])
+            old = records[position] if position is not None else None
+            if entry["op"] == "delete" and old is not None:
+                # Suppression sur une copie : une lecture en cours ne voit pas la liste se décaler
+                data[collection] = list(records)
+            # Ajout et modification en place : seul l'enregistrement concerné est remplacé
+            record = apply_entry(data, entry, RECORD_TYPES, positions)
+            if old is not None or record:
+                self.relations.update(collection, old, record or None, self.data_version + 1)
+            self.data_version += 1
+            
+            if journal and journal.entry_count >= JOURNAL_CONFIG["compaction_threshold"]:
+                self._compact_system(system_name)
+        
+        return record
+
+    def _compact_system(self, system_name: str):
+        """Écrit le snapshot JSON d'un système et vide son journal (verrou détenu)"""
+        config = self.systems_config[system_name]
+        data_file = config.get("snapshot_file", config["data_file"])
+        self.journals[system_name].compact(data_file, to_plain(self.system_data[system_name]))
+        # Le snapshot vient de nous : ne pas le recharger comme une modification externe
+        self._file_signatures[system_name] = self._file_signature(data_file)
+        print(f"🗜️ Journal {system_name} compacté dans {data_file}")
+
+    def compact_journals(self) -> List[str]:
+        """
+        Compacte tous les journaux non vides
+        
+        Returns:
+            Liste des systèmes compactés
+        """
+        compacted = []
+        with self._data_lock:
+            for system_name, journal in self.journals.items():
+                if journal.entry_count:
+                    self._compact_system(system_name)
+                    compacted.append(system_name)
+        return compacted
+
+    # === INDICATEURS DU TABLEAU DE BORD (SNAPSHOT) ===
+
+    def _pipeline_kpis(self) -> Dict[str, Any]:
+        """Valeur et probabilité moyenne du pipeline - agrégées par Odoo en priorité"""
+        if self.use_odoo and self.odoo_connector:
+            try:
+                result = self.odoo_connector.get_pipeline_summary()
+                if result["success"]:
+                    return {
+                        "nb_opportunites": result["count"],
+                        "valeur_totale": result["valeur_totale"],
+                        "probabilite_moyenne": result["probabilite_moyenne"],
+                        "source": "Odoo"
+                    }
+            except Exception as e:
+                print(f"⚠️ Erreur Odoo, fallback JSON: {e}")
+        
+        opportunites = self.system_data["CRM"].get("opportunites", [])
+        probabilites = [opp.get("probabilite", 0) for opp in opportunites]
+        return {
+            "nb_opportunites": len(opportunites),
+            "valeur_totale": sum(opp.get("valeur", opp.get("valeur_prevue", 0)) for opp in opportunites),
+            "probabilite_moyenne": round(sum(probabilites) / len(probabilites), 1) if probabilites else 0,
+            "source": "JSON"
+        }
+
+    def compute_kpis(self, max_rows: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Calcule les indicateurs du tableau de bord
+        
+        Pipeline commercial (valeur, probabilité moyenne), effectifs par
+        département, consommation des budgets projets et tâches en retard.
+        Les listes détaillées sont bornées à max_rows lignes : la taille du
+        snapshot ne dépend pas du volume des données.
+        
+        Returns:
+            Snapshot des indicateurs (horodaté, avec la version des données lues)
+        """
+        max_rows = max_rows or DASHBOARD_CONFIG["max_rows"]
+        start = time.perf_counter()
+        with span("systems.kpis"):
+            data_version = self.data_version
+            system_data = self.system_data  # lecture d'une seule version des données
+            
+            departements: Dict[str, int] = {}
+            employes = system_data["RH"].get("employes", [])
+            for employe in employes:
+                departement = employe.get("departement") or "Non renseigné"
+                departements[departement] = departements.get(departement, 0) + 1
+            
+            projets = system_data["PROJETS"].get("projets", [])
+            budget_total = sum(p.get("budget", 0) for p in projets)
+            budget_consomme = sum(p.get("budget_consomme", 0) for p in projets)
+            consommation = sorted((
+                {
+                    "id": p.get("id"),
+                    "nom": p.get("nom"),
+                    "budget": p.get("budget", 0),
+                    "budget_consomme": p.get("budget_consomme", 0),
+                    "pourcentage_budget": round(p.get("budget_consomme", 0) / p["budget"] * 100, 1) if p.get("budget") else 0,
+                    "progression": p.get("progression", 0)
+                }
+                for p in projets
+            ), key=lambda p: p["pourcentage_budget"], reverse=True)
+            
+            today = date.today().isoformat()
+            en_retard = sorted((
+                t for t in system_data["PROJETS"].get("taches", [])
+                if t.get("statut") != "Terminé" and t.get("date_echeance") and t.get("date_echeance") < today
+            ), key=lambda t: t.get("date_echeance"))
+            
+            snapshot = {
+                "computed_at": datetime.now().isoformat(timespec="seconds"),
+                "data_version": data_version,
+                "pipeline": self._pipeline_kpis(),
+                "effectifs": {
+                    "total": len(employes),
+                    "par_departement": dict(sorted(departements.items(), key=lambda item: -item[1]))
+                },
+                "budget": {
+                    "budget_total": budget_total,
+                    "budget_consomme": budget_consomme,
+                    "pourcentage_budget": round((budget_consomme / budget_total * 100) if budget_total > 0 else 0, 1),
+                    "projets": consommation[:max_rows]
+                },
+                "taches_en_retard": {
+                    "count": len(en_retard),
+                    "data": [
+                        {
+                            "id": t.get("id"),
+                            "titre": t.get("titre"),
+                            "projet_id": t.get("projet_id"),
+                            "assignee": t.get("assignee"),
+                            "date_echeance": t.get("date_echeance"),
+                            "jours_retard": (date.today() - date.fromisoformat(t["date_echeance"][:10])).days
+                        }
+                        for t in en_retard[:max_rows]
+                    ]
+                }
+            }
+        snapshot["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return snapshot
+
+    def refresh_kpis(self) -> Dict[str, Any]:
+        """Recalcule les indicateurs et remplace le snapshot (une seule affectation)"""
+        self.kpi_snapshot = self.compute_kpis()
+        return self.kpi_snapshot
+
+    def start_kpi_refresher(self, interval: Optional[float] = None):
+        """Calcule les indicateurs en arrière-plan, puis les recalcule à intervalle régulier"""
+        if self._kpi_thread and self._kpi_thread.is_alive():
+            return
+        
+        interval = interval or DASHBOARD_CONFIG["refresh_interval"]
+        self._kpi_stop.clear()
+        self._kpi_thread = threading.Thread(
+            target=self._refresh_kpis_loop,
+            args=(interval,),
+            name="systems-kpi-refresher",
+            daemon=True
+        )
+        self._kpi_thread.start()
+
+    def stop_kpi_refresher(self):
+        """Arrête le recalcul des indicateurs"""
+        self._kpi_stop.set()
+        if self._kpi_thread:
+            self._kpi_thread.join(timeout=5)
+            self._kpi_thread = None
+
+    def _refresh_kpis_loop(self, interval: float):
+        """Boucle de recalcul : premier snapshot immédiat, puis toutes les interval secondes"""
+        while True:
+            try:
+                self.refresh_kpis()
+            except Exception as e:
+                print(f"⚠️ Erreur de calcul des indicateurs: {e}")
+            if self._kpi_stop.wait(interval):
+                return
+
+    def _positions(self, system_name: str, collection: str) -> Dict[Any, int]:
+        """Position des enregistrements d'une collection par ID (calculée une fois, tenue à jour par apply_entry)"""
+        positions = self._record_positions.get((system_name, collection))
+        if positions is None:
+            records = self.system_data[system_name].get(collection, [])
+            positions = {record.get("id"): i for i, record in enumerate(records)}
+            self._record_positions[(system_name, collection)] = positions
+        return positions
+
+    def _find_record(self, system_name: str, collection: str, record_id: Any) -> Optional[Dict[str, Any]]:
+        """Retrouve un enregistrement par son ID (insensible à la casse)"""
+        records = self.system_data[system_name].get(collection, [])
+        positions = self._positions(system_name, collection)
+        for candidate in (record_id, str(record_id).upper()):
+            position = positions.get(candidate)
+            if position is not None:
+                return records[position]
+        # ID stocké dans une autre casse : parcours
+        wanted = str(record_id).upper()
+        for record in records:
+            if str(record.get("id", "")).upper() == wanted:
+                return record
+        return None
+
+    def _next_id(self, system_name: str, collection: str, prefix: str) -> str:
+        """Génère l'ID suivant d'une collection (E006, P004...) - à appeler sous _data_lock avec l'écriture"""
+        key = (system_name, collection)
+        number = self._next_numbers.get(key)
+        if number is None:
+            numbers = [
+                int(str(record.get("id", ""))[len(prefix):])
+                for record in self.system_data[system_name].get(collection, [])
+                if str(record.get("id", "")).startswith(prefix) and str(record.get("id", ""))[len(prefix):].isdigit()
+            ]
+            number = max(numbers, default=0) + 1
+        # L'appelant écrit l'enregistrement sous le même verrou : le numéro suivant est réservé.
+        # Compteur monotone : l'ID d'un enregistrement supprimé n'est pas réattribué (jusqu'au rechargement)
+        self._next_numbers[key] = number + 1
+        return f"{prefix}{number:03d}"
 
     def get_system_status(self) -> Dict[str, Any]:
         """Retourne le statut du système hybride"""
         return {
             "mode": "Hybride" if self.use_odoo else "JSON",
-            "odoo_available": ODOO_AVAILABLE,
+            "odoo_available": odoo_available(),
             "odoo_connected": self.use_odoo and self.odoo_connector and self.odoo_connector.is_connected,
+            "data_version": self.data_version,
             "systems": {
                 "CRM": "Odoo" if self.use_odoo else "JSON",
                 "RH": "JSON",
@@ -96,6 +604,8 @@ class SystemsAgent:
             system = instruction.get("system", "").upper()
             operation = instruction.get("operation", "")
             parameters = instruction.get("parameters", {})
+            # Pagination côté serveur (tableaux de l'interface) : seule la page demandée est renvoyée
+            pagination = parameters.get("pagination")
             
             if system not in self.system_data:
                 return {
@@ -104,19 +614,33 @@ class SystemsAgent:
                     "agent": self.name
                 }
             
-            # Routage vers la méthode appropriée
+            # Routage vers la méthode appropriée (span systems.<système>.<opération> et métriques)
             method_name = f"_execute_{system.lower()}_{operation}"
-            if hasattr(self, method_name):
-                result = getattr(self, method_name)(parameters)
-            else:
-                result = self._execute_generic_operation(system, operation, parameters)
+            start = time.perf_counter()
+            status = "error"
+            try:
+                with span(f"systems.{system}.{operation}") as operation_span:
+                    if hasattr(self, method_name):
+                        result = getattr(self, method_name)(parameters)
+                    else:
+                        result = self._execute_generic_operation(system, operation, parameters)
+                    if pagination and isinstance(result, dict) and "pagination" not in result:
+                        result = paginate_result(result, pagination)
+                    annotate(records=result.get("count", 0) if isinstance(result, dict) else 0)
+                status = "success"
+            finally:
+                backend = "odoo" if operation_span.get("odoo_rpcs") else "json"
+                operation_span["backend"] = backend
+                OPERATIONS.inc(system=system, operation=operation, backend=backend, status=status)
+                OPERATION_DURATION.observe(time.perf_counter() - start, system=system, operation=operation)
             
             return {
                 "success": True,
-                "result": result,
+                "result": to_plain(result),
                 "system": system,
                 "operation": operation,
-                "agent": self.name
+                "agent": self.name,
+                "data_version": self.data_version
             }
             
         except Exception as e:
@@ -127,21 +651,73 @@ class SystemsAgent:
                 "instruction": instruction
             }
 
+    async def aexecute_instruction(self, instruction: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Version asynchrone de execute_instruction
+        
+        Les opérations restent synchrones (XML-RPC Odoo, journal sur disque) mais
+        s'exécutent dans le pool de threads de l'agent : la boucle d'événements
+        reste libre et plusieurs requêtes peuvent être en cours simultanément.
+        
+        Args:
+            instruction: Instruction structurée depuis l'Agent Interface
+            
+        Returns:
+            Dict contenant le résultat de l'exécution
+        """
+        import asyncio  # déjà chargé par la boucle d'événements appelante
+        
+        loop = asyncio.get_running_loop()
+        # Le contexte (spans de la requête en cours) suit l'exécution dans le thread
+        context = copy_context()
+        return await loop.run_in_executor(self._async_executor, context.run, self.execute_instruction, instruction)
+
     # === OPÉRATIONS CRM (Mode Hybride : Odoo + JSON) ===
     
+    @staticmethod
+    def _odoo_page(pagination: Dict[str, Any]) -> Dict[str, Any]:
+        """Paramètres de lecture Odoo (offset, limite, tri, filtre) d'une page demandée"""
+        return {
+            "limit": pagination.get("limit") or 50,
+            "offset": max(0, int(pagination.get("offset", 0))),
+            "order": pagination.get("sort_by"),
+            "descending": bool(pagination.get("descending", False)),
+            "search": str(pagination.get("filter") or "").strip() or None,
+            "with_total": True
+        }
+
+    @staticmethod
+    def _with_odoo_page(response: Dict[str, Any], result: Dict[str, Any],
+                        pagination: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Ajoute au résultat la description de la page lue dans Odoo (total = search_count)"""
+        if not pagination:
+            return response
+        page = SystemsAgent._odoo_page(pagination)
+        response["count"] = result.get("total", result["count"])
+        response["pagination"] = {"offset": page["offset"], "limit": page["limit"], "total": response["count"],
+                                  "sort_by": page["order"], "descending": page["descending"],
+                                  "filter": (page["search"] or "").lower()}
+        return response
+
     def _execute_crm_lister_clients(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Liste tous les clients CRM - Odoo en priorité"""
         if self.use_odoo and self.odoo_connector:
             try:
-                result = self.odoo_connector.get_clients(limit=50)
+                pagination = parameters.get("pagination")
+                if pagination:
+                    # Seule la page demandée est lue dans Odoo (offset, tri, filtre sur le nom)
+                    result = self.odoo_connector.get_clients(**self._odoo_page(pagination))
+                else:
+                    result = self.odoo_connector.get_clients(limit=50)
                 if result["success"]:
-                    return {
+                    response = {
                         "title": "Liste des clients (Odoo)",
                         "count": result["count"],
                         "data": result["clients"],
                         "summary": f"{result['count']} clients trouvés depuis Odoo CRM",
                         "source": "Odoo"
                     }
+                    return self._with_odoo_page(response, result, pagination)
             except Exception as e:
                 print(f"⚠️ Erreur Odoo, fallback JSON: {e}")
         
@@ -204,9 +780,13 @@ class SystemsAgent:
         """Liste toutes les opportunités commerciales - Odoo en priorité"""
         if self.use_odoo and self.odoo_connector:
             try:
-                result = self.odoo_connector.get_opportunites(limit=50)
+                pagination = parameters.get("pagination")
+                if pagination:
+                    result = self.odoo_connector.get_opportunites(**self._odoo_page(pagination))
+                else:
+                    result = self.odoo_connector.get_opportunites(limit=50)
                 if result["success"]:
-                    return {
+                    return self._with_odoo_page({
                         "title": "Liste des opportunités (Odoo)",
                         "count": result["count"],
                         "data": result["opportunites"],
@@ -217,7 +797,7 @@ class SystemsAgent:
                             "valeur_totale": sum(opp.get("valeur_prevue", 0) for opp in result["opportunites"]),
                             "probabilite_moyenne": round(sum(opp.get("probabilite", 0) for opp in result["opportunites"]) / max(1, result["count"]), 1)
                         }
-                    }
+                    }, result, pagination)
             except Exception as e:
                 print(f"⚠️ Erreur Odoo, fallback JSON: {e}")
         
@@ -559,6 +1139,208 @@ class SystemsAgent:
             "summary": f"Entreprise: {len(employes)} employés, {len(departements)} départements, masse salariale: {salaire_total}€"
         }
 
+    def _execute_rh_ajouter_employe(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Ajoute un nouvel employé (journalisé)"""
+        if not parameters.get("nom"):
+            return {
+                "title": "Erreur d'ajout",
+                "count": 0,
+                "data": [],
+                "summary": "Nom de l'employé requis pour l'ajout"
+            }
+        
+        # ID alloué et enregistré sous le même verrou : deux ajouts simultanés n'obtiennent pas le même ID
+        with self._data_lock:
+            employe_id = self._next_id("RH", "employes", "E")
+            employe = {
+                "id": employe_id,
+                "nom": parameters.get("nom", ""),
+                "prenom": parameters.get("prenom", ""),
+                "email": parameters.get("email", ""),
+                "poste": parameters.get("poste", ""),
+                "departement": parameters.get("departement", ""),
+                "manager": parameters.get("manager"),
+                "date_embauche": parameters.get("date_embauche", date.today().isoformat()),
+                "salaire": parameters.get("salaire", 0),
+                "statut": parameters.get("statut", "Actif"),
+                "competences": parameters.get("competences", [])
+            }
+        
+            self._write_record("RH", {"op": "upsert", "collection": "employes", "id": employe_id, "record": employe})
+        
+        return {
+            "title": "Employé ajouté avec succès",
+            "count": 1,
+            "data": [employe],
+            "summary": f"Employé '{employe['nom']}' créé avec l'ID {employe_id}",
+            "metrics": {"nouvel_employe_id": employe_id}
+        }
+
+    def _execute_rh_modifier_employe(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Modifie un employé existant (journalisé)"""
+        employe_id = parameters.get("id") or parameters.get("employe_id")
+        if not employe_id:
+            return {
+                "title": "Erreur de modification",
+                "count": 0,
+                "data": [],
+                "summary": "ID de l'employé requis pour la modification"
+            }
+        
+        # Recherche et écriture sous le même verrou : une suppression concurrente ne peut pas s'intercaler
+        with self._data_lock:
+            employe = self._find_record("RH", "employes", employe_id)
+            if not employe:
+                return {
+                    "title": "Employé non trouvé",
+                    "count": 0,
+                    "data": [],
+                    "summary": f"Aucun employé avec l'ID {employe_id}"
+                }
+        
+            # Données à modifier (seulement les champs fournis)
+            fields = {field: parameters[field] for field in EMPLOYE_FIELDS if field in parameters}
+            if not fields:
+                return {
+                    "title": "Erreur de modification",
+                    "count": 0,
+                    "data": [],
+                    "summary": "Aucun champ à modifier"
+                }
+        
+            employe = self._write_record("RH", {
+                "op": "update", "collection": "employes", "id": employe["id"], "fields": fields
+            })
+        
+        return {
+            "title": "Employé modifié avec succès",
+            "count": 1,
+            "data": [employe],
+            "summary": f"Employé ID {employe['id']} mis à jour avec succès",
+            "metrics": {"employe_modifie": employe["id"]}
+        }
+
+    def _execute_rh_supprimer_employe(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Supprime (archive) un employé : son statut passe à Inactif"""
+        employe_id = parameters.get("id") or parameters.get("employe_id")
+        if not employe_id:
+            return {
+                "title": "Erreur de suppression",
+                "count": 0,
+                "data": [],
+                "summary": "ID de l'employé requis pour la suppression"
+            }
+        
+        # Recherche et écriture sous le même verrou : une suppression concurrente ne peut pas s'intercaler
+        with self._data_lock:
+            employe = self._find_record("RH", "employes", employe_id)
+            if not employe:
+                return {
+                    "title": "Employé non trouvé",
+                    "count": 0,
+                    "data": [],
+                    "summary": f"Aucun employé avec l'ID {employe_id}"
+                }
+        
+            self._write_record("RH", {
+                "op": "update", "collection": "employes", "id": employe["id"], "fields": {"statut": "Inactif"}
+            })
+        
+        return {
+            "title": "Employé archivé avec succès",
+            "count": 1,
+            "data": [{"id": employe["id"], "statut": "Inactif"}],
+            "summary": f"Employé ID {employe['id']} archivé avec succès",
+            "metrics": {"employe_archive": employe["id"]}
+        }
+
+    # === OPÉRATIONS TRANSVERSES (index de relations) ===
+
+    def _execute_rh_activite_employe(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Projets et tâches d'un employé (ex: sur quoi travaille Dubois ?)"""
+        relations = self.relations
+        employes = relations.find_employes(parameters.get("nom", ""), parameters.get("id", ""))
+        
+        if not employes:
+            return {
+                "title": "Employé non trouvé",
+                "count": 0,
+                "data": [],
+                "summary": "Aucun employé correspondant trouvé"
+            }
+        
+        projets = []
+        taches = []
+        for employe in employes:
+            projets.extend(relations.projets_employe(employe["id"]))
+            taches.extend(relations.taches_employe(employe["id"]))
+        
+        noms = ", ".join(f"{e.get('prenom', '')} {e.get('nom', '')}".strip() for e in employes)
+        taches_ouvertes = [t for t in taches if t.get("statut") != "Terminé"]
+        
+        return {
+            "title": f"Activité de {noms}",
+            "count": len(projets),
+            "data": projets,
+            "taches": taches,
+            "summary": f"{noms} : {len(projets)} projet(s), {len(taches)} tâche(s) dont {len(taches_ouvertes)} en cours",
+            "metrics": {
+                "nb_projets": len(projets),
+                "projets_chef": sum(1 for p in projets if p["role"] == "Chef de projet"),
+                "nb_taches": len(taches),
+                "taches_ouvertes": len(taches_ouvertes)
+            }
+        }
+
+    def _execute_rh_equipe_manager(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Collaborateurs directs d'un manager"""
+        relations = self.relations
+        managers = relations.find_employes(parameters.get("nom", ""), parameters.get("id", ""))
+        
+        if not managers:
+            return {
+                "title": "Manager non trouvé",
+                "count": 0,
+                "data": [],
+                "summary": "Aucun manager correspondant trouvé"
+            }
+        
+        manager = managers[0]
+        collaborateurs = relations.collaborateurs(manager["id"])
+        
+        return {
+            "title": f"Équipe de {manager.get('prenom', '')} {manager.get('nom', '')}".strip(),
+            "count": len(collaborateurs),
+            "data": collaborateurs,
+            "summary": f"{len(collaborateurs)} collaborateur(s) direct(s) rattaché(s) à {manager.get('nom', '')}",
+            "metrics": {"nb_collaborateurs": len(collaborateurs)}
+        }
+
+    def _execute_crm_projets_client(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Projets réalisés pour un client"""
+        client_id = parameters.get("client_id") or parameters.get("id")
+        if not client_id:
+            return {
+                "title": "Erreur de recherche",
+                "count": 0,
+                "data": [],
+                "summary": "ID du client requis"
+            }
+        
+        projets = self.relations.projets_client(client_id)
+        budget_total = sum(p.get("budget", 0) for p in projets)
+        
+        return {
+            "title": f"Projets du client {client_id}",
+            "count": len(projets),
+            "data": projets,
+            "summary": f"{len(projets)} projet(s) pour le client {client_id} - Budget total: {budget_total}€",
+            "metrics": {
+                "nb_projets": len(projets),
+                "budget_total": budget_total
+            }
+        }
+
     # === OPÉRATIONS PROJETS ===
     
     def _execute_projets_lister_projets(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -575,7 +1357,6 @@ class SystemsAgent:
     def _execute_projets_statut_projet(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Statut d'un projet spécifique"""
         projets = self.system_data["PROJETS"].get("projets", [])
-        taches = self.system_data["PROJETS"].get("taches", [])
         
         projet_id = parameters.get("id", "")
         nom = parameters.get("nom", "").lower()
@@ -596,8 +1377,8 @@ class SystemsAgent:
                 "summary": "Aucun projet correspondant trouvé"
             }
         
-        # Tâches du projet
-        taches_projet = [t for t in taches if t.get("projet_id") == projet.get("id")]
+        # Tâches du projet (via l'index de relations)
+        taches_projet = self.relations.taches_projet(projet.get("id"))
         
         return {
             "title": f"Statut du projet {projet.get('nom')}",
@@ -642,6 +1423,122 @@ class SystemsAgent:
             }
         }
 
+    def _execute_projets_creer_projet(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Crée un nouveau projet (journalisé)"""
+        if not parameters.get("nom"):
+            return {
+                "title": "Erreur de création",
+                "count": 0,
+                "data": [],
+                "summary": "Nom du projet requis pour la création"
+            }
+        
+        with self._data_lock:
+            projet_id = self._next_id("PROJETS", "projets", "P")
+            projet = {
+                "id": projet_id,
+                "nom": parameters.get("nom", ""),
+                "description": parameters.get("description", ""),
+                "chef_projet": parameters.get("chef_projet"),
+                "client_id": parameters.get("client_id"),
+                "statut": parameters.get("statut", "Planifié"),
+                "priorite": parameters.get("priorite", "Moyenne"),
+                "budget": parameters.get("budget", parameters.get("montant", 0)),
+                "budget_consomme": 0,
+                "date_debut": parameters.get("date_debut", date.today().isoformat()),
+                "date_fin_prevue": parameters.get("date_fin_prevue"),
+                "progression": 0,
+                "equipe": parameters.get("equipe", [])
+            }
+        
+            self._write_record("PROJETS", {"op": "upsert", "collection": "projets", "id": projet_id, "record": projet})
+        
+        return {
+            "title": "Projet créé avec succès",
+            "count": 1,
+            "data": [projet],
+            "summary": f"Projet '{projet['nom']}' créé avec l'ID {projet_id}",
+            "metrics": {"nouveau_projet_id": projet_id}
+        }
+
+    def _execute_projets_modifier_projet(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Modifie un projet existant (journalisé)"""
+        projet_id = parameters.get("id") or parameters.get("projet_id")
+        if not projet_id:
+            return {
+                "title": "Erreur de modification",
+                "count": 0,
+                "data": [],
+                "summary": "ID du projet requis pour la modification"
+            }
+        
+        # Recherche et écriture sous le même verrou : une suppression concurrente ne peut pas s'intercaler
+        with self._data_lock:
+            projet = self._find_record("PROJETS", "projets", projet_id)
+            if not projet:
+                return {
+                    "title": "Projet non trouvé",
+                    "count": 0,
+                    "data": [],
+                    "summary": f"Aucun projet avec l'ID {projet_id}"
+                }
+        
+            # Données à modifier (seulement les champs fournis)
+            fields = {field: parameters[field] for field in PROJET_FIELDS if field in parameters}
+            if "montant" in parameters and "budget" not in fields:
+                fields["budget"] = parameters["montant"]
+            if not fields:
+                return {
+                    "title": "Erreur de modification",
+                    "count": 0,
+                    "data": [],
+                    "summary": "Aucun champ à modifier"
+                }
+        
+            projet = self._write_record("PROJETS", {
+                "op": "update", "collection": "projets", "id": projet["id"], "fields": fields
+            })
+        
+        return {
+            "title": "Projet modifié avec succès",
+            "count": 1,
+            "data": [projet],
+            "summary": f"Projet ID {projet['id']} mis à jour avec succès",
+            "metrics": {"projet_modifie": projet["id"]}
+        }
+
+    def _execute_projets_supprimer_projet(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Supprime un projet (journalisé)"""
+        projet_id = parameters.get("id") or parameters.get("projet_id")
+        if not projet_id:
+            return {
+                "title": "Erreur de suppression",
+                "count": 0,
+                "data": [],
+                "summary": "ID du projet requis pour la suppression"
+            }
+        
+        # Recherche et écriture sous le même verrou : une suppression concurrente ne peut pas s'intercaler
+        with self._data_lock:
+            projet = self._find_record("PROJETS", "projets", projet_id)
+            if not projet:
+                return {
+                    "title": "Projet non trouvé",
+                    "count": 0,
+                    "data": [],
+                    "summary": f"Aucun projet avec l'ID {projet_id}"
+                }
+        
+            self._write_record("PROJETS", {"op": "delete", "collection": "projets", "id": projet["id"]})
+        
+        return {
+            "title": "Projet supprimé avec succès",
+            "count": 1,
+            "data": [{"id": projet["id"], "statut": "supprimé"}],
+            "summary": f"Projet ID {projet['id']} supprimé avec succès",
+            "metrics": {"projet_supprime": projet["id"]}
+        }
+
     def _execute_generic_operation(self, system: str, operation: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Opération générique pour les cas non couverts"""
         data = self.system_data.get(system, {})
@@ -686,7 +1583,10 @@ def test_systems_agent():
     for instruction in test_instructions:
         result = agent.execute_instruction(instruction)
         print(f"\nInstruction: {instruction}")
-        print(f"Résultat: {json.dumps(result, indent=2, ensure_ascii=False)}")
+        print(f"Résultat: {dumps(result, indent=True)}")
+    
+    print("\n=== Indicateurs du tableau de bord ===")
+    print(dumps(agent.refresh_kpis(), indent=True))
 
 
 if __name__ == "__main__":
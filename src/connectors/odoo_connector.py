@@ -6,12 +6,57 @@ import xmlrpc.client
 import json
 import sys
 import os
+import threading
+import time
 from typing import Dict, Any, List, Optional, Union
 
 # Ajouter le répertoire racine au path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from config_odoo import get_odoo_config, validate_odoo_config, ODOO_MODELS, ODOO_FIELDS
+from src.utils.telemetry import span, annotate, increment
+from src.utils.metrics import ODOO_RPCS, ODOO_RPC_DURATION
+
+# Champs de tri : nom dans notre format -> champ Odoo (tri délégué à Odoo pour la pagination)
+CLIENT_ORDER_FIELDS = {
+    "id": "id", "nom": "name", "email": "email", "telephone": "phone",
+    "pays": "country_id", "est_entreprise": "is_company"
+}
+OPPORTUNITE_ORDER_FIELDS = {
+    "id": "id", "titre": "name", "client_nom": "partner_id", "etape": "stage_id",
+    "probabilite": "probability", "valeur_prevue": "expected_revenue",
+    "date_echeance": "date_deadline", "date_creation": "create_date", "responsable": "user_id"
+}
+
+
+class TimedObjectProxy:
+    """
+    Proxy du service des objets d'Odoo chronométrant chaque appel RPC
+    
+    Chaque execute_kw ouvre un span odoo.<modèle>.<méthode> (taille de la requête
+    XML-RPC, nombre d'enregistrements reçus), incrémente odoo_rpcs sur le span
+    englobant (l'opération de l'Agent Systèmes) et alimente les métriques
+    d'appels Odoo (nombre, erreurs, durée).
+    """
+    
+    def __init__(self, proxy: xmlrpc.client.ServerProxy):
+        self._proxy = proxy
+    
+    def execute_kw(self, database: str, uid: int, password: str, model: str, method: str,
+                   args: List, kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        params = (database, uid, password, model, method, args) + ((kwargs,) if kwargs is not None else ())
+        increment("odoo_rpcs")
+        start = time.perf_counter()
+        status = "error"
+        try:
+            with span(f"odoo.{model}.{method}", request_bytes=len(xmlrpc.client.dumps(params, "execute_kw"))):
+                result = self._proxy.execute_kw(*params)
+                annotate(records=len(result) if isinstance(result, list) else 1)
+            status = "success"
+            return result
+        finally:
+            ODOO_RPCS.inc(model=model, method=method, status=status)
+            ODOO_RPC_DURATION.observe(time.perf_counter() - start, model=model, method=method)
 
 
 class OdooConnector:
@@ -28,14 +73,27 @@ class OdooConnector:
         """
         self.config = get_odoo_config(use_test)
         self.uid = None
-        self.models = None
         self.common = None
         self.is_connected = False
+        # Proxy du service des objets : un par thread (ServerProxy n'est pas thread-safe)
+        self._object_url = None
+        self._local = threading.local()
         
         # Valider la configuration
         if not validate_odoo_config(self.config):
             raise ValueError("Configuration Odoo invalide")
     
+    @property
+    def models(self) -> Optional[TimedObjectProxy]:
+        """Proxy (chronométré) du service des objets propre au thread courant (None si non connecté)"""
+        if self._object_url is None:
+            return None
+        proxy = getattr(self._local, "models", None)
+        if proxy is None or self._local.url != self._object_url:
+            proxy = self._local.models = TimedObjectProxy(xmlrpc.client.ServerProxy(self._object_url))
+            self._local.url = self._object_url
+        return proxy
+    
     def connect(self) -> bool:
         """
         Établit la connexion avec Odoo
@@ -67,8 +125,8 @@ class OdooConnector:
                 print("❌ Échec de l'authentification")
                 return False
             
-            # Connexion au service des objets
-            self.models = xmlrpc.client.ServerProxy(object_url)
+            # Connexion au service des objets (proxy créé à la demande dans chaque thread)
+            self._object_url = object_url
             
             print(f"✅ Connexion réussie - UID: {self.uid}")
             self.is_connected = True
@@ -118,7 +176,7 @@ class OdooConnector:
             }
     
     def search_records(self, model: str, domain: List = None, fields: List[str] = None, 
-                      limit: int = 100) -> Dict[str, Any]:
+                      limit: int = 100, offset: int = 0, order: Optional[str] = None) -> Dict[str, Any]:
         """
         Recherche des enregistrements dans Odoo
         
@@ -127,6 +185,8 @@ class OdooConnector:
             domain: Domaine de recherche (filtres)
             fields: Champs à récupérer
             limit: Nombre maximum d'enregistrements
+            offset: Nombre d'enregistrements à sauter (pagination)
+            order: Tri Odoo (ex: 'name asc')
             
         Returns:
             Dict avec les résultats
@@ -142,7 +202,7 @@ class OdooConnector:
             record_ids = self.models.execute_kw(
                 self.config['database'], self.uid, self.config['password'],
                 model, 'search',
-                [domain], {'limit': limit}
+                [domain], {'limit': limit, 'offset': offset, **({'order': order} if order else {})}
             )
             
             if not record_ids:
@@ -171,12 +231,31 @@ class OdooConnector:
                 "error": f"Erreur lors de la recherche: {str(e)}"
             }
     
-    def get_clients(self, limit: int = 50) -> Dict[str, Any]:
+    def _order(self, field: Optional[str], mapping: Dict[str, str], descending: bool) -> Optional[str]:
+        """Clause de tri Odoo pour un champ de notre format (None si le champ n'est pas triable côté Odoo)"""
+        odoo_field = mapping.get(field) if field else None
+        return f"{odoo_field} {'desc' if descending else 'asc'}" if odoo_field else None
+
+    def _count(self, model: str, domain: List) -> int:
+        """Nombre total d'enregistrements correspondant au domaine (pagination)"""
+        return self.models.execute_kw(
+            self.config['database'], self.uid, self.config['password'],
+            model, 'search_count', [domain]
+        )
+
+    def get_clients(self, limit: int = 50, offset: int = 0, order: Optional[str] = None,
+                    descending: bool = False, search: Optional[str] = None,
+                    with_total: bool = False) -> Dict[str, Any]:
         """
         Récupère la liste des clients depuis Odoo
         
         Args:
             limit: Nombre maximum de clients
+            offset: Nombre de clients à sauter (pagination)
+            order: Champ de tri (nom de notre format : nom, email, pays...)
+            descending: Tri décroissant
+            search: Filtre sur le nom (ilike)
+            with_total: Ajoute "total" (search_count) au résultat
             
         Returns:
             Dict avec les clients
@@ -185,16 +264,22 @@ class OdooConnector:
             return {"success": False, "error": "Non connecté à Odoo"}
         
         try:
+            domain = [('name', 'ilike', search)] if search else []  # Domain vide = tous les enregistrements
+            options = {
+                'fields': ['id', 'name', 'email', 'phone', 'street', 'city', 
+                          'country_id', 'is_company'],  # Enlever mobile et customer_rank qui n'existent pas
+                'limit': limit
+            }
+            if offset:
+                options['offset'] = offset
+            sort = self._order(order, CLIENT_ORDER_FIELDS, descending)
+            if sort:
+                options['order'] = sort
             # Utiliser search_read directement pour plus d'efficacité
             records = self.models.execute_kw(
                 self.config['database'], self.uid, self.config['password'],
                 'res.partner', 'search_read',
-                [[]],  # Domain vide = tous les enregistrements
-                {
-                    'fields': ['id', 'name', 'email', 'phone', 'street', 'city', 
-                              'country_id', 'is_company'],  # Enlever mobile et customer_rank qui n'existent pas
-                    'limit': limit
-                }
+                [domain], options
             )
             
             # Formatage pour compatibilité avec notre interface
@@ -228,11 +313,14 @@ class OdooConnector:
                 }
                 formatted_clients.append(client)
             
-            return {
+            response = {
                 "success": True,
                 "count": len(formatted_clients),
                 "clients": formatted_clients
             }
+            if with_total:
+                response["total"] = self._count('res.partner', domain)
+            return response
             
         except Exception as e:
             return {
@@ -240,20 +328,30 @@ class OdooConnector:
                 "error": f"Erreur lors de la récupération des clients: {str(e)}"
             }
     
-    def get_opportunites(self, limit: int = 50) -> Dict[str, Any]:
+    def get_opportunites(self, limit: int = 50, offset: int = 0, order: Optional[str] = None,
+                         descending: bool = False, search: Optional[str] = None,
+                         with_total: bool = False) -> Dict[str, Any]:
         """
         Récupère la liste des opportunités depuis Odoo
         
         Args:
             limit: Nombre maximum d'opportunités
+            offset: Nombre d'opportunités à sauter (pagination)
+            order: Champ de tri (nom de notre format : titre, probabilite, valeur_prevue...)
+            descending: Tri décroissant
+            search: Filtre sur le titre (ilike)
+            with_total: Ajoute "total" (search_count) au résultat
             
         Returns:
             Dict avec les opportunités
         """
         # Domain pour les opportunités (type = 'opportunity')
         domain = [('type', '=', 'opportunity')]
+        if search:
+            domain.append(('name', 'ilike', search))
         
-        result = self.search_records('crm.lead', domain, limit=limit)
+        result = self.search_records('crm.lead', domain, limit=limit, offset=offset,
+                                     order=self._order(order, OPPORTUNITE_ORDER_FIELDS, descending))
         
         if result["success"]:
             # Formatage pour compatibilité
@@ -277,11 +375,17 @@ class OdooConnector:
                 }
                 formatted_opps.append(opp)
             
-            return {
+            response = {
                 "success": True,
                 "count": len(formatted_opps),
                 "opportunites": formatted_opps
             }
+            if with_total:
+                try:
+                    response["total"] = self._count('crm.lead', domain)
+                except Exception as e:
+                    return {"success": False, "error": f"Erreur lors du comptage des opportunités: {str(e)}"}
+            return response
         
         return result
     
@@ -605,11 +709,44 @@ class OdooConnector:
                 "error": f"Erreur lors de la recherche: {str(e)}"
             }
     
+    def get_pipeline_summary(self) -> Dict[str, Any]:
+        """
+        Agrégats du pipeline commercial calculés par Odoo (read_group) : nombre
+        d'opportunités, valeur prévue totale et probabilité moyenne, sans lire
+        les opportunités une à une
+
+        Returns:
+            Dict avec count, valeur_totale et probabilite_moyenne
+        """
+        if not self.is_connected:
+            return {"success": False, "error": "Non connecté à Odoo"}
+
+        try:
+            groups = self.models.execute_kw(
+                self.config['database'], self.uid, self.config['password'],
+                'crm.lead', 'read_group',
+                [[('type', '=', 'opportunity')], ['expected_revenue:sum', 'probability:avg'], []],
+                {'lazy': False}
+            )
+            group = groups[0] if groups else {}
+            return {
+                "success": True,
+                "count": group.get("__count", 0),
+                "valeur_totale": group.get("expected_revenue") or 0,
+                "probabilite_moyenne": round(group.get("probability") or 0, 1)
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Erreur lors du calcul du pipeline: {str(e)}"
+            }
+
     def disconnect(self):
         """Ferme la connexion"""
         self.is_connected = False
         self.uid = None
-        self.models = None
+        self._object_url = None
         self.common = None
         print("🔌 Déconnexion d'Odoo")
 
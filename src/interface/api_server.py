@@ -0,0 +1,280 @@
+"""
+API HTTP/JSON sans interface - Expose le workflow multi-agents aux autres services
+Serveur de la bibliothèque standard : pool de workers borné, délais, keep-alive, arrêt propre
+
+Routes :
+    POST /v1/requests       {"prompt": "..."}                                  -> process_user_request
+    POST /v1/instructions   {"system": ..., "operation": ..., "parameters": {}} -> execute_instruction
+    GET  /health            200 en service, 503 pendant l'arrêt (retrait du répartiteur de charge)
+    GET  /metrics           métriques au format Prometheus
+"""
+
+import argparse
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config import API_CONFIG
+from src.utils.serialization import dumps, loads
+from src.utils.metrics import CONTENT_TYPE, METRICS
+
+API_REQUESTS = METRICS.counter(
+    "connectis_api_requests_total", "Requêtes HTTP reçues par l'API", ("route", "code"))
+API_REQUEST_DURATION = METRICS.histogram(
+    "connectis_api_request_duration_seconds", "Durée des requêtes HTTP de l'API", ("route",))
+
+
+class ServerOverloaded(Exception):
+    """Plus de place dans le pool de workers ni dans sa file d'attente"""
+
+
+class WorkflowAPIServer(ThreadingHTTPServer):
+    """
+    Serveur HTTP du workflow
+
+    Chaque connexion a son thread (lecture, keep-alive) ; le traitement des
+    demandes est confié à un pool de workers borné (API_CONFIG["workers"]),
+    avec une file d'attente limitée : au-delà, la demande est refusée (503)
+    au lieu de s'accumuler. Une demande qui dépasse request_timeout reçoit
+    un 504, son worker reste occupé jusqu'à la fin de l'exécution.
+    """
+
+    daemon_threads = False  # server_close() attend la fin des connexions en cours
+    block_on_close = True
+
+    def __init__(self, address: Tuple[str, int], workflow, config: Dict[str, Any] = API_CONFIG):
+        self.request_queue_size = config["backlog"]
+        super().__init__(address, APIRequestHandler)
+        self.workflow = workflow
+        self.config = config
+        self.draining = threading.Event()
+        self._executor = ThreadPoolExecutor(config["workers"], thread_name_prefix="api-worker")
+        self._slots = threading.BoundedSemaphore(config["workers"] + config["max_pending"])
+
+    def run(self, func: Callable, *args) -> Any:
+        """
+        Exécute func(*args) dans le pool de workers et attend son résultat
+
+        Raises:
+            ServerOverloaded: pool et file d'attente pleins
+            TimeoutError: résultat non disponible après request_timeout secondes
+        """
+        if not self._slots.acquire(blocking=False):
+            raise ServerOverloaded()
+        try:
+            future = self._executor.submit(copy_context().run, func, *args)
+        except RuntimeError:  # pool arrêté
+            self._slots.release()
+            raise ServerOverloaded()
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.config["request_timeout"])
+        except FutureTimeoutError:
+            raise TimeoutError(f"Délai de {self.config['request_timeout']}s dépassé")
+
+    def request_shutdown(self):
+        """
+        Déclenche l'arrêt propre (appelable depuis un gestionnaire de signal)
+
+        /health passe à 503, les connexions persistantes sont fermées après leur
+        réponse en cours, puis la boucle d'acceptation s'arrête.
+        """
+        self.draining.set()
+        # shutdown() attend la fin de serve_forever() : jamais depuis son propre thread
+        threading.Thread(target=self.shutdown, name="api-shutdown", daemon=True).start()
+
+    def server_close(self):
+        """Ferme le socket, attend les connexions puis les demandes en cours"""
+        self.draining.set()
+        super().server_close()
+        self._executor.shutdown(wait=True)
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    """Routage et (dé)sérialisation JSON des requêtes de l'API"""
+
+    protocol_version = "HTTP/1.1"  # connexions persistantes (keep-alive) par défaut
+    server_version = "ConnectisAPI/1.0"
+    # En-têtes et corps sont écrits séparément : sans TCP_NODELAY, Nagle et l'ACK
+    # retardé ajoutent ~40ms à chaque réponse sur une connexion persistante
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        # Délai de lecture du socket : ferme les connexions persistantes inactives
+        self.timeout = self.server.config["keepalive_timeout"]
+        super().setup()
+
+    def do_GET(self):
+        self._started = time.perf_counter()
+        route = self.path.split("?", 1)[0]
+        if route == "/health":
+            if self.server.draining.is_set():
+                self._send_json(503, {"status": "draining"}, route)
+            else:
+                self._send_json(200, {"status": "ok"}, route)
+        elif route == "/metrics":
+            self._send(200, METRICS.render().encode("utf-8"), CONTENT_TYPE, route)
+        elif route in POST_ROUTES:
+            self._send_json(405, {"error": "Méthode non autorisée"}, route)
+        else:
+            self._send_json(404, {"error": f"Route inconnue: {route}"}, "other")
+
+    def do_POST(self):
+        self._started = time.perf_counter()
+        route = self.path.split("?", 1)[0]
+        handler = POST_ROUTES.get(route)
+        if handler is None:
+            self._send_json(404, {"error": f"Route inconnue: {route}"}, "other")
+            return
+        if self.server.draining.is_set():
+            self._send_json(503, {"error": "Serveur en cours d'arrêt"}, route)
+            return
+        payload = self._read_json(route)
+        if payload is None:
+            return
+        error = handler["validate"](payload)
+        if error:
+            self._send_json(400, {"error": error}, route)
+            return
+        try:
+            result = self.server.run(handler["call"](self.server.workflow), payload)
+        except ServerOverloaded:
+            self._send_json(503, {"error": "Serveur saturé, réessayez"}, route)
+        except TimeoutError as e:
+            self._send_json(504, {"error": str(e)}, route)
+        except Exception as e:
+            self._send_json(500, {"error": f"Erreur interne: {e}"}, route)
+        else:
+            self._send_json(200, result, route)
+
+    def _read_json(self, route: str) -> Optional[Dict[str, Any]]:
+        """Corps JSON de la requête (objet), ou None après avoir répondu l'erreur"""
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_json(411, {"error": "Content-Length requis"}, route, close=True)
+            return None
+        if length < 0:
+            self._send_json(400, {"error": "Content-Length invalide"}, route, close=True)
+            return None
+        if length > self.server.config["max_body_bytes"]:
+            self._send_json(413, {"error": "Corps de requête trop volumineux"}, route, close=True)
+            return None
+        try:
+            payload = loads(self.rfile.read(length))
+        except ValueError:
+            self._send_json(400, {"error": "JSON invalide"}, route)
+            return None
+        if not isinstance(payload, dict):
+            self._send_json(400, {"error": "Objet JSON attendu"}, route)
+            return None
+        return payload
+
+    def _send_json(self, code: int, payload: Any, route: str, close: bool = False):
+        self._send(code, dumps(payload).encode("utf-8"), "application/json; charset=utf-8", route, close)
+
+    def _send(self, code: int, body: bytes, content_type: str, route: str, close: bool = False):
+        # Pendant l'arrêt, ou si le corps n'a pas été lu, la connexion n'est pas réutilisée
+        if close or self.server.draining.is_set():
+            self.close_connection = True
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+        API_REQUESTS.inc(route=route, code=str(code))
+        API_REQUEST_DURATION.observe(time.perf_counter() - self._started, route=route)
+
+    def log_message(self, format, *args):
+        pass  # pas de journal par requête (voir /metrics)
+
+
+def _validate_request(payload: Dict[str, Any]) -> str:
+    prompt = payload.get("prompt")
+    if not isinstance(prompt, str) or not prompt.strip():
+        return "Champ 'prompt' (texte non vide) requis"
+    return ""
+
+
+def _validate_instruction(payload: Dict[str, Any]) -> str:
+    for field in ("system", "operation"):
+        if not isinstance(payload.get(field), str) or not payload[field]:
+            return f"Champ '{field}' (texte non vide) requis"
+    if not isinstance(payload.get("parameters", {}), dict):
+        return "Champ 'parameters' : objet attendu"
+    return ""
+
+
+POST_ROUTES = {
+    "/v1/requests": {
+        "validate": _validate_request,
+        "call": lambda workflow: lambda payload: workflow.process_user_request(payload["prompt"])
+    },
+    "/v1/instructions": {
+        "validate": _validate_instruction,
+        "call": lambda workflow: lambda payload: workflow.systems_agent.execute_instruction({
+            "action": payload.get("action", payload["operation"]),
+            "system": payload["system"],
+            "operation": payload["operation"],
+            "parameters": payload.get("parameters", {}),
+            "intent": payload.get("intent", "")
+        })
+    }
+}
+
+
+def create_server(host: Optional[str] = None, port: Optional[int] = None, workflow=None,
+                  config: Dict[str, Any] = API_CONFIG) -> WorkflowAPIServer:
+    """
+    Crée le serveur (sans le démarrer)
+
+    Args:
+        host, port: Adresse d'écoute (API_CONFIG par défaut, port 0 = port libre)
+        workflow: Workflow à exposer (instance partagée du processus par défaut)
+    """
+    if workflow is None:
+        from src.workflows.multi_agent_workflow import get_shared_workflow
+        workflow = get_shared_workflow()
+    address = (host or config["host"], config["port"] if port is None else port)
+    return WorkflowAPIServer(address, workflow, config)
+
+
+def serve(host: Optional[str] = None, port: Optional[int] = None, use_odoo: bool = True):
+    """Démarre l'API et bloque jusqu'à SIGINT/SIGTERM, puis s'arrête proprement"""
+    from src.workflows.multi_agent_workflow import get_shared_workflow
+
+    workflow = get_shared_workflow(use_odoo=use_odoo)
+    workflow.graph  # construction du graphe avant la première requête
+    server = create_server(host, port, workflow)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: server.request_shutdown())
+
+    host, port = server.server_address[:2]
+    print(f"🚀 API CONNECT'IS sur http://{host}:{port} "
+          f"({server.config['workers']} workers, délai {server.config['request_timeout']}s)")
+    print("🛑 Pour arrêter: Ctrl+C (les demandes en cours sont terminées)")
+    try:
+        server.serve_forever()
+    finally:
+        print("⏳ Arrêt en cours: fin des demandes en cours...")
+        server.server_close()
+        print("✅ API arrêtée")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API HTTP/JSON du workflow multi-agents")
+    parser.add_argument("--host", default=None, help=f"Adresse d'écoute (défaut: {API_CONFIG['host']})")
+    parser.add_argument("--port", type=int, default=None, help=f"Port (défaut: {API_CONFIG['port']})")
+    parser.add_argument("--json", action="store_true", help="Données JSON locales, sans Odoo")
+    args = parser.parse_args()
+    serve(args.host, args.port, use_odoo=not args.json)
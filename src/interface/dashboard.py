@@ -0,0 +1,76 @@
+"""
+Tableau de bord - Indicateurs clés lus dans le snapshot calculé en arrière-plan par
+l'Agent Systèmes (aucune lecture d'Odoo ni des données à l'affichage)
+"""
+
+import os
+import sys
+from typing import Any, Dict
+
+import streamlit as st
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config import DASHBOARD_CONFIG
+
+
+def _euros(value: Any) -> str:
+    return f"{value:,.0f}€".replace(",", " ")
+
+
+def render_dashboard(agent):
+    """
+    Affiche les indicateurs du dernier snapshot de l'Agent Systèmes
+
+    Le snapshot est recalculé par agent.start_kpi_refresher() : l'affichage
+    ne lit que ce dictionnaire, de taille bornée, quel que soit le volume des
+    données. Tant que le premier calcul n'est pas terminé, un message
+    d'attente est affiché.
+
+    Args:
+        agent: SystemsAgent dont le recalcul des indicateurs est démarré
+    """
+    st.markdown("### 📊 Tableau de bord")
+    snapshot: Dict[str, Any] = agent.kpi_snapshot
+    if snapshot is None:
+        st.info("⏳ Calcul des indicateurs en cours, réessayez dans quelques secondes.")
+        return
+
+    st.caption(f"Indicateurs calculés le {snapshot['computed_at'].replace('T', ' à ')} "
+               f"(actualisés toutes les {DASHBOARD_CONFIG['refresh_interval']:.0f}s)")
+
+    pipeline = snapshot["pipeline"]
+    budget = snapshot["budget"]
+    retards = snapshot["taches_en_retard"]
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("💼 Pipeline", _euros(pipeline["valeur_totale"]),
+                  help=f"{pipeline['nb_opportunites']} opportunité(s) - source {pipeline['source']}")
+    with col2:
+        st.metric("🎯 Probabilité moyenne", f"{pipeline['probabilite_moyenne']}%")
+    with col3:
+        st.metric("💰 Budget consommé", f"{budget['pourcentage_budget']}%",
+                  help=f"{_euros(budget['budget_consomme'])} sur {_euros(budget['budget_total'])}")
+    with col4:
+        st.metric("⏰ Tâches en retard", retards["count"])
+
+    effectifs_col, budget_col = st.columns(2)
+    with effectifs_col:
+        st.markdown(f"#### 👥 Effectifs ({snapshot['effectifs']['total']})")
+        for departement, nombre in snapshot["effectifs"]["par_departement"].items():
+            st.markdown(f"**{departement}** : {nombre}")
+    with budget_col:
+        st.markdown("#### 📁 Consommation des budgets")
+        for projet in budget["projets"]:
+            st.progress(min(projet["pourcentage_budget"], 100) / 100,
+                        text=f"{projet['nom']} : {projet['pourcentage_budget']}% "
+                             f"({_euros(projet['budget_consomme'])} / {_euros(projet['budget'])}) "
+                             f"- avancement {projet['progression']}%")
+
+    st.markdown("#### ⏰ Tâches en retard")
+    if retards["data"]:
+        st.dataframe(retards["data"], use_container_width=True, hide_index=True)
+        if retards["count"] > len(retards["data"]):
+            st.caption(f"{len(retards['data'])} tâches les plus en retard sur {retards['count']}")
+    else:
+        st.success("✅ Aucune tâche en retard")
@@ -0,0 +1,150 @@
+"""
+Tableau de données paginé - Affiche le résultat d'une instruction de lecture dans
+st.dataframe, une page à la fois (pagination, tri et filtre exécutés par l'Agent Systèmes)
+"""
+
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+import streamlit as st
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config import DATA_TABLE_CONFIG
+from src.agents.systems_agent import paginate_result
+from src.interface.streaming import table_rows
+from src.utils.serialization import dumps
+from src.workflows.multi_agent_workflow import WRITE_ACTIONS
+
+# Colonnes affichées en premier (dans cet ordre) quand elles existent dans les données
+PREFERRED_COLUMNS = [
+    "id", "prenom", "nom", "titre", "type", "client_nom", "email", "telephone", "pays", "est_entreprise",
+    "poste", "departement", "etape", "probabilite", "valeur", "valeur_prevue", "statut", "progression",
+    "budget", "budget_consomme", "assignee", "temps_passe", "estimation", "date_debut", "date_fin",
+    "date_fin_prevue", "nb_jours"
+]
+
+NO_SORT = "—"
+
+
+def _read_only(instruction: Dict[str, Any]) -> bool:
+    """Instruction de lecture : peut être ré-exécutée pour lire une autre page"""
+    verb = instruction.get("operation", "").split("_", 1)[0]
+    return instruction.get("action") not in WRITE_ACTIONS and verb not in WRITE_ACTIONS | {"creer"}
+
+
+def _columns(rows: List[Dict[str, Any]]) -> List[str]:
+    """Colonnes des lignes : colonnes usuelles d'abord, puis les autres dans leur ordre d'apparition"""
+    keys = dict.fromkeys(key for row in rows for key in row)
+    preferred = [column for column in PREFERRED_COLUMNS if column in keys]
+    return preferred + [key for key in keys if key not in PREFERRED_COLUMNS]
+
+
+def _table_state(key: str, instruction: Dict[str, Any]) -> Dict[str, Any]:
+    """État du tableau (page, colonnes) ; réinitialisé quand l'instruction affichée change"""
+    signature = dumps(instruction)
+    state = st.session_state.get(key)
+    if state is None or state["signature"] != signature:
+        for suffix in ("filter", "sort", "desc"):
+            st.session_state.pop(f"{key}_{suffix}", None)
+        state = st.session_state[key] = {"signature": signature, "page": 0, "columns": []}
+    return state
+
+
+def _fetch_page(agent, instruction: Dict[str, Any], result_data: Dict[str, Any],
+                pagination: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Page demandée : découpée dans les données déjà reçues pour la vue initiale
+    (première page, sans tri ni filtre), lue par l'Agent Systèmes sinon
+    """
+    initial = not (pagination["offset"] or pagination["sort_by"] or pagination["filter"])
+    if initial and isinstance(result_data.get("data"), list):
+        return paginate_result(result_data, pagination)
+    response = agent.execute_instruction({
+        **instruction,
+        "parameters": {**instruction.get("parameters", {}), "pagination": pagination}
+    })
+    if not response.get("success"):
+        st.error(f"❌ {response.get('error', 'Erreur inconnue')}")
+        return {}
+    return response.get("result", {})
+
+
+def render_data_table(agent, instruction: Dict[str, Any], result_data: Dict[str, Any],
+                      key: str = "data_table", page_size: Optional[int] = None):
+    """
+    Affiche les données d'un résultat dans un tableau paginé
+
+    Pour une instruction de lecture, seule la page visible est demandée à
+    l'Agent Systèmes (paramètre "pagination" : offset, limit, tri, filtre) et
+    rendue ; changer de page, de tri ou de filtre relit une page. Le résultat
+    d'une instruction d'écriture (quelques lignes) est affiché tel quel.
+
+    Args:
+        agent: SystemsAgent qui exécute les lectures de pages
+        instruction: Instruction ayant produit le résultat
+        result_data: Résultat de l'opération ("data" peut être absent : réponse compactée)
+        key: Clé de session du tableau (une par tableau affiché)
+        page_size: Lignes par page (DATA_TABLE_CONFIG par défaut)
+    """
+    if not _read_only(instruction):
+        data = result_data.get("data")
+        if isinstance(data, list) and data:
+            rows = table_rows(data)
+            st.dataframe(rows, column_order=_columns(rows), use_container_width=True, hide_index=True)
+        return
+
+    page_size = page_size or DATA_TABLE_CONFIG["page_size"]
+    state = _table_state(key, instruction)
+
+    # Valeurs des contrôles (session) lues avant leur affichage : la page lue fixe les colonnes proposées au tri
+    needle = st.session_state.get(f"{key}_filter", "").strip()
+    sort_by = st.session_state.get(f"{key}_sort", NO_SORT)
+    pagination = {"offset": state["page"] * page_size, "limit": page_size,
+                  "sort_by": None if sort_by == NO_SORT else sort_by,
+                  "descending": st.session_state.get(f"{key}_desc", False), "filter": needle}
+    page = _fetch_page(agent, instruction, result_data, pagination)
+    total = page.get("count", 0)
+    if total and pagination["offset"] >= total:
+        # Page hors limites (filtre plus restrictif, données supprimées) : dernière page
+        state["page"] = (total - 1) // page_size
+        pagination["offset"] = state["page"] * page_size
+        page = _fetch_page(agent, instruction, result_data, pagination)
+    if not isinstance(page.get("data"), list):
+        return  # résultat sans liste (rapport, erreur) : rien à paginer
+    rows = table_rows(page["data"])
+    if rows and not state["columns"]:
+        state["columns"] = _columns(rows)
+
+    def reset_page():
+        state["page"] = 0
+
+    filter_col, sort_col, desc_col = st.columns([3, 2, 1])
+    with filter_col:
+        st.text_input("🔎 Filtrer", key=f"{key}_filter", on_change=reset_page,
+                      placeholder="Texte recherché dans toutes les colonnes")
+    with sort_col:
+        st.selectbox("Trier par", [NO_SORT] + state["columns"], key=f"{key}_sort", on_change=reset_page)
+    with desc_col:
+        st.checkbox("Décroissant", key=f"{key}_desc", on_change=reset_page)
+
+    if not rows:
+        st.info("🔍 Aucune ligne ne correspond au filtre." if needle else "🔍 Aucune donnée.")
+        return
+    st.dataframe(rows, column_order=state["columns"] or _columns(rows), use_container_width=True, hide_index=True)
+
+    def move(step: int):
+        state["page"] += step
+
+    first = pagination["offset"] + 1
+    last = pagination["offset"] + len(rows)
+    info_col, prev_col, next_col = st.columns([4, 1, 1])
+    with info_col:
+        st.caption(f"Lignes {first}–{last} sur {total}")
+    with prev_col:
+        st.button("◀ Précédent", key=f"{key}_prev", on_click=move, args=(-1,),
+                  disabled=state["page"] == 0, use_container_width=True)
+    with next_col:
+        st.button("Suivant ▶", key=f"{key}_next", on_click=move, args=(1,),
+                  disabled=last >= total, use_container_width=True)
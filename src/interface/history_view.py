@@ -0,0 +1,57 @@
+"""
+Historique de session Streamlit - Historique borné (src/storage/chat_history.py)
+rattaché à la session, affichage par fenêtre et statistiques cumulées
+"""
+
+import os
+import sys
+import uuid
+from datetime import datetime
+from typing import Any, Dict
+
+import streamlit as st
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.storage.chat_history import ChatHistory
+
+
+def session_history(key: str = "chat_history") -> ChatHistory:
+    """Historique de la session Streamlit courante (créé à la première utilisation)"""
+    if key not in st.session_state:
+        st.session_state[key] = ChatHistory(uuid.uuid4().hex)
+    return st.session_state[key]
+
+
+def render_load_more(history: ChatHistory, key: str = "load_more"):
+    """Bouton « afficher plus » quand des messages plus anciens sont masqués (fenêtre agrandie avant le rendu suivant)"""
+    hidden = history.hidden_count()
+    if hidden:
+        st.button(f"⬆️ Afficher les messages précédents ({hidden})", key=key,
+                  on_click=history.load_more, use_container_width=True)
+
+
+def record_query(history: ChatHistory, query: str, result: Dict[str, Any]):
+    """Ajoute une requête à l'historique et met à jour les statistiques de la session"""
+    history.append({"timestamp": datetime.now().strftime("%H:%M:%S"), "query": query, "result": result})
+
+    stats = query_stats()
+    stats["total"] += 1
+    if result.get("success"):
+        stats["success"] += 1
+        if result.get("instruction"):
+            system = result["instruction"].get("system", "Inconnu")
+            stats["systems"][system] = stats["systems"].get(system, 0) + 1
+
+
+def query_stats() -> Dict[str, Any]:
+    """Statistiques cumulées de la session (sans relire l'historique archivé)"""
+    if "query_stats" not in st.session_state:
+        st.session_state.query_stats = {"total": 0, "success": 0, "systems": {}}
+    return st.session_state.query_stats
+
+
+def clear_history(history: ChatHistory):
+    """Vide l'historique et les statistiques de la session"""
+    history.clear()
+    st.session_state.query_stats = {"total": 0, "success": 0, "systems": {}}
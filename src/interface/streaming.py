@@ -0,0 +1,84 @@
+"""
+Affichage en flux - Rend les événements de MultiAgentWorkflow.stream_user_request
+dans Streamlit dès leur réception (analyse du prompt, pages de données, réponse formatée)
+"""
+
+import os
+import sys
+from typing import Any, Dict, List
+
+import streamlit as st
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.utils.serialization import dumps
+
+SYSTEM_ICONS = {"CRM": "👥", "RH": "🏢", "PROJETS": "📋"}
+
+
+def table_rows(rows: List[Any]) -> List[Dict[str, Any]]:
+    """Lignes affichables par st.dataframe (valeurs imbriquées converties en texte JSON)"""
+    table = []
+    for row in rows:
+        if not isinstance(row, dict):
+            row = {"valeur": row}
+        table.append({key: value if isinstance(value, (str, int, float, bool, type(None))) else dumps(value)
+                      for key, value in row.items()})
+    return table
+
+
+def render_stream(workflow, prompt: str, keep: bool = False) -> Dict[str, Any]:
+    """
+    Traite la demande en flux et affiche chaque étape dès qu'elle est disponible
+
+    L'utilisateur voit la demande comprise, puis les données de chaque
+    instruction (tableau complété page par page), puis la réponse formatée,
+    au lieu d'un indicateur d'attente jusqu'à la fin du workflow.
+
+    Args:
+        workflow: MultiAgentWorkflow
+        prompt: Demande de l'utilisateur
+        keep: Conserver l'affichage progressif ; par défaut il est effacé une fois
+              la réponse complète, l'application affichant sa vue finale
+
+    Returns:
+        Réponse finale (même dict que process_user_request)
+    """
+    placeholder = st.empty()
+    response: Dict[str, Any] = {}
+    with placeholder.container():
+        status = st.empty()
+        status.info("🤔 Analyse en cours...")
+        sections: Dict[int, Dict[str, Any]] = {}
+
+        for event in workflow.stream_user_request(prompt):
+            kind = event["event"]
+            if kind == "instruction":
+                requests = ", ".join(f"{instruction['operation']} ({instruction['system']})"
+                                     for instruction in event["instructions"])
+                status.info(f"🔍 Demande comprise : {requests} - interrogation des systèmes...")
+
+            elif kind == "page":
+                section = sections.get(event["index"])
+                if section is None:
+                    # Première page d'une instruction : titre et résumé, puis tableau complété
+                    icon = SYSTEM_ICONS.get(event["system"], "📊")
+                    st.markdown(f"**{icon} {event['title']}**  \n{event['summary']}")
+                    section = sections[event["index"]] = {"rows": [], "table": st.empty()}
+                section["rows"].extend(table_rows(event["rows"]))
+                if section["rows"]:
+                    section["table"].dataframe(section["rows"], use_container_width=True)
+
+            elif kind == "error":
+                st.error(f"❌ {event['error']}")
+
+            elif kind == "response":
+                status.success("✅ Réponse prête")
+                st.markdown(event["formatted_response"])
+
+            elif kind == "done":
+                response = event["response"]
+
+    if not keep:
+        placeholder.empty()
+    return response
@@ -0,0 +1,409 @@
+"""
+Noyau commun des interfaces Streamlit - Feuilles de style (assets/, lues une fois par processus),
+accès au workflow partagé, traitement des demandes et rendus des résultats
+
+Les applications (app*.py) ne gardent que leur thème : configuration de la page,
+feuilles de style, en-tête, barre latérale et pied de page.
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Sequence, Tuple
+
+import streamlit as st
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config import DASHBOARD_CONFIG, METRICS_CONFIG, PREFETCH_CONFIG
+from src.interface.data_table import render_data_table
+from src.interface.history_view import session_history, render_load_more, record_query, query_stats, clear_history
+from src.interface.streaming import render_stream, SYSTEM_ICONS
+from src.storage.chat_history import compact_result
+
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+
+# Demandes associées aux actions rapides des interfaces de conversation
+QUICK_ACTIONS = [
+    "liste tous les clients",
+    "montre-moi les opportunités",
+    "liste des employés",
+    "statut des projets"
+]
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+
+
+# Thème et workflow
+
+@st.cache_data(show_spinner=False)
+def load_css(*names: str) -> str:
+    """
+    Feuilles de style de assets/ concaténées dans l'ordre donné (les suivantes
+    surchargent les précédentes), sans commentaires ni indentation
+
+    Lues et allégées une seule fois par processus, pas à chaque réexécution.
+    """
+    css = "\n".join((ASSETS_DIR / name).read_text(encoding="utf-8") for name in names)
+    return "\n".join(line.strip() for line in _CSS_COMMENT.sub("", css).splitlines() if line.strip())
+
+
+def apply_theme(*names: str):
+    """Injecte les feuilles de style du thème (un seul élément, identique à chaque réexécution)"""
+    st.markdown(f"<style>{load_css(*names)}</style>", unsafe_allow_html=True)
+
+
+@st.cache_resource(show_spinner="🔌 Connexion aux systèmes...")
+def _workflow_resource():
+    """Workflow et connecteurs, créés une seule fois par processus Streamlit (pas à chaque réexécution)"""
+    from src.workflows.multi_agent_workflow import get_shared_workflow
+    workflow = get_shared_workflow()
+    _ = workflow.graph  # graphe compilé avant la première demande (affectation : pas de « magie » Streamlit)
+    if DASHBOARD_CONFIG["enabled"]:
+        workflow.systems_agent.start_kpi_refresher()  # indicateurs du tableau de bord, hors des rendus
+    return workflow
+
+
+def load_workflow(metrics: bool = False):
+    """
+    Workflow multi-agents partagé par toutes les sessions
+
+    Args:
+        metrics: Démarre aussi le serveur /metrics (si METRICS_CONFIG["enabled"])
+
+    Returns:
+        Le workflow, ou None (erreur affichée) s'il n'a pas pu être créé
+    """
+    if metrics and METRICS_CONFIG["enabled"]:
+        from src.utils.metrics import start_metrics_server
+        start_metrics_server()
+    try:
+        return _workflow_resource()  # un échec n'est pas mis en cache : nouvel essai au prochain rendu
+    except Exception as e:
+        st.error(f"Erreur lors du chargement du workflow: {e}")
+        return None
+
+
+def count_session():
+    """Compte la session ouverte (une fois par session) dans les métriques de la plateforme"""
+    if "session_counted" not in st.session_state:
+        from src.utils.metrics import UI_SESSIONS
+        UI_SESSIONS.inc()
+        st.session_state.session_counted = True
+
+
+def start_prefetch(workflow):
+    """
+    Précharge en arrière-plan les réponses des actions rapides (une fois par session) :
+    le premier clic est servi sans attendre le workflow
+    """
+    if workflow and PREFETCH_CONFIG["enabled"] and "prefetch_started" not in st.session_state:
+        from src.workflows.prefetch import get_prefetcher
+        get_prefetcher(workflow).prefetch(QUICK_ACTIONS)
+        st.session_state.prefetch_started = True
+
+
+def _prefetched(workflow, message: str):
+    """Réponse préchargée du message, ou None (message non préchargé ou réponse périmée)"""
+    if not PREFETCH_CONFIG["enabled"] or message not in QUICK_ACTIONS:
+        return None
+    from src.workflows.prefetch import get_prefetcher
+    return get_prefetcher(workflow).take(message)
+
+
+# Interfaces à onglets (requête, historique, statistiques)
+
+def render_query_app(workflow, input_ratio: Tuple[int, int] = (4, 1), banner: bool = True):
+    """
+    En-tête et onglets Requêtes / Historique / Analytics
+
+    Args:
+        workflow: Workflow partagé (load_workflow)
+        input_ratio: Largeurs relatives du champ de saisie et du bouton
+        banner: Titre du résultat dans un bandeau (sinon titre et encadré d'information)
+    """
+    history = session_history("history")  # historique borné, archivé sur disque au-delà de CHAT_HISTORY_CONFIG
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>🔗 Connect'IS</h1>
+        <p>Plateforme d'unification intelligente des systèmes d'information</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    tab1, tab2, tab3 = st.tabs(["💬 Requêtes", "📚 Historique", "📈 Analytics"])
+    with tab1:
+        render_query_interface(workflow, history, input_ratio, banner)
+    with tab2:
+        render_history(history)
+    with tab3:
+        render_statistics()
+
+
+def render_query_interface(workflow, history, input_ratio: Tuple[int, int] = (4, 1), banner: bool = True):
+    """Interface principale de saisie et résultats"""
+    st.markdown("### 💬 Interface de Requête Intelligente")
+
+    # Exemple choisi ailleurs (barre latérale) : placé dans le champ avant sa création
+    if "example_query" in st.session_state:
+        st.session_state.user_input = st.session_state.pop("example_query")
+
+    col1, col2 = st.columns(list(input_ratio))
+    with col1:
+        user_input = st.text_input(
+            "Posez votre question en langage naturel :",
+            placeholder="Ex: Montre-moi tous les clients actifs ou Liste des opportunités",
+            key="user_input"
+        )
+    with col2:
+        st.write("")  # Espacement
+        process_button = st.button("🚀 Analyser", type="primary")
+
+    if process_button and user_input:
+        # Affichage progressif (analyse, données, réponse) pendant le traitement
+        result = render_stream(workflow, user_input)
+
+        # Ajouter à l'historique (réponse compactée, sans les données)
+        record_query(history, user_input, result)
+
+        # Affichage du résultat ; le dernier résultat (compacté) reste affiché aux reruns suivants
+        st.session_state.last_result = compact_result(result)
+        render_result(result, workflow, banner)
+
+    elif process_button and not user_input:
+        st.warning("⚠️ Veuillez saisir une requête.")
+
+    elif st.session_state.get("last_result"):
+        # Rerun (page, tri ou filtre du tableau) : les données sont relues page par page
+        render_result(st.session_state.last_result, workflow, banner)
+
+
+def _format_metric(key: str, value: Any) -> str:
+    """Valeur d'indicateur lisible (montants en euros, pourcentages)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if "budget" in key.lower() or "valeur" in key.lower():
+            return f"{value:,}€".replace(",", " ")
+        if "pourcentage" in key.lower() or "progression" in key.lower():
+            return f"{value}%"
+    return str(value)
+
+
+def render_result(result: Dict[str, Any], workflow, banner: bool = True):
+    """
+    Affiche le résultat d'une requête : statut, titre et résumé, indicateurs,
+    puis les données dans un tableau paginé
+
+    Args:
+        result: Réponse du workflow (complète, ou compactée sans les données)
+        workflow: Workflow partagé, dont l'Agent Systèmes lit les pages du tableau
+        banner: Titre dans un bandeau (sinon titre et encadré d'information)
+    """
+    st.markdown("### 📊 Résultats")
+
+    if not result["success"]:
+        st.markdown(f"""
+        <div class="error-message">
+            <h4>❌ Erreur lors du traitement</h4>
+            <p><strong>Détails :</strong> {result.get("error", "Erreur inconnue")}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+
+    st.markdown("""
+    <div class="success-message">
+        <h4>✅ Requête traitée avec succès</h4>
+    </div>
+    """, unsafe_allow_html=True)
+
+    result_data = result.get("result", {}).get("result", {}) if result.get("result") else {}
+    instruction = result.get("instruction", {})
+    title = result_data.get("title", "Résultat")
+    summary = result_data.get("summary", "")
+    count = result_data.get("count", 0)
+    data = result_data.get("data", [])
+    metrics = result_data.get("metrics", {})
+    heading = "####" if banner else "#####"
+
+    if banner:
+        icon = SYSTEM_ICONS.get(instruction.get("system", ""), "📊")
+        st.markdown(f"""
+        <div style="background: linear-gradient(145deg, #f0f9ff 0%, #e0f2fe 100%);
+                    padding: 1.5rem; border-radius: 12px; border-left: 5px solid #0284c7;
+                    margin: 1rem 0;">
+            <h3 style="color: #0c4a6e !important; margin: 0 0 1rem 0;">{icon} {title}</h3>
+            <p style="color: #0369a1 !important; font-size: 1.1rem; margin: 0;">{summary}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown(f"#### {title}")
+        if summary:
+            st.info(f"📋 {summary}")
+
+    if metrics:
+        st.markdown(f"{heading} 📈 Métriques clés")
+        cols = st.columns(min(len(metrics), 4))
+        for i, (key, value) in enumerate(metrics.items()):
+            with cols[i % 4]:
+                st.metric(key.replace('_', ' ').title(), _format_metric(key, value))
+
+    # Données détaillées : tableau paginé (seule la page visible est lue et rendue)
+    if (isinstance(data, list) and len(data) > 0) or ("data" not in result_data and count):
+        st.markdown(f"{heading} 📝 Données détaillées")
+        render_data_table(workflow.systems_agent, instruction, result_data)
+    elif count == 0 and isinstance(data, list):
+        st.warning("🔍 Aucun résultat trouvé pour cette recherche.")
+
+
+def render_history(history):
+    """Historique des requêtes (fenêtre des plus récentes, plus anciennes à la demande)"""
+    if not len(history):
+        st.info("📝 Aucune requête dans l'historique")
+        return
+
+    st.header("📚 Historique des Requêtes")
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        show_details = st.checkbox("Afficher les détails techniques")
+    with col2:
+        if st.button("🗑️ Vider l'historique"):
+            clear_history(history)
+            st.rerun()
+
+    # Plus récent en premier
+    for entry in reversed(history.window()):
+        with st.expander(f"🕐 {entry['timestamp']} - {entry['query'][:50]}..."):
+            st.markdown(f"**Requête:** {entry['query']}")
+            if entry['result']['success']:
+                st.markdown("**Statut:** ✅ Succès")
+                st.markdown("**Réponse:**")
+                st.markdown(entry['result']['formatted_response'])
+                if show_details and entry['result'].get('instruction'):
+                    st.json(entry['result']['instruction'])
+            else:
+                st.markdown("**Statut:** ❌ Erreur")
+                st.error(entry['result'].get('error', 'Erreur inconnue'))
+
+    render_load_more(history)
+
+
+def render_statistics():
+    """Statistiques d'utilisation de la session"""
+    stats = query_stats()
+    if not stats["total"]:
+        st.info("📊 Aucune statistique disponible")
+        return
+
+    st.header("📈 Statistiques d'Utilisation")
+    success_rate = stats["success"] / stats["total"] * 100
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("📊 Total Requêtes", stats["total"])
+    with col2:
+        st.metric("✅ Requêtes Réussies", stats["success"])
+    with col3:
+        st.metric("📈 Taux de Succès", f"{success_rate:.1f}%")
+
+    if stats["systems"]:
+        st.subheader("📊 Répartition par Système")
+        for system, count in stats["systems"].items():
+            st.markdown(f"• **{system}**: {count} requête(s)")
+
+
+# Interfaces de conversation
+
+def render_messages(history):
+    """Derniers messages de la conversation (les plus anciens sont archivés, affichables à la demande)"""
+    render_load_more(history)
+    for message in history.window():
+        role = "user" if message["role"] == "user" else "assistant"
+        st.markdown(f"""
+        <div class="message message-{role}">
+            <div class="message-bubble">{message["content"]}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+def submit_message():
+    """Met le message saisi en attente de traitement et vide le champ (sinon il serait retraité à chaque réexécution)"""
+    st.session_state.pending_message = st.session_state.user_input
+    st.session_state.user_input = ""
+
+
+def render_message_input():
+    """Champ de saisie du message (traité à la validation via submit_message)"""
+    st.text_input(
+        "Message",
+        placeholder="Demander, créer, rechercher, @ pour mentionner...",
+        key="user_input",
+        label_visibility="collapsed",
+        on_change=submit_message
+    )
+
+
+def render_quick_actions(labels: Sequence[str], key_prefix: str, use_container_width: bool = False):
+    """
+    Boutons des actions rapides (QUICK_ACTIONS, dans le même ordre que labels)
+
+    Args:
+        labels: Libellés des boutons
+        key_prefix: Préfixe des clés des boutons (<préfixe>1, <préfixe>2...)
+    """
+    for i, (column, label, query) in enumerate(zip(st.columns(len(labels)), labels, QUICK_ACTIONS), start=1):
+        with column:
+            if st.button(label, key=f"{key_prefix}{i}", use_container_width=use_container_width):
+                st.session_state.pending_message = query
+
+
+def pop_pending_message() -> str:
+    """Message en attente (saisi ou action rapide), retiré de la session"""
+    return st.session_state.pop("pending_message", "")
+
+
+def process_chat_message(message: str, workflow) -> str:
+    """
+    Traite un message de la conversation et ajoute la demande et la réponse
+    à l'historique de la session
+
+    Returns:
+        Réponse de l'assistant (markdown)
+    """
+    if not workflow:
+        return "❌ Workflow non disponible"
+
+    history = session_history()
+    try:
+        history.append({"role": "user", "content": message})
+
+        # Réponse préchargée sinon affichage progressif (analyse, données, réponse) pendant le traitement
+        result = _prefetched(workflow, message) or render_stream(workflow, message)
+
+        if result.get("success"):
+            response = "✅ **Opération réussie**\n\n"
+
+            data = result.get("data")
+            if isinstance(data, dict) and data.get("count", 0) > 0:
+                response += f"📊 **{data['count']} résultat(s)**\n\n"
+                for item in data.get("data", [])[:3]:
+                    if isinstance(item, dict):
+                        name = item.get("nom", item.get("titre", "Élément"))
+                        response += f"• **{name}**"
+                        if item.get("email"):
+                            response += f" - {item['email']}"
+                        if item.get("id"):
+                            response += f" (ID: {item['id']})"
+                        response += "\n"
+                if len(data.get("data", [])) > 3:
+                    response += f"\n... et {len(data.get('data', [])) - 3} autre(s)\n"
+
+            summary = result.get("summary")
+            if summary:
+                response += f"\n💡 **Résumé**: {summary}"
+        else:
+            response = f"❌ **Erreur**: {result.get('error', 'Erreur inconnue')}"
+
+    except Exception as e:
+        response = f"❌ **Erreur système**: {str(e)}"
+
+    history.append({"role": "assistant", "content": response})
+    return response
@@ -0,0 +1,183 @@
+"""
+Historique de conversation borné - Messages récents en mémoire (compactés),
+messages plus anciens archivés sur disque (JSON Lines) et relus par fenêtre
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config import CHAT_HISTORY_CONFIG
+from src.utils.serialization import loads, dumps
+
+
+def compact_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Version allégée d'une réponse du workflow pour l'historique
+
+    Conserve ce que les vues d'historique affichent (statut, réponse formatée,
+    instruction, titre/résumé/nombre/métriques de chaque résultat) et supprime
+    les tableaux de données, spans et journaux d'exécution.
+    """
+    def compact_systems_result(systems_result: Dict[str, Any]) -> Dict[str, Any]:
+        result_data = systems_result.get("result", {})
+        return {
+            "success": systems_result.get("success", False),
+            "system": systems_result.get("system", ""),
+            "error": systems_result.get("error", ""),
+            "result": {key: result_data[key] for key in ("title", "summary", "count", "metrics") if key in result_data}
+        }
+
+    return {
+        "success": result.get("success", False),
+        "user_input": result.get("user_input", ""),
+        "formatted_response": result.get("formatted_response", ""),
+        "instruction": result.get("instruction", {}),
+        "result": compact_systems_result(result["result"]) if result.get("result") else {},
+        "results": [compact_systems_result(item) for item in result.get("results", [])],
+        "timings": result.get("timings", {}),
+        "error": result.get("error", "")
+    }
+
+
+def purge_archives(history_dir: Union[str, Path, None] = None, ttl: Optional[float] = None,
+                   exclude: Iterable[Union[str, Path]] = ()) -> int:
+    """
+    Supprime les archives de session non modifiées depuis ttl secondes
+
+    Args:
+        exclude: Archives à conserver quel que soit leur âge (session courante)
+
+    Returns:
+        Nombre d'archives supprimées
+    """
+    history_dir = Path(history_dir or CHAT_HISTORY_CONFIG["history_dir"])
+    deadline = time.time() - (ttl if ttl is not None else CHAT_HISTORY_CONFIG["archive_ttl"])
+    excluded = {Path(path).name for path in exclude}
+    removed = 0
+    try:
+        archives = [archive for archive in history_dir.glob("*.jsonl") if archive.name not in excluded]
+    except OSError:
+        return 0
+    for archive in archives:
+        try:
+            if archive.stat().st_mtime < deadline:
+                archive.unlink()
+                removed += 1
+        except FileNotFoundError:
+            pass  # supprimée entre-temps (autre session)
+    return removed
+
+
+class ChatHistory:
+    """
+    Historique d'une session de conversation
+
+    Les max_messages derniers messages restent en mémoire ; les plus anciens
+    sont ajoutés au fichier <session_id>.jsonl et n'en sont relus que si
+    l'utilisateur remonte l'historique. Un message qui porte une réponse du
+    workflow ("result") est compacté à l'ajout (sans tableaux de données).
+
+    Seuls les window derniers messages sont affichés ; load_more() agrandit
+    la fenêtre. Le coût d'un rendu est donc celui de la fenêtre, pas de la
+    longueur de la session.
+
+    Les messages doivent être sérialisables en JSON. À la création d'un
+    historique, les archives des sessions inactives depuis archive_ttl
+    secondes sont supprimées (purge_archives), sauf celle de la session, dont
+    la date de modification est rafraîchie à chaque ajout de message.
+    """
+
+    def __init__(self, session_id: str, history_dir: Union[str, Path, None] = None,
+                 max_messages: Optional[int] = None, window: Optional[int] = None):
+        self.file = Path(history_dir or CHAT_HISTORY_CONFIG["history_dir"]) / f"{session_id}.jsonl"
+        self.max_messages = max_messages or CHAT_HISTORY_CONFIG["max_messages"]
+        self.window_size = window or CHAT_HISTORY_CONFIG["window"]
+        self.visible = self.window_size
+        self.messages: List[Dict[str, Any]] = []
+        # Position de chaque message archivé dans le fichier (lecture d'une fin de fichier sans tout relire)
+        self._offsets: List[int] = []
+        purge_archives(self.file.parent, exclude=(self.file,))
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self.messages)
+
+    @property
+    def archived(self) -> int:
+        """Nombre de messages archivés sur disque"""
+        return len(self._offsets)
+
+    def append(self, message: Dict[str, Any]):
+        """Ajoute un message (compacté) ; archive les plus anciens au-delà de max_messages"""
+        if isinstance(message.get("result"), dict):
+            message = {**message, "result": compact_result(message["result"])}
+        self.messages.append(message)
+        if len(self.messages) > self.max_messages:
+            # Archivage par moitié : une écriture disque toutes les max_messages / 2 réponses
+            self._archive(len(self.messages) - self.max_messages // 2)
+        elif self._offsets:
+            self._touch()
+
+    def _touch(self):
+        """Marque l'archive comme active (non purgée par les autres sessions)"""
+        try:
+            os.utime(self.file)
+        except FileNotFoundError:
+            self._offsets = []
+
+    def _archive(self, count: int):
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.file, "ab") as f:
+            if self._offsets and f.tell() <= self._offsets[-1]:
+                # Archive purgée (puis recréée) depuis le dernier archivage : positions caduques
+                self._offsets = []
+            for message in self.messages[:count]:
+                self._offsets.append(f.tell())
+                f.write((dumps(message) + "\n").encode("utf-8"))
+        del self.messages[:count]
+
+    def _read_archived(self, start: int) -> List[Dict[str, Any]]:
+        """Messages archivés à partir de l'indice start"""
+        if start >= len(self._offsets):
+            return []
+        try:
+            with open(self.file, "rb") as f:
+                f.seek(self._offsets[start])
+                return [loads(line) for line in f.read().splitlines() if line]
+        except FileNotFoundError:
+            # Archive purgée (session restée inactive au-delà de archive_ttl) : messages anciens perdus
+            self._offsets = []
+            return []
+
+    def window(self) -> List[Dict[str, Any]]:
+        """Messages visibles (les plus anciens en premier)"""
+        if self.visible <= len(self.messages):
+            return self.messages[-self.visible:] if self.visible else []
+        start = max(0, len(self) - self.visible)
+        return self._read_archived(start) + self.messages
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Tous les messages de la session, archives comprises"""
+        return self._read_archived(0) + self.messages
+
+    def hidden_count(self) -> int:
+        """Messages plus anciens que la fenêtre affichée"""
+        return max(0, len(self) - self.visible)
+
+    def load_more(self, step: Optional[int] = None):
+        """Agrandit la fenêtre de step messages plus anciens"""
+        self.visible = min(len(self), self.visible + (step or CHAT_HISTORY_CONFIG["load_more_step"]))
+
+    def clear(self):
+        """Vide l'historique (mémoire et archive)"""
+        self.messages = []
+        self._offsets = []
+        self.visible = self.window_size
+        try:
+            self.file.unlink()
+        except FileNotFoundError:
+            pass
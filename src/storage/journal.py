@@ -0,0 +1,203 @@
+"""
+Journal append-only - Persistance incrémentale des écritures RH/Projets
+Chaque écriture ajoute une ligne au journal ; le fichier JSON complet n'est
+réécrit que lors de la compaction (snapshot atomique + remise à zéro du journal)
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Union, Callable, Optional
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.utils.serialization import loads, dumps
+
+
+class DataJournal:
+    """
+    Journal append-only d'un système JSON
+
+    Format : une entrée JSON par ligne
+        {"op": "upsert", "collection": "employes", "id": "E006", "record": {...}}
+        {"op": "update", "collection": "projets", "id": "P001", "fields": {...}}
+        {"op": "delete", "collection": "projets", "id": "P003"}
+
+    Les entrées sont idempotentes : rejouer un journal déjà intégré au
+    snapshot (crash entre le snapshot et la remise à zéro) est sans effet.
+    """
+
+    def __init__(self, journal_file: Union[str, Path], fsync_batch: int = 16,
+                 fsync_interval: float = 1.0):
+        """
+        Args:
+            journal_file: Chemin du fichier journal
+            fsync_batch: Nombre d'entrées entre deux fsync
+            fsync_interval: Délai maximum (secondes) entre deux fsync
+        """
+        self.journal_file = Path(journal_file)
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self.entry_count = 0
+
+    def _open(self):
+        if self._file is None:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.journal_file, "a", encoding="utf-8")
+        return self._file
+
+    def append(self, entry: Dict[str, Any]):
+        """
+        Ajoute une entrée au journal
+
+        La ligne est écrite et flushée immédiatement (survit à un crash du
+        processus) ; le fsync est groupé par lots (survit à une coupure). Un
+        lot incomplet est synchronisé au plus tard fsync_interval secondes
+        après sa première entrée, même sans écriture suivante.
+        """
+        line = dumps(entry) + "\n"
+        with self._lock:
+            f = self._open()
+            f.write(line)
+            f.flush()
+            self._pending += 1
+            self.entry_count += 1
+            if self._pending >= self.fsync_batch or \
+               time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._fsync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.fsync_interval, self.sync)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _fsync(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._file is not None and self._pending:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """Force l'écriture sur disque des entrées en attente"""
+        with self._lock:
+            self._fsync()
+
+    def replay(self) -> List[Dict[str, Any]]:
+        """
+        Relit toutes les entrées du journal
+
+        Une dernière ligne tronquée (crash pendant l'écriture) est ignorée.
+        """
+        entries = []
+        try:
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(loads(line))
+                    except ValueError:
+                        print(f"⚠️ Entrée de journal illisible ignorée dans {self.journal_file}")
+        except FileNotFoundError:
+            pass
+        self.entry_count = len(entries)
+        return entries
+
+    def compact(self, snapshot_file: Union[str, Path], data: Dict[str, Any]):
+        """
+        Écrit un snapshot complet des données puis vide le journal
+
+        Le snapshot est écrit dans un fichier temporaire, synchronisé puis
+        substitué atomiquement au fichier snapshot_file.
+        """
+        snapshot_file = Path(snapshot_file)
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = snapshot_file.with_name(snapshot_file.name + ".tmp")
+
+        with self._lock:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write(dumps(data, indent=True))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, snapshot_file)
+
+            self._fsync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            with open(self.journal_file, "w", encoding="utf-8") as f:
+                f.flush()
+                os.fsync(f.fileno())
+            self.entry_count = 0
+
+    def close(self):
+        """Synchronise et ferme le journal"""
+        with self._lock:
+            self._fsync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def apply_entry(data: Dict[str, Any], entry: Dict[str, Any],
+                factories: Optional[Dict[str, Callable[[Dict[str, Any]], Any]]] = None,
+                positions: Optional[Dict[Any, int]] = None) -> Dict[str, Any]:
+    """
+    Applique une entrée de journal sur les données d'un système (en place)
+
+    Args:
+        data: Données du système
+        entry: Entrée de journal
+        factories: Constructeur d'enregistrement par collection (dict par défaut)
+        positions: Position de chaque enregistrement de la collection par ID,
+            tenue à jour ; sans elle, l'enregistrement est recherché par parcours
+
+    Returns:
+        L'enregistrement résultant (vide pour une suppression)
+    """
+    factory = (factories or {}).get(entry["collection"], dict)
+    records = data.setdefault(entry["collection"], [])
+    record_id = entry["id"]
+    if positions is None:
+        index = next((i for i, r in enumerate(records) if r.get("id") == record_id), None)
+    else:
+        index = positions.get(record_id)
+
+    op = entry["op"]
+    if op == "upsert":
+        record = factory(entry["record"])
+        if index is None:
+            records.append(record)
+            if positions is not None:
+                positions[record_id] = len(records) - 1
+        else:
+            records[index] = record
+        return record
+    if op == "update":
+        if index is None:
+            return {}
+        fields = dict(records[index])
+        fields.update(entry["fields"])
+        record = factory(fields)
+        records[index] = record
+        return record
+    if op == "delete":
+        if index is not None:
+            del records[index]
+            if positions is not None:
+                del positions[record_id]
+                for shifted in records[index:]:
+                    positions[shifted.get("id")] -= 1
+        return {}
+
+    raise ValueError(f"Opération de journal inconnue: {op}")
@@ -0,0 +1,162 @@
+"""
+Enregistrements compacts - Représentation mémoire des employés, projets et tâches
+Classes à __slots__ (pas de dict par ligne) avec champs énumérés internés ;
+la conversion en dict n'a lieu qu'à la frontière des réponses
+"""
+
+import sys
+from typing import Dict, Any, Iterator, List
+
+
+class CompactRecord:
+    """
+    Enregistrement à __slots__ exposant l'API de lecture d'un dict
+
+    get(), [], in, keys() et items() se comportent comme sur le dict source,
+    ce qui permet au code existant (et à {**record}) de fonctionner tel quel ;
+    une copie par {**record} garde cependant les tuples des champs listes.
+    Les champs inconnus sont conservés dans _extra.
+    """
+
+    __slots__ = ("_extra",)
+
+    FIELDS: tuple = ()
+    # Champs à faible cardinalité partagés entre enregistrements (statut, département...)
+    INTERNED: frozenset = frozenset()
+    # Champs listes stockés en tuples de chaînes internées
+    SEQUENCES: frozenset = frozenset()
+    _FIELD_SET: frozenset = frozenset()
+    _MISSING = object()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, data: Dict[str, Any]):
+        extra = None
+        for key, value in data.items():
+            if key in self._FIELD_SET:
+                if key in self.INTERNED and isinstance(value, str):
+                    value = sys.intern(value)
+                elif key in self.SEQUENCES and isinstance(value, list):
+                    value = tuple(sys.intern(v) if isinstance(v, str) else v for v in value)
+                object.__setattr__(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "CompactRecord":
+        """Convertit un dict (ou renvoie tel quel un enregistrement déjà compact)"""
+        if isinstance(data, cls):
+            return data
+        return cls(data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra:
+            return self._extra.get(key, default)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, self._MISSING)
+        if value is self._MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, self._MISSING) is not self._MISSING
+
+    def keys(self) -> List[str]:
+        keys = [field for field in self.FIELDS if hasattr(self, field)]
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+
+    def items(self) -> Iterator:
+        for key in self.keys():
+            yield key, self[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CompactRecord):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict équivalent au JSON source (tuples reconvertis en listes)"""
+        result = {}
+        for field in self.FIELDS:
+            value = getattr(self, field, self._MISSING)
+            if value is self._MISSING:
+                continue
+            result[field] = list(value) if field in self.SEQUENCES and isinstance(value, tuple) else value
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Employe(CompactRecord):
+    FIELDS = ("id", "nom", "prenom", "email", "poste", "departement", "manager",
+              "date_embauche", "salaire", "statut", "competences")
+    INTERNED = frozenset({"poste", "departement", "manager", "statut"})
+    SEQUENCES = frozenset({"competences"})
+    __slots__ = FIELDS
+
+
+class Projet(CompactRecord):
+    FIELDS = ("id", "nom", "description", "chef_projet", "client_id", "statut", "priorite",
+              "budget", "budget_consomme", "date_debut", "date_fin_prevue", "progression", "equipe")
+    INTERNED = frozenset({"chef_projet", "client_id", "statut", "priorite"})
+    SEQUENCES = frozenset({"equipe"})
+    __slots__ = FIELDS
+
+
+class Tache(CompactRecord):
+    FIELDS = ("id", "projet_id", "titre", "description", "assignee", "statut", "priorite",
+              "estimation", "temps_passe", "date_creation", "date_echeance", "date_completion")
+    INTERNED = frozenset({"projet_id", "assignee", "statut", "priorite"})
+    __slots__ = FIELDS
+
+
+# Type d'enregistrement par collection JSON
+RECORD_TYPES = {
+    "employes": Employe,
+    "projets": Projet,
+    "taches": Tache
+}
+
+
+def compact_collections(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convertit en place les collections connues d'un système en enregistrements compacts"""
+    for collection, record_type in RECORD_TYPES.items():
+        records = data.get(collection)
+        if isinstance(records, list):
+            data[collection] = [
+                record_type.from_dict(r) if isinstance(r, (dict, CompactRecord)) else r
+                for r in records
+            ]
+    return data
+
+
+def to_plain(value: Any) -> Any:
+    """Convertit récursivement les enregistrements compacts en dicts (frontière de réponse)"""
+    if isinstance(value, CompactRecord):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        # Tuples : champs listes d'un enregistrement copié par {**record}
+        return [to_plain(item) for item in value]
+    return value
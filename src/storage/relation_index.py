@@ -0,0 +1,182 @@
+"""
+Index de relations - Graphe précalculé entre employés, projets, tâches et clients
+Évite les parcours imbriqués pour les questions transverses (RH x PROJETS x CRM)
+"""
+
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class RelationIndex:
+    """
+    Index des relations entre systèmes, construit au chargement des données et
+    tenu à jour enregistrement par enregistrement à chaque écriture (update)
+
+    Relations indexées :
+    - employé -> projets (chef de projet ou membre de l'équipe)
+    - employé -> tâches assignées
+    - client -> projets
+    - manager -> collaborateurs directs
+    - projet -> tâches
+    """
+
+    def __init__(self, system_data: Dict[str, Dict[str, Any]], version: int = 0):
+        self.version = version
+
+        rh = system_data.get("RH", {})
+        projets_data = system_data.get("PROJETS", {})
+
+        self.employes: Dict[str, Dict[str, Any]] = {}
+        self.projets: Dict[str, Dict[str, Any]] = {}
+        self.taches: Dict[str, Dict[str, Any]] = {}
+
+        self.employes_par_nom: Dict[str, List[str]] = defaultdict(list)
+        self.projets_par_employe: Dict[str, Dict[str, str]] = defaultdict(dict)
+        self.taches_par_employe: Dict[str, List[str]] = defaultdict(list)
+        self.projets_par_client: Dict[str, List[str]] = defaultdict(list)
+        self.collaborateurs_par_manager: Dict[str, List[str]] = defaultdict(list)
+        self.taches_par_projet: Dict[str, List[str]] = defaultdict(list)
+
+        for employe in rh.get("employes", []):
+            employe_id = employe.get("id")
+            self.employes[employe_id] = employe
+            for name in (employe.get("nom"), employe.get("prenom")):
+                if name:
+                    self.employes_par_nom[name.lower()].append(employe_id)
+            if employe.get("manager"):
+                self.collaborateurs_par_manager[employe["manager"]].append(employe_id)
+
+        for projet in projets_data.get("projets", []):
+            projet_id = projet.get("id")
+            self.projets[projet_id] = projet
+            for membre in projet.get("equipe", []) or []:
+                self.projets_par_employe[membre][projet_id] = "Membre"
+            if projet.get("chef_projet"):
+                self.projets_par_employe[projet["chef_projet"]][projet_id] = "Chef de projet"
+            if projet.get("client_id") is not None:
+                self.projets_par_client[str(projet["client_id"])].append(projet_id)
+
+        for tache in projets_data.get("taches", []):
+            tache_id = tache.get("id")
+            self.taches[tache_id] = tache
+            if tache.get("assignee"):
+                self.taches_par_employe[tache["assignee"]].append(tache_id)
+            if tache.get("projet_id"):
+                self.taches_par_projet[tache["projet_id"]].append(tache_id)
+
+    @staticmethod
+    def _links(collection: str, record: Optional[Dict[str, Any]]) -> Dict[Tuple[str, Any], Any]:
+        """Entrées d'un enregistrement dans les index : (index, clé) -> rôle (projets_par_employe) ou None"""
+        links: Dict[Tuple[str, Any], Any] = {}
+        if not record:
+            return links
+        if collection == "employes":
+            for name in (record.get("nom"), record.get("prenom")):
+                if name:
+                    links[("employes_par_nom", name.lower())] = None
+            if record.get("manager"):
+                links[("collaborateurs_par_manager", record["manager"])] = None
+        elif collection == "projets":
+            for membre in record.get("equipe", []) or []:
+                links[("projets_par_employe", membre)] = "Membre"
+            if record.get("chef_projet"):
+                links[("projets_par_employe", record["chef_projet"])] = "Chef de projet"
+            if record.get("client_id") is not None:
+                links[("projets_par_client", str(record["client_id"]))] = None
+        elif collection == "taches":
+            if record.get("assignee"):
+                links[("taches_par_employe", record["assignee"])] = None
+            if record.get("projet_id"):
+                links[("taches_par_projet", record["projet_id"])] = None
+        return links
+
+    def update(self, collection: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]], version: int):
+        """
+        Répercute l'écriture d'un enregistrement (ajout, modification ou suppression)
+
+        Seules les listes de relations de cet enregistrement sont touchées, et
+        elles sont remplacées plutôt que modifiées : une lecture en cours garde
+        une liste cohérente. Coût proportionnel aux relations de
+        l'enregistrement, pas au volume des données.
+
+        Args:
+            collection: employes, projets ou taches (autres collections ignorées)
+            old: Enregistrement avant l'écriture (None pour un ajout)
+            new: Enregistrement après l'écriture (None pour une suppression)
+            version: Version des données après l'écriture
+        """
+        records = {"employes": self.employes, "projets": self.projets, "taches": self.taches}.get(collection)
+        if records is None:
+            return
+        record_id = (new or old or {}).get("id")
+        old_links = self._links(collection, old)
+        new_links = self._links(collection, new)
+
+        for name, key in old_links:
+            if (name, key) not in new_links:
+                index = getattr(self, name)
+                bucket = index.get(key, ())
+                if isinstance(bucket, dict):
+                    remaining = {i: r for i, r in bucket.items() if i != record_id}
+                else:
+                    remaining = [i for i in bucket if i != record_id]
+                if remaining:
+                    index[key] = remaining
+                else:
+                    index.pop(key, None)
+        for (name, key), role in new_links.items():
+            index = getattr(self, name)
+            bucket = index.get(key)
+            if name == "projets_par_employe":
+                if (bucket or {}).get(record_id) != role:
+                    index[key] = {**(bucket or {}), record_id: role}
+            elif record_id not in (bucket or ()):
+                index[key] = [*(bucket or ()), record_id]
+
+        if new is None:
+            records.pop(record_id, None)
+        else:
+            records[record_id] = new
+        self.version = version
+
+    def find_employes(self, nom: str = "", employe_id: str = "") -> List[Dict[str, Any]]:
+        """Résout des employés par ID exact ou par nom/prénom (exact puis partiel)"""
+        if employe_id:
+            employe = self.employes.get(str(employe_id).upper())
+            return [employe] if employe else []
+
+        nom = nom.lower().strip()
+        if not nom:
+            return []
+        ids = self.employes_par_nom.get(nom)
+        if not ids:
+            # Correspondance partielle : parcours des seules clés de nom
+            ids = [i for key, key_ids in list(self.employes_par_nom.items()) if nom in key for i in key_ids]
+        return [self.employes[i] for i in dict.fromkeys(ids)]
+
+    def projets_employe(self, employe_id: str) -> List[Dict[str, Any]]:
+        """Projets d'un employé, annotés de son rôle"""
+        projets = []
+        for projet_id, role in self.projets_par_employe.get(employe_id, {}).items():
+            projet = self.projets[projet_id]
+            # to_dict : listes (equipe) et non tuples de l'enregistrement compact
+            projet = projet.to_dict() if hasattr(projet, "to_dict") else dict(projet)
+            projet["role"] = role
+            projets.append(projet)
+        return projets
+
+    def taches_employe(self, employe_id: str) -> List[Dict[str, Any]]:
+        return [self.taches[t] for t in self.taches_par_employe.get(employe_id, [])]
+
+    def taches_projet(self, projet_id: str) -> List[Dict[str, Any]]:
+        return [self.taches[t] for t in self.taches_par_projet.get(projet_id, [])]
+
+    def projets_client(self, client_id: Any) -> List[Dict[str, Any]]:
+        return [self.projets[p] for p in self.projets_par_client.get(str(client_id), [])]
+
+    def collaborateurs(self, manager_id: str) -> List[Dict[str, Any]]:
+        return [self.employes[e] for e in self.collaborateurs_par_manager.get(manager_id, [])]
+
+    def manager(self, employe_id: str) -> Optional[Dict[str, Any]]:
+        employe = self.employes.get(employe_id, {})
+        return self.employes.get(employe.get("manager"))
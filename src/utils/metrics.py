@@ -0,0 +1,307 @@
+"""
+Métriques - Registre (compteurs, jauges, histogrammes) au format d'exposition Prometheus
+et serveur HTTP minimal (bibliothèque standard) exposant /metrics
+"""
+
+import math
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config import METRICS_CONFIG
+
+# Bornes (secondes) des histogrammes de latence, comme les clients Prometheus officiels
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(labelnames: Tuple[str, ...], labelvalues: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _Metric:
+    """Base commune : nom, aide, étiquettes et séries protégées par un verrou"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Étiquettes attendues pour {self.name}: {self.labelnames}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            series = sorted(self._series.items())
+        for labelvalues, value in series:
+            lines.extend(self._render_series(labelvalues, value))
+        return lines
+
+    def _render_series(self, labelvalues: Tuple[str, ...], value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """Compteur monotone (ex: requêtes traitées)"""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._series.get(self._key(labels), 0.0)
+
+    def total(self, **match) -> float:
+        """Somme des séries dont les étiquettes données correspondent"""
+        with self._lock:
+            return sum(value for key, value in self._series.items()
+                       if all(key[self.labelnames.index(name)] == str(wanted) for name, wanted in match.items()))
+
+
+class Gauge(_Metric):
+    """Jauge : valeur affectée, ou calculée à la lecture par une fonction (callback)"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 callback: Optional[Callable[[], float]] = None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._series[self._key(labels)] = float(value)
+
+    def value(self, **labels) -> float:
+        if self.callback is not None:
+            return float(self.callback())
+        with self._lock:
+            return self._series.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        if self.callback is None:
+            return super().render()
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge",
+                f"{self.name} {_format_value(self.value())}"]
+
+
+class Histogram(_Metric):
+    """Histogramme cumulatif (bornes en secondes) avec somme et nombre d'observations"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["counts"][index] += 1
+                    break
+            series["sum"] += value
+            series["count"] += 1
+
+    def totals(self, **match) -> Tuple[float, int]:
+        """(somme, nombre) des observations des séries correspondant aux étiquettes données"""
+        with self._lock:
+            selected = [series for key, series in self._series.items()
+                        if all(key[self.labelnames.index(name)] == str(wanted) for name, wanted in match.items())]
+            return sum(s["sum"] for s in selected), sum(s["count"] for s in selected)
+
+    def _render_series(self, labelvalues: Tuple[str, ...], series) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, series["counts"]):
+            cumulative += count
+            labels = _format_labels(self.labelnames, labelvalues, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, labelvalues)
+        lines.append(f"{self.name}_sum{labels} {_format_value(series['sum'])}")
+        lines.append(f"{self.name}_count{labels} {series['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Registre des métriques du processus, rendu au format texte Prometheus"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+              callback: Optional[Callable[[], float]] = None) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Toutes les métriques au format d'exposition texte (version 0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+
+# Registre du processus et métriques de la plateforme
+METRICS = MetricsRegistry()
+STARTED_AT = time.time()
+
+REQUESTS = METRICS.counter(
+    "connectis_requests_total", "Demandes traitées par le workflow", ("status",))
+REQUEST_DURATION = METRICS.histogram(
+    "connectis_request_duration_seconds", "Durée de traitement d'une demande par le workflow")
+OPERATIONS = METRICS.counter(
+    "connectis_operations_total", "Opérations exécutées par l'Agent Systèmes",
+    ("system", "operation", "backend", "status"))
+OPERATION_DURATION = METRICS.histogram(
+    "connectis_operation_duration_seconds", "Durée des opérations de l'Agent Systèmes", ("system", "operation"))
+PROMPT_CACHE = METRICS.counter(
+    "connectis_prompt_cache_lookups_total", "Consultations du cache d'analyses de prompts", ("result",))
+PREFETCH = METRICS.counter(
+    "connectis_prefetch_lookups_total", "Consultations des réponses préchargées (actions rapides)", ("result",))
+ODOO_RPCS = METRICS.counter(
+    "connectis_odoo_rpc_total", "Appels XML-RPC à Odoo", ("model", "method", "status"))
+ODOO_RPC_DURATION = METRICS.histogram(
+    "connectis_odoo_rpc_duration_seconds", "Durée des appels XML-RPC à Odoo", ("model", "method"))
+UI_SESSIONS = METRICS.counter(
+    "connectis_ui_sessions_total", "Sessions ouvertes dans les interfaces Streamlit")
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator else 0.0
+
+
+METRICS.gauge("connectis_prompt_cache_hit_ratio", "Part des analyses servies par le cache",
+              callback=lambda: _ratio(PROMPT_CACHE.value(result="hit"), PROMPT_CACHE.total()))
+METRICS.gauge("connectis_odoo_rpc_error_ratio", "Part des appels Odoo en erreur",
+              callback=lambda: _ratio(ODOO_RPCS.total(status="error"), ODOO_RPCS.total()))
+METRICS.gauge("connectis_uptime_seconds", "Secondes depuis le démarrage du processus",
+              callback=lambda: time.time() - STARTED_AT)
+
+
+def platform_summary() -> Dict[str, float]:
+    """Indicateurs clés lus dans le registre (barre latérale des interfaces)"""
+    duration_sum, duration_count = REQUEST_DURATION.totals()
+    requests = REQUESTS.total()
+    return {
+        "sessions": int(UI_SESSIONS.total()),
+        "requests": int(requests),
+        "errors": int(REQUESTS.total(status="error")),
+        "mean_duration_s": _ratio(duration_sum, duration_count),
+        "success_ratio": _ratio(REQUESTS.total(status="success"), requests) if requests else 1.0,
+        "cache_hit_ratio": _ratio(PROMPT_CACHE.value(result="hit"), PROMPT_CACHE.total()),
+        "odoo_rpcs": int(ODOO_RPCS.total()),
+        "odoo_error_ratio": _ratio(ODOO_RPCS.total(status="error"), ODOO_RPCS.total()),
+        "uptime_s": time.time() - STARTED_AT
+    }
+
+
+def _metrics_handler(registry: MetricsRegistry):
+    """Gestionnaire HTTP : GET /metrics renvoie l'exposition texte du registre"""
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # pas de journal par requête de collecte
+
+    return MetricsHandler
+
+
+_server: Optional["ThreadingHTTPServer"] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(host: Optional[str] = None, port: Optional[int] = None) -> Optional["ThreadingHTTPServer"]:
+    """
+    Démarre (une seule fois par processus) le serveur HTTP exposant /metrics
+
+    Returns:
+        Le serveur, ou None si le port est indisponible
+    """
+    from http.server import ThreadingHTTPServer  # chargé seulement si le serveur est démarré
+
+    global _server
+    with _server_lock:
+        if _server is None:
+            address = (host or METRICS_CONFIG["host"], METRICS_CONFIG["port"] if port is None else port)
+            try:
+                _server = ThreadingHTTPServer(address, _metrics_handler(METRICS))
+            except OSError as e:
+                print(f"⚠️ Serveur de métriques indisponible sur {address[0]}:{address[1]}: {e}")
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+            print(f"📈 Métriques exposées sur http://{address[0]}:{_server.server_address[1]}/metrics")
+        return _server
+
+
+def stop_metrics_server():
+    """Arrête le serveur de métriques"""
+    global _server
+    with _server_lock:
+        if _server is not None:
+            _server.shutdown()
+            _server.server_close()
+            _server = None
@@ -0,0 +1,113 @@
+"""
+Cache de prompts - LRU borné des analyses de prompts, indexé sur le prompt normalisé
+"""
+
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# Diacritiques combinants (accents) isolés par la décomposition NFKD
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Forme normalisée d'un prompt : sans accents, en minuscules, espaces réduits
+
+    Exemple : "  Liste des  Opportunités " -> "liste des opportunites"
+    """
+    if not prompt.isascii():
+        prompt = _COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", prompt))
+    return " ".join(prompt.casefold().split())
+
+
+class PromptCache:
+    """
+    Cache LRU d'analyses de prompts
+
+    Les entrées sont indexées sur le prompt normalisé : les variantes d'un même
+    prompt (casse, accents, espaces) partagent une entrée et son rang LRU. Comme
+    l'analyse dépend du texte exact (règles accentuées, paramètres conservant la
+    casse), chaque variante garde sa propre analyse dans l'entrée (au plus
+    max_variants) ; un prompt identique n'est donc jamais ré-analysé, et une
+    variante ne reçoit jamais l'analyse d'une autre.
+    """
+
+    def __init__(self, max_entries: int = 512, max_variants: int = 4):
+        """
+        Args:
+            max_entries: Nombre maximum de prompts normalisés conservés
+            max_variants: Nombre maximum de variantes exactes par prompt normalisé
+        """
+        self.max_entries = max_entries
+        self.max_variants = max_variants
+        self._entries: "OrderedDict[str, OrderedDict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.variant_misses = 0
+        self.evictions = 0
+
+    def get(self, prompt: str, key: Optional[str] = None) -> Optional[Any]:
+        """Renvoie l'analyse en cache du prompt exact, ou None"""
+        key = key or normalize_prompt(prompt)
+        with self._lock:
+            variants = self._entries.get(key)
+            if variants is not None:
+                self._entries.move_to_end(key)
+                value = variants.get(prompt)
+                if value is not None:
+                    variants.move_to_end(prompt)
+                    self.hits += 1
+                    return value
+                self.variant_misses += 1
+            self.misses += 1
+            return None
+
+    def put(self, prompt: str, value: Any, key: Optional[str] = None):
+        """Enregistre l'analyse d'un prompt (évince les entrées les moins récentes)"""
+        key = key or normalize_prompt(prompt)
+        with self._lock:
+            variants = self._entries.get(key)
+            if variants is None:
+                variants = self._entries[key] = OrderedDict()
+            self._entries.move_to_end(key)
+            variants[prompt] = value
+            variants.move_to_end(prompt)
+            if len(variants) > self.max_variants:
+                variants.popitem(last=False)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, prompt: str, compute: Callable[[str], Any]) -> Any:
+        """Renvoie l'analyse en cache ou la calcule (hors verrou) puis l'enregistre"""
+        key = normalize_prompt(prompt)
+        value = self.get(prompt, key)
+        if value is None:
+            value = compute(prompt)
+            self.put(prompt, value, key)
+        return value
+
+    def clear(self):
+        """Vide le cache et remet les statistiques à zéro"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.variant_misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistiques d'utilisation (taux de succès, taille, évictions)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "variant_misses": self.variant_misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "variants": sum(len(v) for v in self._entries.values()),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions
+            }
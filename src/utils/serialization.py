@@ -0,0 +1,215 @@
+"""
+Sérialisation JSON - Chemin rapide (orjson/ujson si installés) et parsing incrémental
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple, Union
+
+# Backend le plus rapide disponible : orjson > ujson > json (stdlib)
+try:
+    import orjson
+    JSON_BACKEND = "orjson"
+except ImportError:
+    orjson = None
+    try:
+        import ujson
+        JSON_BACKEND = "ujson"
+    except ImportError:
+        ujson = None
+        JSON_BACKEND = "json"
+
+# Au-delà de cette taille, les fichiers sont parsés en flux
+STREAMING_THRESHOLD = 32 * 1024 * 1024
+STREAMING_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse une chaîne JSON avec le backend le plus rapide disponible"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Sérialise un objet en JSON (UTF-8 non échappé, comme ensure_ascii=False)
+
+    Args:
+        obj: Objet à sérialiser
+        indent: Si True, indente sur 2 espaces
+
+    Returns:
+        Chaîne JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+        except (TypeError, orjson.JSONEncodeError):
+            pass  # Entiers > 64 bits, etc. : repli sur la stdlib
+    elif ujson is not None:
+        try:
+            return ujson.dumps(obj, ensure_ascii=False, indent=2 if indent else 0)
+        except (TypeError, OverflowError):
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, default=str)
+
+
+def load_file(path: Union[str, Path], streaming_threshold: int = STREAMING_THRESHOLD) -> Any:
+    """
+    Charge un fichier JSON, en flux au-delà de streaming_threshold octets
+
+    Args:
+        path: Chemin du fichier
+        streaming_threshold: Taille (octets) à partir de laquelle le parsing est incrémental
+
+    Returns:
+        Contenu du fichier
+    """
+    if os.path.getsize(path) >= streaming_threshold:
+        return load_file_streaming(path)
+
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def load_file_streaming(path: Union[str, Path], chunk_size: int = STREAMING_CHUNK_SIZE) -> Any:
+    """
+    Charge un fichier JSON sans jamais le lire en entier en mémoire
+
+    Les tableaux de premier niveau sont reconstruits élément par élément :
+    seul un tampon de STREAMING_CHUNK_SIZE plus l'enregistrement courant
+    est conservé en plus des données déjà parsées.
+    """
+    result: Dict[str, Any] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _StreamReader(f, chunk_size)
+        if reader.peek() != "{":
+            # Document qui n'est pas un objet : pas de découpage possible
+            return reader.decode_value()
+
+        for event, key, value in _iter_members(reader):
+            if event == "array":
+                result[key] = []
+            elif event == "item":
+                result[key].append(value)
+            else:
+                result[key] = value
+    return result
+
+
+def iter_array_items(path: Union[str, Path]) -> Iterator[Tuple[str, Any]]:
+    """
+    Itère sur les éléments des tableaux de premier niveau d'un fichier JSON
+
+    Exemple : pour {"employes": [...], "conges": [...]}, produit
+    ("employes", employe) puis ("conges", conge), un enregistrement à la fois.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _StreamReader(f)
+        if reader.peek() != "{":
+            return
+        for event, key, value in _iter_members(reader):
+            if event == "item":
+                yield key, value
+
+
+def _iter_members(reader: "_StreamReader") -> Iterator[Tuple[str, str, Any]]:
+    """Parcourt les membres d'un objet : ("array", clé), ("item", clé, élément) ou ("value", clé, valeur)"""
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return
+
+    while True:
+        key = reader.decode_value()
+        reader.expect(":")
+
+        if reader.peek() == "[":
+            reader.expect("[")
+            yield "array", key, None
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield "item", key, reader.decode_value()
+                    if reader.peek() == ",":
+                        reader.expect(",")
+                        continue
+                    reader.expect("]")
+                    break
+        else:
+            yield "value", key, reader.decode_value()
+
+        if reader.peek() == ",":
+            reader.expect(",")
+            continue
+        reader.expect("}")
+        return
+
+
+class _StreamReader:
+    """Tampon de lecture incrémental autour de json.JSONDecoder.raw_decode"""
+
+    def __init__(self, fp, chunk_size: int = STREAMING_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Ajoute un bloc au tampon en abandonnant la partie déjà consommée"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Premier caractère significatif, '' en fin de fichier"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"'{char}' attendu, '{found}' trouvé", self.buffer, self.pos)
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        """Décode la valeur suivante, en relisant tant qu'elle est tronquée"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # Un nombre en fin de tampon peut être tronqué : "12" de "123", mais aussi "12" de
+            # "12.5" ou "1.5" de "1.5e3" (raw_decode s'arrête avant un "." ou un "e[+-]" final)
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and \
+               len(self.buffer) - end <= 2 and not self.buffer[end:].strip(_NUMBER_CHARS) and self._fill():
+                continue
+            self.pos = end
+            return value
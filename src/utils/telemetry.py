@@ -0,0 +1,131 @@
+"""
+Télémétrie - Spans de latence (nœuds du workflow, opérations, appels Odoo)
+et percentiles glissants (p50/p95/p99) par opération
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config import TELEMETRY_CONFIG
+
+# Spans de la requête en cours et span ouvert le plus interne (propres à chaque contexte)
+_active_spans: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar("active_spans", default=None)
+_current_span: ContextVar[Optional[Dict[str, Any]]] = ContextVar("current_span", default=None)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Percentile (rang le plus proche) d'une liste triée"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LatencyRegistry:
+    """
+    Latences par opération sur une fenêtre glissante
+
+    Chaque opération garde ses window dernières durées : les percentiles
+    reflètent le comportement récent, en mémoire bornée.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, duration_ms: float):
+        """Enregistre la durée d'une exécution de l'opération"""
+        with self._lock:
+            samples = self._samples.get(operation)
+            if samples is None:
+                samples = self._samples[operation] = deque(maxlen=self.window)
+                self._counts[operation] = 0
+            samples.append(duration_ms)
+            self._counts[operation] += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Percentiles par opération : {opération: {count, p50_ms, p95_ms, p99_ms, max_ms}}"""
+        with self._lock:
+            snapshot = {operation: (sorted(samples), self._counts[operation])
+                        for operation, samples in self._samples.items()}
+        return {
+            operation: {
+                "count": count,
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "p99_ms": round(percentile(values, 99), 3),
+                "max_ms": round(values[-1], 3)
+            }
+            for operation, (values, count) in sorted(snapshot.items())
+        }
+
+    def reset(self):
+        """Vide toutes les fenêtres"""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+
+# Registre du processus, alimenté par tous les spans
+LATENCIES = LatencyRegistry(TELEMETRY_CONFIG["window"])
+
+
+@contextmanager
+def collect_spans(spans: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """Rattache à la liste spans tous les spans fermés dans ce contexte (et les threads qui le copient)"""
+    token = _active_spans.set(spans)
+    try:
+        yield spans
+    finally:
+        _active_spans.reset(token)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Dict[str, Any]]:
+    """
+    Chronomètre un bloc : {name, start, duration_ms, attributs...}
+
+    Le span est ajouté à la liste active (collect_spans) et sa durée au
+    registre LATENCIES, sous son nom. Les attributs peuvent être complétés
+    pendant le bloc avec annotate() et increment().
+    """
+    current = {"name": name, "start": time.time(), **attributes}
+    if not TELEMETRY_CONFIG["enabled"]:
+        yield current
+        return
+    token = _current_span.set(current)
+    start = time.perf_counter()
+    try:
+        yield current
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        _current_span.reset(token)
+        current["duration_ms"] = round(duration_ms, 3)
+        LATENCIES.record(name, duration_ms)
+        spans = _active_spans.get()
+        if spans is not None:
+            spans.append(current)
+
+
+def annotate(**attributes):
+    """Ajoute des attributs au span ouvert le plus interne (sans effet hors span)"""
+    current = _current_span.get()
+    if current is not None:
+        current.update(attributes)
+
+
+def increment(attribute: str, amount: int = 1):
+    """Incrémente un compteur du span ouvert le plus interne (ex: cache_hits)"""
+    current = _current_span.get()
+    if current is not None:
+        current[attribute] = current.get(attribute, 0) + amount
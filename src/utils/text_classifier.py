@@ -0,0 +1,167 @@
+"""
+Classifieur TF-IDF - Repli vectorisé (NumPy) pour les prompts que les règles ne couvrent pas
+N-grammes de caractères, un centroïde par étiquette, score creux (seuls les n-grammes présents)
+"""
+
+import importlib.util
+import math
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+# NumPy n'est importé qu'à la création d'un classifieur (démarrage plus rapide)
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+np = None
+
+
+def _numpy():
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.utils.serialization import load_file
+from src.utils.prompt_cache import normalize_prompt
+
+
+class TfidfClassifier:
+    """
+    Classifieur TF-IDF sur n-grammes de caractères, à plusieurs têtes (ex: intention et système)
+
+    Chaque prompt est normalisé (minuscules, sans accents), découpé en n-grammes
+    de caractères puis pondéré en TF-IDF (tf sous-linéaire, vecteur L2). Chaque
+    étiquette est représentée par le centroïde normalisé de ses exemples ; les
+    centroïdes de toutes les têtes sont empilés dans une seule matrice. Un prompt
+    ne contient qu'une poignée des n-grammes du vocabulaire : son score est la
+    somme pondérée des lignes de la matrice (n-gramme x étiquettes) de ses
+    n-grammes, sans vecteur dense de la taille du vocabulaire.
+    La confiance est la probabilité softmax de l'étiquette retenue.
+    """
+
+    # Netteté du softmax appliqué aux similarités cosinus (comprises entre 0 et 1)
+    SHARPNESS = 10.0
+
+    def __init__(self, ngram_range: Tuple[int, int] = (3, 5)):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy est requis pour le classifieur TF-IDF")
+        _numpy()
+        self.ngram_range = ngram_range
+        self.vocabulary: Dict[str, int] = {}
+        self.idf = None
+        self.centroids = None
+        # Centroïdes transposés (n-gramme x étiquettes) : lignes lues pour les n-grammes d'un prompt
+        self._centroid_rows = None
+        # Tête -> (étiquettes, colonnes de la matrice des centroïdes)
+        self.heads: Dict[str, Tuple[List[str], slice]] = {}
+
+    @classmethod
+    def from_file(cls, examples_file: Union[str, Path], heads: Tuple[str, ...] = ("intent", "system"),
+                  ngram_range: Tuple[int, int] = (3, 5)) -> "TfidfClassifier":
+        """Entraîne le classifieur sur un fichier d'exemples {"exemples": [{"prompt": ..., <tête>: ...}]}"""
+        examples = load_file(examples_file)["exemples"]
+        prompts = [example["prompt"] for example in examples]
+        labels = {head: [example[head] for example in examples] for head in heads}
+        return cls(ngram_range).fit(prompts, labels)
+
+    def _ngrams(self, prompt: str) -> List[str]:
+        text = f" {normalize_prompt(prompt)} "
+        low, high = self.ngram_range
+        return [text[i:i + n] for n in range(low, high + 1) for i in range(len(text) - n + 1)]
+
+    def fit(self, prompts: List[str], labels: Dict[str, List[str]]) -> "TfidfClassifier":
+        """
+        Construit le vocabulaire, les poids IDF et les centroïdes
+
+        Args:
+            prompts: Prompts d'entraînement
+            labels: Étiquettes par tête, alignées sur prompts
+        """
+        documents = [set(self._ngrams(prompt)) for prompt in prompts]
+        document_frequency = Counter(gram for grams in documents for gram in grams)
+        self.vocabulary = {gram: index for index, gram in enumerate(sorted(document_frequency))}
+        # IDF lissé (comme scikit-learn) : log((1 + n) / (1 + df)) + 1
+        self.idf = np.ones(len(self.vocabulary), dtype=np.float32)
+        for gram, index in self.vocabulary.items():
+            self.idf[index] = math.log((1 + len(prompts)) / (1 + document_frequency[gram])) + 1
+
+        matrix = self.transform(prompts)
+        centroids = []
+        self.heads = {}
+        for head, head_labels in labels.items():
+            names = sorted(set(head_labels))
+            start = len(centroids)
+            for name in names:
+                rows = [i for i, label in enumerate(head_labels) if label == name]
+                centroid = matrix[rows].mean(axis=0)
+                centroids.append(centroid / (np.linalg.norm(centroid) or 1.0))
+            self.heads[head] = (names, slice(start, len(centroids)))
+        self.centroids = np.vstack(centroids).astype(np.float32)
+        self._centroid_rows = np.ascontiguousarray(self.centroids.T)
+        return self
+
+    def _vector(self, prompt: str):
+        """Vecteur TF-IDF normalisé creux : (colonnes, poids), ou None sans n-gramme connu"""
+        counts = Counter(self.vocabulary[g] for g in self._ngrams(prompt) if g in self.vocabulary)
+        if not counts:
+            return None
+        columns = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        weights = (1 + np.log(tf)) * self.idf[columns]
+        return columns, weights / np.linalg.norm(weights)
+
+    def transform(self, prompts: List[str]):
+        """Matrice TF-IDF normalisée dense (prompts x vocabulaire) - entraînement uniquement"""
+        matrix = np.zeros((len(prompts), len(self.vocabulary)), dtype=np.float32)
+        for row, prompt in enumerate(prompts):
+            vector = self._vector(prompt)
+            if vector is not None:
+                matrix[row, vector[0]] = vector[1]
+        return matrix
+
+    def _scores(self, prompts: List[str]):
+        """Similarités cosinus (prompts x étiquettes), accumulées sur les seuls n-grammes présents"""
+        scores = np.zeros((len(prompts), self._centroid_rows.shape[1]), dtype=np.float32)
+        rows, columns, weights = [], [], []
+        for row, prompt in enumerate(prompts):
+            vector = self._vector(prompt)
+            if vector is not None:
+                rows.append(row)
+                columns.append(vector[0])
+                weights.append(vector[1])
+        if len(rows) == 1:
+            scores[rows[0]] = weights[0] @ self._centroid_rows[columns[0]]
+        elif rows:
+            # Contributions de tous les n-grammes du lot, sommées par prompt (segments contigus)
+            starts = np.cumsum([0] + [len(c) for c in columns[:-1]])
+            contributions = self._centroid_rows[np.concatenate(columns)] * np.concatenate(weights)[:, None]
+            scores[rows] = np.add.reduceat(contributions, starts, axis=0)
+        return scores
+
+    def predict_batch(self, prompts: List[str]) -> List[Dict[str, Tuple[str, float]]]:
+        """
+        Prédit chaque tête pour un lot de prompts
+
+        Returns:
+            Pour chaque prompt : {tête: (étiquette, confiance)}
+        """
+        if not prompts:
+            return []
+        scores = self._scores(prompts)
+        results = [{} for _ in prompts]
+        for head, (names, columns) in self.heads.items():
+            head_scores = scores[:, columns] * self.SHARPNESS
+            probabilities = np.exp(head_scores - head_scores.max(axis=1, keepdims=True))
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            best = probabilities.argmax(axis=1)
+            for row, index in enumerate(best):
+                results[row][head] = (names[index], float(probabilities[row, index]))
+        return results
+
+    def predict(self, prompt: str) -> Dict[str, Tuple[str, float]]:
+        """Prédit chaque tête pour un seul prompt"""
+        return self.predict_batch([prompt])[0]
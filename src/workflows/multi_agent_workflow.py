@@ -5,23 +5,78 @@ Workflow LangGraph - Orchestration des agents Interface et Systèmes (Mode Hybri
 import json
 import sys
 import os
-from typing import Dict, Any, TypedDict, List
-from langgraph.graph import StateGraph, END
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, TypedDict, List, Optional, Iterator, AsyncIterator, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
 
 # Ajouter le répertoire parent au path pour les imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from contextvars import copy_context
+from config import MULTI_INTENT_CONFIG, BATCH_CONFIG, STREAM_CONFIG
 from src.agents.interface_agent import InterfaceAgent
 from src.agents.systems_agent import SystemsAgent
+from src.utils.telemetry import LATENCIES, collect_spans, span, annotate, percentile
+from src.utils.metrics import REQUESTS, REQUEST_DURATION
+
+# Intentions qui modifient les données : leurs instructions s'exécutent dans l'ordre du prompt
+WRITE_ACTIONS = {"ajouter", "modifier", "supprimer"}
 
 
 class WorkflowState(TypedDict):
     """État du workflow partagé entre les agents"""
     user_input: str
     instruction: Dict[str, Any]
+    instructions: List[Dict[str, Any]]
     result: Dict[str, Any]
+    results: List[Dict[str, Any]]
     formatted_response: str
     error: str
     execution_log: List[str]
+    timings: Dict[str, float]
+    spans: List[Dict[str, Any]]
+
+
+def _with_timing(state: WorkflowState, stage: str, start: float) -> WorkflowState:
+    state["timings"] = {**state.get("timings", {}), stage: round((time.perf_counter() - start) * 1000, 3)}
+    return state
+
+
+def _timed(stage: str, node):
+    """
+    Enveloppe un nœud : span node.<stage> et durée (ms) dans state["timings"][stage]
+    
+    Les spans ouverts pendant le nœud (opérations, appels Odoo) sont rattachés
+    à state["spans"], quel que soit le thread qui exécute le nœud.
+    """
+    def run(state: WorkflowState) -> WorkflowState:
+        start = time.perf_counter()
+        with collect_spans(state.setdefault("spans", [])), span(f"node.{stage}"):
+            state = node(state)
+        return _with_timing(state, stage, start)
+    return run
+
+
+def _atimed(stage: str, node):
+    """Version asynchrone de _timed"""
+    async def run(state: WorkflowState) -> WorkflowState:
+        start = time.perf_counter()
+        with collect_spans(state.setdefault("spans", [])), span(f"node.{stage}"):
+            state = await node(state)
+        return _with_timing(state, stage, start)
+    return run
+
+
+def _stream_writer() -> Callable[[Dict[str, Any]], None]:
+    """Émetteur des événements stream_mode="custom" du nœud en cours (sans effet hors de graph.stream)"""
+    from langgraph.config import get_stream_writer
+    try:
+        return get_stream_writer()
+    except RuntimeError:  # appel hors d'un nœud du graphe
+        return lambda event: None
 
 
 class MultiAgentWorkflow:
@@ -33,7 +88,12 @@ class MultiAgentWorkflow:
     def __init__(self, use_odoo: bool = True):
         self.interface_agent = InterfaceAgent()
         self.systems_agent = SystemsAgent(use_odoo=use_odoo)  # Mode hybride
-        self.graph = self._build_graph()
+        # Graphe LangGraph compilé à la première requête (import de langgraph coûteux)
+        self._graph = None
+        self._graph_lock = threading.Lock()
+        # Threads des instructions indépendantes d'un prompt composé (démarrés à la demande)
+        self._instruction_executor = ThreadPoolExecutor(
+            max_workers=MULTI_INTENT_CONFIG["max_workers"], thread_name_prefix="workflow-instructions")
         
         # Informations sur le workflow
         self.workflow_info = {
@@ -42,14 +102,30 @@ class MultiAgentWorkflow:
             "mode": self.systems_agent.get_system_status()["mode"]
         }
 
-    def _build_graph(self) -> StateGraph:
+    @property
+    def graph(self):
+        """Graphe LangGraph compilé, construit au premier accès"""
+        if self._graph is None:
+            with self._graph_lock:
+                if self._graph is None:
+                    self._graph = self._build_graph()
+        return self._graph
+
+    def _build_graph(self) -> "StateGraph":
         """Construit le graphe LangGraph"""
+        from langchain_core.runnables import RunnableLambda
+        from langgraph.graph import StateGraph, END
+
         workflow = StateGraph(WorkflowState)
         
-        # Ajout des nœuds
-        workflow.add_node("interface_agent", self._interface_node)
-        workflow.add_node("systems_agent", self._systems_node)
-        workflow.add_node("formatter", self._formatter_node)
+        # Ajout des nœuds, chronométrés (l'Agent Systèmes a une version asynchrone, utilisée
+        # par ainvoke ; l'analyse et le formatage, purement calculatoires, s'exécutent directement)
+        workflow.add_node("interface_agent", _timed("interface_agent", self._interface_node))
+        workflow.add_node("systems_agent", RunnableLambda(
+            _timed("systems_agent", self._systems_node),
+            afunc=_atimed("systems_agent", self._asystems_node),
+            name="systems_agent"))
+        workflow.add_node("formatter", _timed("formatter", self._formatter_node))
         
         # Définition du flux
         workflow.set_entry_point("interface_agent")
@@ -67,6 +143,7 @@ class MultiAgentWorkflow:
                 raise ValueError("Aucun input utilisateur fourni")
             
             # Traitement par l'Agent Interface
+            annotate(prompt_chars=len(user_input))
             interface_result = self.interface_agent.process_message(user_input)
             
             if not interface_result.get("success", False):
@@ -74,8 +151,10 @@ class MultiAgentWorkflow:
                 return state
             
             state["instruction"] = interface_result["instruction"]
+            state["instructions"] = interface_result.get("instructions", [interface_result["instruction"]])
             state["execution_log"] = state.get("execution_log", []) + [
-                f"Interface Agent: Instruction analysée - {interface_result['instruction']['operation']} sur {interface_result['instruction']['system']}"
+                f"Interface Agent: Instruction analysée - {instruction['operation']} sur {instruction['system']}"
+                for instruction in state["instructions"]
             ]
             
         except Exception as e:
@@ -86,27 +165,127 @@ class MultiAgentWorkflow:
     def _systems_node(self, state: WorkflowState) -> WorkflowState:
         """Nœud Agent Systèmes - Exécution sur les systèmes"""
         try:
-            instruction = state.get("instruction")
-            if not instruction:
-                raise ValueError("Aucune instruction fournie")
-            
-            # Exécution par l'Agent Systèmes
-            systems_result = self.systems_agent.execute_instruction(instruction)
-            
-            if not systems_result.get("success", False):
-                state["error"] = systems_result.get("error", "Erreur Agent Systèmes")
-                return state
-            
-            state["result"] = systems_result
-            state["execution_log"] = state.get("execution_log", []) + [
-                f"Systems Agent: Opération exécutée sur {systems_result['system']} - {systems_result.get('result', {}).get('summary', 'Opération terminée')}"
-            ]
-            
+            instructions = self._pending_instructions(state)
+            return self._store_results(state, self._execute_instructions(instructions))
+        except Exception as e:
+            state["error"] = f"Erreur dans systems_node: {str(e)}"
+        
+        return state
+
+    async def _asystems_node(self, state: WorkflowState) -> WorkflowState:
+        """Nœud Agent Systèmes (asynchrone) - Exécution sans bloquer la boucle d'événements"""
+        try:
+            instructions = self._pending_instructions(state)
+            return self._store_results(state, await self._aexecute_instructions(instructions))
         except Exception as e:
             state["error"] = f"Erreur dans systems_node: {str(e)}"
         
         return state
 
+    @staticmethod
+    def _pending_instructions(state: WorkflowState) -> List[Dict[str, Any]]:
+        """Instructions à exécuter (plusieurs pour un prompt composé)"""
+        instruction = state.get("instruction")
+        if not instruction:
+            raise ValueError("Aucune instruction fournie")
+        return state.get("instructions") or [instruction]
+
+    @staticmethod
+    def _store_results(state: WorkflowState, results: List[Dict[str, Any]]) -> WorkflowState:
+        """Enregistre les résultats de l'Agent Systèmes dans l'état"""
+        successes = [result for result in results if result.get("success", False)]
+        
+        if not successes:
+            state["error"] = "; ".join(result.get("error", "Erreur Agent Systèmes") for result in results)
+            return state
+        
+        state["result"] = successes[0]
+        state["results"] = results
+        state["execution_log"] = state.get("execution_log", []) + [
+            f"Systems Agent: Opération exécutée sur {systems_result['system']} - {systems_result.get('result', {}).get('summary', 'Opération terminée')}"
+            for systems_result in successes
+        ]
+        return state
+
+    def _execute_instructions(self, instructions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Exécute les instructions d'un prompt composé, en parallèle si elles sont indépendantes
+        
+        Les lectures s'exécutent dans des threads : le temps de réponse est celui de
+        la plus lente, pas leur somme. Dès qu'une instruction modifie des données,
+        toutes s'exécutent dans l'ordre du prompt.
+        
+        Returns:
+            Résultats de l'Agent Systèmes, dans l'ordre des instructions
+        """
+        write = _stream_writer()
+        
+        def execute(index: int, instruction: Dict[str, Any]) -> Dict[str, Any]:
+            # Chaque résultat est émis dès qu'il est disponible (mode flux)
+            result = self.systems_agent.execute_instruction(instruction)
+            write({"event": "result", "index": index, "result": result})
+            return result
+        
+        if not self._independent(instructions):
+            return [execute(index, instruction) for index, instruction in enumerate(instructions)]
+        
+        # Chaque thread reçoit une copie du contexte : ses spans restent rattachés à la requête
+        contexts = [copy_context() for _ in instructions]
+        return list(self._instruction_executor.map(
+            lambda context, index, instruction: context.run(execute, index, instruction),
+            contexts, range(len(instructions)), instructions))
+
+    async def _aexecute_instructions(self, instructions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Version asynchrone de _execute_instructions (mêmes règles d'ordre)"""
+        import asyncio  # déjà chargé par la boucle d'événements appelante
+        
+        write = _stream_writer()
+        
+        async def execute(index: int, instruction: Dict[str, Any]) -> Dict[str, Any]:
+            result = await self.systems_agent.aexecute_instruction(instruction)
+            write({"event": "result", "index": index, "result": result})
+            return result
+        
+        if not self._independent(instructions):
+            return [await execute(index, instruction) for index, instruction in enumerate(instructions)]
+        return list(await asyncio.gather(*(execute(index, instruction)
+                                           for index, instruction in enumerate(instructions))))
+
+    @staticmethod
+    def _independent(instructions: List[Dict[str, Any]]) -> bool:
+        """Plusieurs instructions de lecture seule, exécutables dans n'importe quel ordre"""
+        return len(instructions) > 1 and not any(i.get("action") in WRITE_ACTIONS for i in instructions)
+
+    def _format_result(self, result_data: Dict[str, Any]) -> str:
+        """Formate le résultat d'une opération (titre, résumé, métriques, détails)"""
+        title = result_data.get("title", "Résultat")
+        summary = result_data.get("summary", "")
+        count = result_data.get("count", 0)
+        data = result_data.get("data", [])
+        metrics = result_data.get("metrics", {})
+        
+        formatted_response = f"✅ **{title}**\n\n"
+        formatted_response += f"📋 {summary}\n\n"
+        
+        if metrics:
+            formatted_response += "📊 **Métriques:**\n"
+            for key, value in metrics.items():
+                formatted_response += f"• {key.replace('_', ' ').title()}: {value}\n"
+            formatted_response += "\n"
+        
+        # Limitation de l'affichage des données pour éviter la surcharge
+        if isinstance(data, list) and len(data) > 0:
+            if len(data) <= 3:
+                formatted_response += "📝 **Détails:**\n"
+                for item in data:
+                    if isinstance(item, dict):
+                        nom = item.get("nom", item.get("titre", item.get("id", "Item")))
+                        formatted_response += f"• {nom}\n"
+            else:
+                formatted_response += f"📝 **{count} éléments trouvés** (affichage limité pour la lisibilité)\n"
+        
+        return formatted_response
+
     def _formatter_node(self, state: WorkflowState) -> WorkflowState:
         """Nœud Formatter - Formatage de la réponse finale"""
         try:
@@ -121,33 +300,15 @@ class MultiAgentWorkflow:
                 state["formatted_response"] = "❌ Aucun résultat obtenu"
                 return state
             
-            # Formatage de la réponse
-            result_data = result.get("result", {})
-            title = result_data.get("title", "Résultat")
-            summary = result_data.get("summary", "")
-            count = result_data.get("count", 0)
-            data = result_data.get("data", [])
-            metrics = result_data.get("metrics", {})
-            
-            formatted_response = f"✅ **{title}**\n\n"
-            formatted_response += f"📋 {summary}\n\n"
-            
-            if metrics:
-                formatted_response += "📊 **Métriques:**\n"
-                for key, value in metrics.items():
-                    formatted_response += f"• {key.replace('_', ' ').title()}: {value}\n"
-                formatted_response += "\n"
-            
-            # Limitation de l'affichage des données pour éviter la surcharge
-            if isinstance(data, list) and len(data) > 0:
-                if len(data) <= 3:
-                    formatted_response += "📝 **Détails:**\n"
-                    for item in data:
-                        if isinstance(item, dict):
-                            nom = item.get("nom", item.get("titre", item.get("id", "Item")))
-                            formatted_response += f"• {nom}\n"
-                else:
-                    formatted_response += f"📝 **{count} éléments trouvés** (affichage limité pour la lisibilité)\n"
+            # Formatage de la réponse (une section par demande d'un prompt composé)
+            results = state.get("results") or [result]
+            sections = [
+                self._format_result(item.get("result", {})) if item.get("success")
+                else f"❌ {item.get('error', 'Erreur Agent Systèmes')}\n"
+                for item in results
+            ]
+            formatted_response = "\n".join(sections)
+            annotate(response_chars=len(formatted_response))
             
             state["formatted_response"] = formatted_response
             state["execution_log"] = state.get("execution_log", []) + [
@@ -169,43 +330,284 @@ class MultiAgentWorkflow:
         Returns:
             Dict contenant la réponse formatée et les métadonnées
         """
+        start = time.perf_counter()
         try:
-            # État initial
-            initial_state = WorkflowState(
-                user_input=user_input,
-                instruction={},
-                result={},
-                formatted_response="",
-                error="",
-                execution_log=[]
-            )
-            
             # Exécution du workflow
-            final_state = self.graph.invoke(initial_state)
-            
-            return {
-                "success": not bool(final_state.get("error")),
-                "user_input": user_input,
-                "formatted_response": final_state.get("formatted_response", ""),
-                "instruction": final_state.get("instruction", {}),
-                "result": final_state.get("result", {}),
-                "execution_log": final_state.get("execution_log", []),
-                "error": final_state.get("error", "")
-            }
+            final_state = self.graph.invoke(self._initial_state(user_input))
+            response = self._build_response(user_input, final_state)
             
         except Exception as e:
-            return {
-                "success": False,
-                "user_input": user_input,
-                "formatted_response": f"❌ Erreur du workflow: {str(e)}",
-                "error": str(e)
+            response = self._error_response(user_input, e)
+        
+        return self._observe(response, time.perf_counter() - start)
+
+    async def aprocess_user_request(self, user_input: str) -> Dict[str, Any]:
+        """
+        Version asynchrone de process_user_request (graph.ainvoke)
+        
+        Les appels aux systèmes ne bloquent pas la boucle d'événements : de
+        nombreuses demandes peuvent être traitées simultanément, par exemple
+        avec asyncio.gather.
+        
+        Args:
+            user_input: Demande de l'utilisateur en langage naturel
+            
+        Returns:
+            Dict contenant la réponse formatée et les métadonnées
+        """
+        start = time.perf_counter()
+        try:
+            final_state = await self.graph.ainvoke(self._initial_state(user_input))
+            response = self._build_response(user_input, final_state)
+            
+        except Exception as e:
+            response = self._error_response(user_input, e)
+        
+        return self._observe(response, time.perf_counter() - start)
+
+    def stream_user_request(self, user_input: str) -> Iterator[Dict[str, Any]]:
+        """
+        Version en flux de process_user_request (graph.stream)
+        
+        Les événements sont produits dès que leur contenu est disponible, pour
+        afficher la réponse progressivement au lieu d'attendre la fin du graphe :
+        
+            {"event": "instruction", "instruction", "instructions"}   analyse du prompt terminée
+            {"event": "page", "index", "system", "title", "summary",
+             "count", "offset", "rows"}                               données d'une demande, par pages
+            {"event": "error", "index", "error"}                      échec d'une demande
+            {"event": "response", "formatted_response"}               réponse formatée (métriques)
+            {"event": "done", "response"}                             même dict que process_user_request
+        
+        Args:
+            user_input: Demande de l'utilisateur en langage naturel
+        """
+        start = time.perf_counter()
+        state = self._initial_state(user_input)
+        try:
+            for mode, chunk in self.graph.stream(state, stream_mode=["updates", "custom"]):
+                if mode == "custom":
+                    yield from self._result_events(chunk)
+                    continue
+                for node, update in chunk.items():
+                    state = {**state, **update}
+                    yield from self._node_events(node, state)
+            response = self._build_response(user_input, state)
+            
+        except Exception as e:
+            response = self._error_response(user_input, e)
+        
+        yield {"event": "done", "response": self._observe(response, time.perf_counter() - start)}
+
+    async def astream_user_request(self, user_input: str) -> AsyncIterator[Dict[str, Any]]:
+        """Version asynchrone de stream_user_request (graph.astream, mêmes événements)"""
+        start = time.perf_counter()
+        state = self._initial_state(user_input)
+        try:
+            async for mode, chunk in self.graph.astream(state, stream_mode=["updates", "custom"]):
+                if mode == "custom":
+                    for event in self._result_events(chunk):
+                        yield event
+                    continue
+                for node, update in chunk.items():
+                    state = {**state, **update}
+                    for event in self._node_events(node, state):
+                        yield event
+            response = self._build_response(user_input, state)
+            
+        except Exception as e:
+            response = self._error_response(user_input, e)
+        
+        yield {"event": "done", "response": self._observe(response, time.perf_counter() - start)}
+
+    @staticmethod
+    def _node_events(node: str, state: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Événements produits à la fin d'un nœud (analyse, formatage)"""
+        if state.get("error"):
+            return
+        if node == "interface_agent":
+            yield {"event": "instruction", "instruction": state["instruction"],
+                   "instructions": state["instructions"]}
+        elif node == "formatter":
+            yield {"event": "response", "formatted_response": state["formatted_response"]}
+
+    @staticmethod
+    def _result_events(chunk: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Découpe le résultat d'une instruction en événements "page" (STREAM_CONFIG["page_size"] lignes)"""
+        index, systems_result = chunk["index"], chunk["result"]
+        if not systems_result.get("success"):
+            yield {"event": "error", "index": index, "error": systems_result.get("error", "Erreur Agent Systèmes")}
+            return
+        result_data = systems_result.get("result", {})
+        data = result_data.get("data", [])
+        rows = data if isinstance(data, list) else [data]
+        header = {
+            "event": "page",
+            "index": index,
+            "system": systems_result.get("system", ""),
+            "title": result_data.get("title", "Résultat"),
+            "summary": result_data.get("summary", ""),
+            "count": result_data.get("count", len(rows))
+        }
+        page_size = STREAM_CONFIG["page_size"]
+        for offset in range(0, max(len(rows), 1), page_size):
+            yield {**header, "offset": offset, "rows": rows[offset:offset + page_size]}
+
+    def process_batch(self, prompts: List[str], max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Traite un lot de demandes via graph.batch (tests de charge, rejeux hors ligne)
+        
+        Les demandes s'exécutent dans un pool borné de max_concurrency threads et
+        partagent les agents du workflow (données JSON, connecteur Odoo). Une
+        demande en échec n'interrompt pas le lot.
+        
+        Args:
+            prompts: Demandes en langage naturel
+            max_concurrency: Demandes simultanées (None = BATCH_CONFIG)
+            
+        Returns:
+            Dict avec les réponses (dans l'ordre des prompts) et les statistiques
+            du lot : débit et latence de chaque étape (p50, p95, max en ms)
+        """
+        max_concurrency = max_concurrency or BATCH_CONFIG["workflow_max_concurrency"]
+        start = time.perf_counter()
+        states = self.graph.batch([self._initial_state(prompt) for prompt in prompts],
+                                  config={"max_concurrency": max_concurrency}, return_exceptions=True)
+        return self._batch_report(prompts, states, time.perf_counter() - start, max_concurrency)
+
+    async def aprocess_batch(self, prompts: List[str], max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """Version asynchrone de process_batch (graph.abatch, au plus max_concurrency demandes en cours)"""
+        max_concurrency = max_concurrency or BATCH_CONFIG["workflow_max_concurrency"]
+        start = time.perf_counter()
+        states = await self.graph.abatch([self._initial_state(prompt) for prompt in prompts],
+                                         config={"max_concurrency": max_concurrency}, return_exceptions=True)
+        return self._batch_report(prompts, states, time.perf_counter() - start, max_concurrency)
+
+    def _batch_report(self, prompts: List[str], states: List[Any], duration: float,
+                      max_concurrency: int) -> Dict[str, Any]:
+        """Réponses d'un lot et statistiques agrégées (débit, latence par étape)"""
+        responses = [
+            self._error_response(prompt, state) if isinstance(state, Exception)
+            else self._build_response(prompt, state)
+            for prompt, state in zip(prompts, states)
+        ]
+        # Durée propre à chaque demande du lot : somme de ses étapes
+        for response in responses:
+            self._observe(response, sum(response.get("timings", {}).values()) / 1000)
+        
+        stage_timings: Dict[str, List[float]] = {}
+        for response in responses:
+            for stage, duration_ms in response.get("timings", {}).items():
+                stage_timings.setdefault(stage, []).append(duration_ms)
+        stages = {}
+        for stage, values in stage_timings.items():
+            values.sort()
+            stages[stage] = {
+                "mean_ms": round(sum(values) / len(values), 3),
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "max_ms": round(values[-1], 3)
+            }
+        
+        return {
+            "results": responses,
+            "stats": {
+                "count": len(responses),
+                "succeeded": sum(1 for response in responses if response["success"]),
+                "max_concurrency": max_concurrency,
+                "duration_s": round(duration, 3),
+                "throughput_rps": round(len(responses) / duration, 1) if duration > 0 else 0.0,
+                "stages": stages
             }
+        }
+
+    @staticmethod
+    def _observe(response: Dict[str, Any], duration: float) -> Dict[str, Any]:
+        """Alimente les métriques de demandes (nombre par statut, durée en secondes)"""
+        REQUESTS.inc(status="success" if response.get("success") else "error")
+        REQUEST_DURATION.observe(duration)
+        return response
+
+    @staticmethod
+    def _initial_state(user_input: str) -> WorkflowState:
+        """État initial du workflow pour une demande"""
+        return WorkflowState(
+            user_input=user_input,
+            instruction={},
+            instructions=[],
+            result={},
+            results=[],
+            formatted_response="",
+            error="",
+            execution_log=[],
+            timings={},
+            spans=[]
+        )
+
+    @staticmethod
+    def _build_response(user_input: str, final_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Réponse renvoyée à l'interface à partir de l'état final"""
+        return {
+            "success": not bool(final_state.get("error")),
+            "user_input": user_input,
+            "formatted_response": final_state.get("formatted_response", ""),
+            "instruction": final_state.get("instruction", {}),
+            "instructions": final_state.get("instructions", []),
+            "result": final_state.get("result", {}),
+            "results": final_state.get("results", []),
+            "execution_log": final_state.get("execution_log", []),
+            "timings": final_state.get("timings", {}),
+            "spans": sorted(final_state.get("spans", []), key=lambda item: item["start"]),
+            "error": final_state.get("error", "")
+        }
+
+    @staticmethod
+    def _error_response(user_input: str, error: Exception) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "user_input": user_input,
+            "formatted_response": f"❌ Erreur du workflow: {str(error)}",
+            "error": str(error)
+        }
+
+    @staticmethod
+    def latency_stats() -> Dict[str, Dict[str, float]]:
+        """
+        Percentiles glissants (p50/p95/p99, en ms) par opération, tous workflows confondus
+        
+        Opérations : node.<nœud>, systems.<système>.<opération>, odoo.<modèle>.<méthode>
+        """
+        return LATENCIES.summary()
 
     def get_workflow_info(self) -> Dict[str, Any]:
         """Informations sur le workflow hybride"""
         return self.workflow_info
 
 
+# Workflow partagé par toutes les sessions et interfaces du processus
+_shared_workflow: Optional[MultiAgentWorkflow] = None
+_shared_workflow_lock = threading.Lock()
+
+
+def get_shared_workflow(use_odoo: bool = True) -> MultiAgentWorkflow:
+    """
+    Workflow unique du processus, créé au premier appel
+    
+    Les agents sont réentrants (analyse sans état partagé, cache et écritures
+    sous verrou, proxy Odoo par thread) : une seule instance sert toutes les
+    sessions Streamlit, sans recharger les données ni se reconnecter à Odoo.
+    
+    Args:
+        use_odoo: Mode hybride (pris en compte à la création uniquement)
+    """
+    global _shared_workflow
+    if _shared_workflow is None:
+        with _shared_workflow_lock:
+            if _shared_workflow is None:
+                _shared_workflow = MultiAgentWorkflow(use_odoo=use_odoo)
+    return _shared_workflow
+
+
 # Fonction utilitaire pour tester le workflow
 def test_workflow():
     """Test complet du workflow LangGraph"""
@@ -217,7 +619,8 @@ def test_workflow():
         "Cherche l'employé Dubois",
         "Donne-moi un rapport sur les opportunités commerciales",
         "Liste tous les projets en cours",
-        "Liste des opportunités"
+        "Liste des opportunités",
+        "Liste les clients et le statut des projets"
     ]
     
     print("=== Test du Workflow LangGraph Multi-Agents ===")
@@ -234,6 +637,27 @@ def test_workflow():
             print(f"❌ **Erreur**: {result['error']}")
         
         print("\n" + "-"*40 + "\n")
+    
+    # Mêmes demandes, toutes en cours simultanément dans une boucle d'événements (graph.ainvoke)
+    import asyncio
+    
+    async def run_concurrently():
+        return await asyncio.gather(*(workflow.aprocess_user_request(request) for request in test_requests))
+    
+    results = asyncio.run(run_concurrently())
+    print(f"Mode asynchrone: {sum(result['success'] for result in results)}/{len(results)} demandes traitées")
+    
+    # Mode flux : événements dans l'ordre où ils deviennent disponibles
+    print("\nMode flux (stream_user_request):")
+    start = time.perf_counter()
+    for event in workflow.stream_user_request(test_requests[-1]):
+        elapsed = (time.perf_counter() - start) * 1000
+        detail = event.get("title") or event.get("error") or ""
+        print(f"  {elapsed:>7.2f}ms  {event['event']:<12} {detail}")
+    
+    print("\nLatences par opération (ms):")
+    for operation, stats in workflow.latency_stats().items():
+        print(f"  {operation:<40} p50 {stats['p50_ms']:>7.3f}  p95 {stats['p95_ms']:>7.3f}  p99 {stats['p99_ms']:>7.3f}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,144 @@
+"""
+Préchargement des réponses - Demandes fréquentes (actions rapides) traitées à l'avance
+par le workflow sur un thread de fond, puis servies sans attente
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Iterable, Optional
+
+# Ajouter le répertoire racine au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config import PREFETCH_CONFIG
+from src.utils.metrics import PREFETCH
+
+
+class _Entry:
+    """Réponse préchargée (en cours ou terminée) et version des données au lancement"""
+
+    __slots__ = ("future", "data_version", "ready_at")
+
+    def __init__(self, future: Future, data_version: int):
+        self.future = future
+        self.data_version = data_version
+        self.ready_at: Optional[float] = None
+
+
+class ResponsePrefetcher:
+    """
+    Réponses du workflow calculées à l'avance pour des demandes de lecture
+
+    prefetch() lance le traitement des demandes sur un pool de threads de fond
+    (sans bloquer le rendu de l'interface) ; take() renvoie la réponse
+    préchargée d'une demande identique, en attendant au plus wait_timeout
+    secondes si son traitement est encore en cours. Une réponse est périmée
+    après ttl secondes ou si les données de l'Agent Systèmes ont été
+    rechargées depuis son lancement : take() renvoie alors None et l'appelant
+    traite la demande normalement. Une demande en échec n'est pas servie et
+    est relancée au prochain prefetch().
+
+    Partagé par toutes les sessions : une demande déjà préchargée (ou en
+    cours) n'est pas relancée. Les réponses servies sont partagées, à ne pas
+    modifier.
+    """
+
+    def __init__(self, workflow, config: Dict[str, Any] = PREFETCH_CONFIG):
+        self.workflow = workflow
+        self.ttl = config["ttl"]
+        self.wait_timeout = config["wait_timeout"]
+        self._executor = ThreadPoolExecutor(config["workers"], thread_name_prefix="prefetch")
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def _data_version(self) -> int:
+        return getattr(self.workflow.systems_agent, "data_version", 0)
+
+    def _fresh(self, entry: _Entry) -> bool:
+        if entry.data_version != self._data_version():
+            return False
+        return entry.ready_at is None or time.monotonic() - entry.ready_at < self.ttl
+
+    @staticmethod
+    def _failed(entry: _Entry) -> bool:
+        """Traitement terminé en échec (exception ou réponse sans succès)"""
+        if not entry.future.done():
+            return False
+        if entry.future.exception() is not None:
+            return True
+        return not entry.future.result().get("success")
+
+    def _process(self, prompt: str) -> Dict[str, Any]:
+        try:
+            return self.workflow.process_user_request(prompt)
+        finally:
+            # Échec compris : le ttl s'applique à toute entrée terminée
+            with self._lock:
+                entry = self._entries.get(prompt)
+                if entry is not None:
+                    entry.ready_at = time.monotonic()
+
+    def prefetch(self, prompts: Iterable[str]):
+        """Lance en arrière-plan les demandes sans réponse préchargée valide"""
+        with self._lock:
+            for prompt in prompts:
+                entry = self._entries.get(prompt)
+                if entry is not None and self._fresh(entry) and not self._failed(entry):
+                    continue
+                # Entrée enregistrée sous le verrou : _process ne la consulte qu'après l'avoir obtenu
+                future = self._executor.submit(self._process, prompt)
+                self._entries[prompt] = _Entry(future, self._data_version())
+
+    def take(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Réponse préchargée de la demande
+
+        Returns:
+            La réponse (même dict que process_user_request), ou None si la demande
+            n'a pas été préchargée, si sa réponse est périmée ou en échec, ou si
+            son traitement dépasse wait_timeout
+        """
+        with self._lock:
+            entry = self._entries.get(prompt)
+            if entry is None:
+                PREFETCH.inc(result="miss")
+                return None
+            if not self._fresh(entry):
+                del self._entries[prompt]
+                PREFETCH.inc(result="stale")
+                return None
+        try:
+            response = entry.future.result(timeout=self.wait_timeout)
+        except FutureTimeoutError:
+            PREFETCH.inc(result="pending")
+            return None
+        except Exception:
+            response = None
+        if response is None or not response.get("success"):
+            # Entrée en échec retirée : la demande sera relancée au prochain prefetch()
+            with self._lock:
+                if self._entries.get(prompt) is entry:
+                    del self._entries[prompt]
+            PREFETCH.inc(result="error")
+            return None
+        PREFETCH.inc(result="hit")
+        return response
+
+    def shutdown(self):
+        """Arrête le pool (les traitements en cours se terminent)"""
+        self._executor.shutdown(wait=True)
+
+
+_prefetchers: Dict[int, ResponsePrefetcher] = {}
+_prefetchers_lock = threading.Lock()
+
+
+def get_prefetcher(workflow) -> ResponsePrefetcher:
+    """Préchargeur unique du workflow (partagé par toutes les sessions du processus)"""
+    with _prefetchers_lock:
+        prefetcher = _prefetchers.get(id(workflow))
+        if prefetcher is None or prefetcher.workflow is not workflow:
+            prefetcher = _prefetchers[id(workflow)] = ResponsePrefetcher(workflow)
+        return prefetcher